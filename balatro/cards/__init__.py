@@ -1,4 +1,10 @@
-"""Card-related classes."""
+"""Card-related classes.
+
+Playing cards are imported eagerly; Jokers, consumables and the catalog
+load on first access, so dealing a hand does not import them.
+"""
+
+from importlib import import_module
 
 from .cards import (
     Card,
@@ -8,10 +14,28 @@ from .cards import (
     Edition,
     Seal,
 )
-from .jokers import Joker
-from .tarot_cards import TarotCard
-from .spectral_cards import SpectralCard
-from .planet_cards import PlanetCard
+
+_MODULES = {
+    "Joker": ".jokers",
+    "TarotCard": ".tarot_cards",
+    "SpectralCard": ".spectral_cards",
+    "PlanetCard": ".planet_cards",
+    "Catalog": ".catalog",
+}
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Card",
@@ -24,4 +48,5 @@ __all__ = [
     "TarotCard",
     "SpectralCard",
     "PlanetCard",
+    "Catalog",
 ]
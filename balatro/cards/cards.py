@@ -54,8 +54,62 @@ class Seal(Enum):
     BLUE = "Blue"
     PURPLE = "Purple"
 
+# Integer codes follow each enum's declaration order.
+RANKS = list(Rank)
+SUITS = list(Suit)
+ENHANCEMENTS = list(Enhancement)
+EDITIONS = list(Edition)
+SEALS = list(Seal)
+RANK_CODES = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_CODES = {suit: i for i, suit in enumerate(SUITS)}
+ENHANCEMENT_CODES = {enh: i for i, enh in enumerate(ENHANCEMENTS)}
+EDITION_CODES = {edition: i for i, edition in enumerate(EDITIONS)}
+SEAL_CODES = {seal: i for i, seal in enumerate(SEALS)}
+# Position of each suit code when sorting hands: alphabetical by name
+# (Clubs, Diamonds, Hearts, Spades), as sorting by ``Suit.value`` did.
+SUIT_SORT_ORDER = tuple(sorted(SUITS, key=lambda suit: suit.value).index(suit) for suit in SUITS)
+
+# Bit layout of ``Card.code``: rank (4 bits), suit (2), enhancement (3),
+# edition (3) and seal (3).  The low six bits identify rank and suit alone.
+SUIT_SHIFT = 4
+ENHANCEMENT_SHIFT = 6
+EDITION_SHIFT = 9
+SEAL_SHIFT = 12
+
+# Rank values (Two = 2 ... Ace = 14) and base chip values, by rank code.
+RANK_VALUES_BY_CODE = [code + 2 for code in range(len(RANKS))]
+CHIP_VALUES_BY_CODE = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11]
+
+SUIT_EMOJIS = {
+    Suit.HEARTS: "♥️",
+    Suit.DIAMONDS: "♦️",
+    Suit.CLUBS: "♣️",
+    Suit.SPADES: "♠️",
+}
+
+
 class Card:
-    """Represents a playing card with suit, rank, and optional modifiers."""
+    """Represents a playing card with suit, rank, and optional modifiers.
+
+    Besides the Enum attributes, each card caches integer fields used by the
+    hot scoring paths: ``code`` (every attribute packed into one integer),
+    ``rank_value`` (2-14), ``suit_code`` and ``chip_value``.  They are kept
+    in sync whenever one of the Enum attributes is reassigned, for example
+    by Tarot or Spectral effects.
+    """
+
+    __slots__ = (
+        "_suit",
+        "_rank",
+        "_enhancement",
+        "_edition",
+        "_seal",
+        "code",
+        "rank_value",
+        "suit_code",
+        "chip_value",
+    )
+
     def __init__(self, suit: Suit, rank: Rank, enhancement: Enhancement = Enhancement.NONE, edition: Edition = Edition.NONE, seal: Seal = Seal.NONE):
         """Initializes a Card object."
 
@@ -66,11 +120,97 @@ class Card:
             edition (Edition, optional): The edition applied to the card. Defaults to Edition.NONE.
             seal (Seal, optional): The seal applied to the card. Defaults to Seal.NONE.
         """
-        self.suit = suit
-        self.rank = rank
-        self.enhancement = enhancement
-        self.edition = edition
-        self.seal = seal
+        self._suit = suit
+        self._rank = rank
+        self._enhancement = enhancement
+        self._edition = edition
+        self._seal = seal
+        self._sync()
+
+    def _sync(self) -> None:
+        """Recompute the cached integer fields from the Enum attributes."""
+        rank_code = RANK_CODES[self._rank]
+        suit_code = SUIT_CODES[self._suit]
+        self.code = (
+            rank_code
+            | suit_code << SUIT_SHIFT
+            | ENHANCEMENT_CODES[self._enhancement] << ENHANCEMENT_SHIFT
+            | EDITION_CODES[self._edition] << EDITION_SHIFT
+            | SEAL_CODES[self._seal] << SEAL_SHIFT
+        )
+        self.rank_value = RANK_VALUES_BY_CODE[rank_code]
+        self.suit_code = suit_code
+        self.chip_value = CHIP_VALUES_BY_CODE[rank_code]
+
+    @property
+    def suit(self) -> Suit:
+        return self._suit
+
+    @suit.setter
+    def suit(self, value: Suit) -> None:
+        self._suit = value
+        self._sync()
+
+    @property
+    def rank(self) -> Rank:
+        return self._rank
+
+    @rank.setter
+    def rank(self, value: Rank) -> None:
+        self._rank = value
+        self._sync()
+
+    @property
+    def enhancement(self) -> Enhancement:
+        return self._enhancement
+
+    @enhancement.setter
+    def enhancement(self, value: Enhancement) -> None:
+        self._enhancement = value
+        self._sync()
+
+    @property
+    def edition(self) -> Edition:
+        return self._edition
+
+    @edition.setter
+    def edition(self, value: Edition) -> None:
+        self._edition = value
+        self._sync()
+
+    @property
+    def seal(self) -> Seal:
+        return self._seal
+
+    @seal.setter
+    def seal(self, value: Seal) -> None:
+        self._seal = value
+        self._sync()
+
+    @classmethod
+    def from_code(cls, code: int) -> "Card":
+        """Creates a Card object from a packed ``Card.code`` integer."""
+        return cls(
+            SUITS[code >> SUIT_SHIFT & 0b11],
+            RANKS[code & 0b1111],
+            ENHANCEMENTS[code >> ENHANCEMENT_SHIFT & 0b111],
+            EDITIONS[code >> EDITION_SHIFT & 0b111],
+            SEALS[code >> SEAL_SHIFT & 0b111],
+        )
+
+    def copy(self) -> "Card":
+        """Returns an independent copy of this card."""
+        clone = Card.__new__(Card)
+        clone._suit = self._suit
+        clone._rank = self._rank
+        clone._enhancement = self._enhancement
+        clone._edition = self._edition
+        clone._seal = self._seal
+        clone.code = self.code
+        clone.rank_value = self.rank_value
+        clone.suit_code = self.suit_code
+        clone.chip_value = self.chip_value
+        return clone
 
     def __repr__(self):
         """Returns a string representation of the Card object for debugging."""
@@ -85,14 +225,8 @@ class Card:
             modifiers.append(self.edition.value)
         if self.seal != Seal.NONE:
             modifiers.append(self.seal.value)
-        
-        suit_emojis = {
-            Suit.HEARTS: "♥️",
-            Suit.DIAMONDS: "♦️",
-            Suit.CLUBS: "♣️",
-            Suit.SPADES: "♠️",
-        }
-        card_str = f"{self.rank.value}{suit_emojis[self.suit]}"
+
+        card_str = f"{self.rank.value}{SUIT_EMOJIS[self.suit]}"
         if modifiers:
             return f"{card_str} ({', '.join(modifiers)})"
         return card_str
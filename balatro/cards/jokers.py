@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 
 from ..shop.stickers import Sticker
+from .catalog import Catalog
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - type hints only
@@ -13,7 +14,20 @@ if TYPE_CHECKING:  # pragma: no cover - type hints only
 
 
 class Joker:
-    """Base class for all Joker cards loaded from JSON."""
+    """Base class for all Joker cards loaded from JSON.
+
+    ``effect_type`` (``"+m"``, ``"+c"``, ``"Xm"``...) and ``activation``
+    (``"Indep."``, ``"On Scored"``, ``"On Held"``...) are the ``type`` and
+    ``activation`` fields of ``data/jokers.json``;
+    :mod:`balatro.core.joker_effects` compiles them into scoring hooks.
+    ``counter`` is what a Joker that grows has gained so far this run and
+    ``target`` the suit or card a Joker such as Castle picked this round.
+    """
+
+    effect_type = ""
+    activation = ""
+    counter = 0
+    target = 0
 
     def __init__(
         self,
@@ -36,6 +50,12 @@ class Joker:
         self.rounds_active = 0
         self.is_debuffed = False
 
+    @property
+    def extra_value(self) -> int:
+        """Sell value gained during the run: Egg's ``counter``."""
+
+        return self.counter if self.name == "Egg" else 0
+
     def applies_to(self, hand: "PokerHand") -> bool:
         """Return True if this Joker should apply to the given hand type."""
 
@@ -45,17 +65,25 @@ class Joker:
         """Apply chip modifications from this Joker."""
 
         if self.is_debuffed:
-            return 0
+            return chips
         return chips + self.chip_bonus
 
     def apply_mult(self, mult: int) -> int:
         """Apply multiplier modifications from this Joker."""
 
         if self.is_debuffed:
-            return 0
+            return mult
         new_mult = mult + self.mult_bonus
         return new_mult * self.mult_multiplier
 
+    def copy(self) -> "Joker":
+        """Return an independent copy sharing the immutable definition data."""
+
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.stickers = list(self.stickers)
+        return clone
+
     def to_dict(self) -> dict:
         """Serialize this Joker to a dict."""
 
@@ -67,9 +95,13 @@ class Joker:
             "mult_multiplier": self.mult_multiplier,
             "hand": self.trigger_hand.name if self.trigger_hand else None,
             "retrigger": self.retrigger,
+            "type": self.effect_type,
+            "activation": self.activation,
             "stickers": [s.to_dict() for s in self.stickers],
             "rounds_active": self.rounds_active,
             "is_debuffed": self.is_debuffed,
+            "counter": self.counter,
+            "target": self.target,
         }
 
     @classmethod
@@ -89,17 +121,28 @@ class Joker:
             trigger_hand=hand,
             retrigger=data.get("retrigger", 0),
         )
+        if "type" in data:
+            joker.effect_type = data["type"]
+            joker.activation = data.get("activation", "")
+        else:
+            # Saves from before effect types were kept: use the catalog's.
+            definition = JOKERS.ids.get(joker.name)
+            if definition is not None:
+                joker.effect_type = JOKERS.definitions[definition].effect_type
+                joker.activation = JOKERS.definitions[definition].activation
         joker.stickers = [Sticker.from_dict(s) for s in data.get("stickers", [])]
         joker.rounds_active = data.get("rounds_active", 0)
         joker.is_debuffed = data.get("is_debuffed", False)
+        joker.counter = data.get("counter", 0)
+        joker.target = data.get("target", 0)
         return joker
 
 
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
-def load_jokers() -> list[Joker]:
-    """Load Joker data from JSON configuration."""
+def _parse_jokers() -> list[Joker]:
+    """Parse the Joker definitions in ``data/jokers.json``."""
 
     from ..core.poker import PokerHand
 
@@ -136,11 +179,60 @@ def load_jokers() -> list[Joker]:
         except (ValueError, TypeError):
             joker.cost = 0
         joker.rarity = entry.get("rarity")
+        joker.effect_type = entry.get("type", "")
+        joker.activation = entry.get("activation", "")
         jokers.append(joker)
 
     return jokers
 
 
+RARITIES = ("common", "uncommon", "rare", "legendary")
+
+
+def _validate_joker(joker: Joker) -> None:
+    if (joker.rarity or "").lower() not in RARITIES:
+        raise ValueError(f"jokers.json: {joker.name} has rarity {joker.rarity!r}")
+
+
+JOKERS: Catalog[Joker] = Catalog("jokers", _parse_jokers, DATA_DIR / "jokers.json", _validate_joker)
+_RARITIES: dict[str, tuple[Joker, ...]] = {}
+_offered: tuple[Joker, ...] | None = None
+
+
+def load_jokers() -> list[Joker]:
+    """Fresh copies of every Joker, in data file order."""
+
+    return JOKERS.instances()
+
+
+def offered_jokers() -> tuple[Joker, ...]:
+    """Joker definitions that shops, packs and cards can create.
+
+    Jokers whose effects the engine does not model
+    (:data:`balatro.core.joker_effects.NOT_MODELLED`) would do nothing, so
+    they are never offered.
+    """
+
+    global _offered
+    if _offered is None:
+        from ..core.joker_effects import NOT_MODELLED
+
+        _offered = JOKERS.where(lambda j: j.name not in NOT_MODELLED)
+    return _offered
+
+
+def jokers_of_rarity(rarity: str) -> tuple[Joker, ...]:
+    """Offered Joker definitions of ``rarity`` (any case), for :meth:`Catalog.choice`."""
+
+    rarity = rarity.lower()
+    found = _RARITIES.get(rarity)
+    if found is None:
+        found = _RARITIES[rarity] = tuple(
+            j for j in offered_jokers() if (getattr(j, "rarity", "") or "").lower() == rarity
+        )
+    return found
+
+
 def joker_from_dict(data: dict) -> Joker:
     """Recreate a ``Joker`` instance from serialized data."""
 
@@ -2,6 +2,9 @@ import json
 import re
 from pathlib import Path
 
+from ..events import Notice
+from .catalog import Catalog
+
 
 class PlanetCard:
     def __init__(
@@ -34,11 +37,14 @@ class PlanetCard:
         try:
             hand_enum = PokerHand[self.poker_hand_type.upper().replace(" ", "_")]
         except KeyError:
-            print(f"Unknown hand type {self.poker_hand_type}.")
+            game.emit(Notice(self.name, f"Unknown hand type {self.poker_hand_type}."))
             return
         game.player.add_hand_bonus(hand_enum, self.chips_bonus, self.mult_bonus)
-        print(
-            f"{self.name} used: {self.poker_hand_type} gains +{self.chips_bonus} chips, +{self.mult_bonus} mult."
+        game.emit(
+            Notice(
+                self.name,
+                f"{self.name} used: {self.poker_hand_type} gains +{self.chips_bonus} chips, +{self.mult_bonus} mult.",
+            )
         )
 
     def to_dict(self):
@@ -65,8 +71,8 @@ class PlanetCard:
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
-def load_planet_cards():
-    """Load planet card data from JSON configuration."""
+def _parse_planet_cards():
+    """Parse the Planet definitions in ``data/planet_cards.json``."""
     with open(DATA_DIR / "planet_cards.json", encoding="utf-8") as f:
         raw = json.load(f)
 
@@ -90,6 +96,25 @@ def load_planet_cards():
     return cards
 
 
+def _validate_planet(card):
+    # Hands the engine does not evaluate (Flush House, Flush Five) are
+    # allowed; apply_effect reports them when the card is used.
+    if not card.poker_hand_type:
+        raise ValueError(f"planet_cards.json: {card.name} names no poker hand")
+    if card.chips_bonus <= 0 or card.mult_bonus <= 0:
+        raise ValueError(f"planet_cards.json: {card.name} has no bonus")
+
+
+PLANET_CARDS = Catalog(
+    "planet_cards", _parse_planet_cards, DATA_DIR / "planet_cards.json", _validate_planet
+)
+
+
+def load_planet_cards():
+    """Fresh copies of every Planet card, in data file order."""
+    return PLANET_CARDS.instances()
+
+
 def planet_card_from_dict(data):
     """Recreate a ``PlanetCard`` instance from serialized data."""
     return PlanetCard.from_dict(data)
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import json
-import random
 from pathlib import Path
 
 from .cards import Card, Suit, Edition, Seal, Rank, Enhancement
-from ..utils import get_user_input
-from ..cards.jokers import load_jokers, Joker
+from ..events import Notice
+from ..cards.catalog import Catalog
+from ..cards.jokers import JOKERS, jokers_of_rarity
 
 
 class SpectralCard:
@@ -36,40 +36,32 @@ class SpectralCard:
     def apply_effect(self, game, chosen: list[Card] | None = None) -> None:
         """Apply the spectral card's effect."""
 
-        player = game.player
+        rng = game.rng.consumables
         cards = chosen or []
-        if not cards and self.targets > 0:
-            print("--- Available Cards for Application ---")
-            for i, c in enumerate(player.hand):
-                print(f"[{i}] {c}")
-            print("---------------------------")
-            selection = get_user_input(
-                "Select target indices separated by space: "
-            ).strip()
-            if selection:
-                indices = [int(s) for s in selection.split()][: self.targets]
-                cards = [player.hand[i] for i in indices if 0 <= i < len(player.hand)]
+
+        def notify(text: str) -> None:
+            game.emit(Notice(self.name, text))
 
         def _add_random_edition(_, selected, __):
             if selected:
                 card = selected[0]
-                card.edition = random.choice(
+                card.edition = rng.choice(
                     [Edition.FOIL, Edition.HOLOGRAPHIC, Edition.POLYCHROME]
                 )
-                print(f"{card} gained {card.edition.value} edition.")
+                notify(f"{card} gained {card.edition.value} edition.")
 
         def _add_seal(_, selected, params):
             if selected:
                 card = selected[0]
                 seal = Seal[params.get("seal", "GOLD")]
                 card.seal = seal
-                print(f"{card} gained a {seal.value} Seal.")
+                notify(f"{card} gained a {seal.value} Seal.")
 
         def _convert_all_random_suit(game, _selected, __):
-            suit = random.choice(list(Suit))
+            suit = rng.choice(list(Suit))
             for c in game.player.hand:
                 c.suit = suit
-            print(f"All cards converted to {suit.value}.")
+            notify(f"All cards converted to {suit.value}.")
 
         def _copy_card(game, selected, params):
             if selected:
@@ -79,30 +71,33 @@ class SpectralCard:
                     game.player.hand.append(
                         Card(card.suit, card.rank, card.enhancement, card.edition, card.seal)
                     )
-                print(f"Created {copies} copies of selected card.")
+                notify(f"Created {copies} copies of selected card.")
 
         def _familiar(game, _selected, _params):
             if game.player.hand:
-                game.player.hand.pop(random.randrange(len(game.player.hand)))
+                card = game.player.hand.pop(rng.randrange(len(game.player.hand)))
+                game.deck.destroy([card])
             for _ in range(3):
-                suit = random.choice(list(Suit))
-                rank = random.choice([Rank.JACK, Rank.QUEEN, Rank.KING])
-                enh = random.choice([e for e in Enhancement if e != Enhancement.NONE])
+                suit = rng.choice(list(Suit))
+                rank = rng.choice([Rank.JACK, Rank.QUEEN, Rank.KING])
+                enh = rng.choice([e for e in Enhancement if e != Enhancement.NONE])
                 game.player.hand.append(Card(suit, rank, enh))
-            print("Familiar added 3 enhanced face cards.")
+            notify("Familiar added 3 enhanced face cards.")
 
         def _grim(game, _selected, _params):
             if game.player.hand:
-                game.player.hand.pop(random.randrange(len(game.player.hand)))
+                card = game.player.hand.pop(rng.randrange(len(game.player.hand)))
+                game.deck.destroy([card])
             for _ in range(2):
-                suit = random.choice(list(Suit))
-                enh = random.choice([e for e in Enhancement if e != Enhancement.NONE])
+                suit = rng.choice(list(Suit))
+                enh = rng.choice([e for e in Enhancement if e != Enhancement.NONE])
                 game.player.hand.append(Card(suit, Rank.ACE, enh))
-            print("Grim added 2 enhanced Aces.")
+            notify("Grim added 2 enhanced Aces.")
 
         def _incantation(game, _selected, _params):
             if game.player.hand:
-                game.player.hand.pop(random.randrange(len(game.player.hand)))
+                card = game.player.hand.pop(rng.randrange(len(game.player.hand)))
+                game.deck.destroy([card])
             numbers = [
                 Rank.TWO,
                 Rank.THREE,
@@ -115,82 +110,84 @@ class SpectralCard:
                 Rank.TEN,
             ]
             for _ in range(4):
-                suit = random.choice(list(Suit))
-                rank = random.choice(numbers)
-                enh = random.choice([e for e in Enhancement if e != Enhancement.NONE])
+                suit = rng.choice(list(Suit))
+                rank = rng.choice(numbers)
+                enh = rng.choice([e for e in Enhancement if e != Enhancement.NONE])
                 game.player.hand.append(Card(suit, rank, enh))
-            print("Incantation added 4 enhanced numbered cards.")
+            notify("Incantation added 4 enhanced numbered cards.")
 
         def _wraith(game, _selected, _params):
-            rares = [j for j in load_jokers() if getattr(j, "rarity", "").lower() == "rare"]
+            rares = jokers_of_rarity("rare")
             if rares:
-                joker = random.choice(rares)
+                joker = JOKERS.choice(rng, rares)
                 game.player.jokers.append(joker)
-                print(f"Gained rare Joker {joker.name}.")
+                notify(f"Gained rare Joker {joker.name}.")
             game.money = 0
-            print("Money reduced to $0.")
+            notify("Money reduced to $0.")
 
         def _ouija(game, _selected, _params):
-            rank = random.choice(list(Rank))
+            rank = rng.choice(list(Rank))
             for c in game.player.hand:
                 c.rank = rank
             game.player.hand_size = max(0, game.player.hand_size - 1)
-            print(f"All cards set to {rank.value}; hand size reduced to {game.player.hand_size}.")
+            notify(f"All cards set to {rank.value}; hand size reduced to {game.player.hand_size}.")
 
         def _ectoplasm(game, _selected, _params):
             if game.player.jokers:
-                joker = random.choice(game.player.jokers)
+                joker = rng.choice(game.player.jokers)
                 joker.edition = Edition.NEGATIVE
-                print(f"{joker.name} gained Negative edition.")
+                game.player.invalidate_jokers()
+                notify(f"{joker.name} gained Negative edition.")
             game.player.hand_size = max(0, game.player.hand_size - (game.ectoplasm_uses + 1))
             game.ectoplasm_uses += 1
-            print(f"Hand size reduced to {game.player.hand_size}.")
+            notify(f"Hand size reduced to {game.player.hand_size}.")
 
         def _immolate(game, _selected, _params):
             if not game.player.hand:
-                print("No cards to destroy.")
+                notify("No cards to destroy.")
                 return
             count = min(5, len(game.player.hand))
-            indices = random.sample(range(len(game.player.hand)), count)
+            indices = rng.sample(range(len(game.player.hand)), count)
             indices.sort(reverse=True)
             destroyed = [game.player.hand.pop(i) for i in indices]
+            game.deck.destroy(destroyed)
             game.money += 20
             destroyed_str = ", ".join(str(c) for c in destroyed)
-            print(f"Destroyed {count} cards ({destroyed_str}) and gained $20.")
+            notify(f"Destroyed {count} cards ({destroyed_str}) and gained $20.")
 
         def _ankh(game, _selected, _params):
             if not game.player.jokers:
-                print("No Jokers to copy.")
+                notify("No Jokers to copy.")
                 return
-            chosen = random.choice(game.player.jokers)
-            clone = Joker.from_dict(chosen.to_dict())
-            if clone.edition == Edition.NEGATIVE:
+            chosen = rng.choice(game.player.jokers)
+            clone = chosen.copy()
+            if getattr(clone, "edition", Edition.NONE) == Edition.NEGATIVE:
                 clone.edition = Edition.NONE
             game.player.jokers = [chosen, clone]
-            print(f"Ankh duplicated {chosen.name} and removed other Jokers.")
+            notify(f"Ankh duplicated {chosen.name} and removed other Jokers.")
 
         def _hex(game, _selected, _params):
             if not game.player.jokers:
-                print("No Jokers to affect.")
+                notify("No Jokers to affect.")
                 return
-            chosen = random.choice(game.player.jokers)
+            chosen = rng.choice(game.player.jokers)
             chosen.edition = Edition.POLYCHROME
             game.player.jokers = [chosen]
-            print(f"{chosen.name} became Polychrome; other Jokers destroyed.")
+            notify(f"{chosen.name} became Polychrome; other Jokers destroyed.")
 
         def _soul(game, _selected, _params):
-            legs = [j for j in load_jokers() if getattr(j, "rarity", "").lower() == "legendary"]
+            legs = jokers_of_rarity("legendary")
             if legs:
-                joker = random.choice(legs)
+                joker = JOKERS.choice(rng, legs)
                 game.player.jokers.append(joker)
-                print(f"Gained Legendary Joker {joker.name}.")
+                notify(f"Gained Legendary Joker {joker.name}.")
 
         def _black_hole(game, _selected, _params):
             from ..core.poker import PokerHand
 
             for hand in PokerHand:
                 game.player.add_hand_bonus(hand, 10, 1)
-            print("All poker hands upgraded.")
+            notify("All poker hands upgraded.")
 
         actions = {
             "add_random_edition": _add_random_edition,
@@ -212,9 +209,10 @@ class SpectralCard:
 
         func = actions.get(self.action) or actions.get(self.name.replace(" ", "_").lower())
         if func:
-            func(game, cards, self.params)
+            with game.deck.changing(cards):
+                func(game, cards, self.params)
         else:
-            print(f"{self.name} has no effect.")
+            notify(f"{self.name} has no effect.")
 
         game.last_used_card = self
 
@@ -244,8 +242,8 @@ class SpectralCard:
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
-def load_spectral_cards() -> list[SpectralCard]:
-    """Load spectral cards from the JSON data file."""
+def _parse_spectral_cards() -> list[SpectralCard]:
+    """Parse the Spectral definitions in ``data/spectral_cards.json``."""
 
     with open(DATA_DIR / "spectral_cards.json", encoding="utf-8") as f:
         raw = json.load(f)
@@ -270,6 +268,17 @@ def load_spectral_cards() -> list[SpectralCard]:
     return cards
 
 
+SPECTRAL_CARDS: Catalog[SpectralCard] = Catalog(
+    "spectral_cards", _parse_spectral_cards, DATA_DIR / "spectral_cards.json"
+)
+
+
+def load_spectral_cards() -> list[SpectralCard]:
+    """Fresh copies of every Spectral card, in data file order."""
+
+    return SPECTRAL_CARDS.instances()
+
+
 def spectral_card_from_dict(data: dict) -> SpectralCard:
     """Recreate a ``SpectralCard`` instance from serialized data."""
 
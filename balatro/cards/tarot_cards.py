@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import json
-import random
 from pathlib import Path
 
 from .cards import Card, Suit, Rank, Enhancement, Edition
-from ..cards.jokers import load_jokers
-from ..cards.planet_cards import load_planet_cards, PlanetCard
-from ..utils import get_user_input
+from ..cards.catalog import Catalog
+from ..cards.jokers import JOKERS, offered_jokers
+from ..cards.planet_cards import PLANET_CARDS, PlanetCard
+from ..events import Notice
 
 
 class TarotCard:
@@ -37,31 +37,23 @@ class TarotCard:
     def apply_effect(self, game, chosen: list[Card] | None = None) -> None:
         """Apply the tarot card's effect."""
 
-        player = game.player
+        rng = game.rng.consumables
         cards = chosen or []
-        if not cards and self.targets > 0:
-            print("--- Available Cards for Application ---")
-            for i, c in enumerate(player.hand):
-                print(f"[{i}] {c}")
-            print("---------------------------")
-            selection = get_user_input(
-                "Select target indices separated by space: "
-            ).strip()
-            if selection:
-                indices = [int(s) for s in selection.split()][: self.targets]
-                cards = [player.hand[i] for i in indices if 0 <= i < len(player.hand)]
+
+        def notify(text: str) -> None:
+            game.emit(Notice(self.name, text))
 
         def _apply_enhancement(_game, selected, params):
             enh = Enhancement[params.get("enhancement", "LUCKY")]
             for c in selected:
                 c.enhancement = enh
-            print(f"Applied {enh.value} to {len(selected)} card(s).")
+            notify(f"Applied {enh.value} to {len(selected)} card(s).")
 
         def _convert_suit(_game, selected, params):
             suit = Suit[params.get("suit", "HEARTS")]
             for c in selected:
                 c.suit = suit
-            print(f"Converted {len(selected)} card(s) to {suit.value}.")
+            notify(f"Converted {len(selected)} card(s) to {suit.value}.")
 
         def _increase_rank(_game, selected, params):
             order = [
@@ -82,13 +74,14 @@ class TarotCard:
             for c in selected:
                 idx = order.index(c.rank)
                 c.rank = order[(idx + 1) % len(order)]
-            print(f"Increased rank of {len(selected)} card(s).")
+            notify(f"Increased rank of {len(selected)} card(s).")
 
         def _destroy(game, selected, _params):
             for c in selected:
                 if c in game.player.hand:
                     game.player.hand.remove(c)
-            print(f"Destroyed {len(selected)} card(s).")
+                    game.deck.destroy([c])
+            notify(f"Destroyed {len(selected)} card(s).")
 
         def _transform(game, selected, _params):
             if len(selected) >= 2:
@@ -98,46 +91,47 @@ class TarotCard:
                 dst.enhancement = src.enhancement
                 dst.edition = src.edition
                 dst.seal = src.seal
-                print("Converted second card into a copy of the first card.")
+                notify("Converted second card into a copy of the first card.")
 
         def _double_money(game, _selected, _params):
             gain = min(game.player.money, 20)
             game.player.money += gain
-            print(f"Money is now ${game.player.money}.")
+            notify(f"Money is now ${game.player.money}.")
 
         def _add_planet_cards(game, _selected, params):
             count = int(params.get("count", 2))
-            new_cards = random.sample(load_planet_cards(), k=count)
+            new_cards = PLANET_CARDS.sample(rng, count)
             added = 0
             for c in new_cards:
                 if game.player.add_planet_card(c):
                     added += 1
-            print(f"Gained {added} Planet card(s).")
+            notify(f"Gained {added} Planet card(s).")
 
         def _add_tarot_cards(game, _selected, params):
             count = int(params.get("count", 2))
-            new_cards = random.sample(load_tarot_cards(), k=count)
+            new_cards = TAROT_CARDS.sample(rng, count)
             added = 0
             for c in new_cards:
                 if game.player.add_tarot_card(c):
                     added += 1
-            print(f"Gained {added} Tarot card(s).")
+            notify(f"Gained {added} Tarot card(s).")
 
         def _wheel_of_fortune(game, _selected, params):
             chance = float(params.get("chance", 0.25))
-            if game.player.jokers and random.random() < chance:
-                joker = random.choice(game.player.jokers)
-                joker.edition = random.choice(
+            if game.player.jokers and rng.random() < chance:
+                joker = rng.choice(game.player.jokers)
+                joker.edition = rng.choice(
                     [Edition.FOIL, Edition.HOLOGRAPHIC, Edition.POLYCHROME]
                 )
-                print(f"{joker.name} gained {joker.edition.value} edition.")
+                game.player.invalidate_jokers()
+                notify(f"{joker.name} gained {joker.edition.value} edition.")
             else:
-                print("Wheel of Fortune had no effect.")
+                notify("Wheel of Fortune had no effect.")
 
         def _add_random_joker(game, _selected, _params):
-            joker = random.choice(load_jokers())
+            joker = JOKERS.choice(rng, offered_jokers())
             game.player.jokers.append(joker)
-            print(f"Gained Joker {joker.name}.")
+            notify(f"Gained Joker {joker.name}.")
 
         def _copy_last(game, _selected, _params):
             last = game.last_used_card
@@ -146,23 +140,23 @@ class TarotCard:
                 if isinstance(last, TarotCard):
                     copy = TarotCard.from_dict(data)
                     if game.player.add_tarot_card(copy):
-                        print(f"Copied {last.name} into inventory.")
+                        notify(f"Copied {last.name} into inventory.")
                     else:
-                        print("No room to store copied card.")
+                        notify("No room to store copied card.")
                 else:
                     copy = PlanetCard.from_dict(data)
                     if game.player.add_planet_card(copy):
-                        print(f"Copied {last.name} into inventory.")
+                        notify(f"Copied {last.name} into inventory.")
                     else:
-                        print("No room to store copied card.")
+                        notify("No room to store copied card.")
             else:
-                print("The Fool had no effect.")
+                notify("The Fool had no effect.")
 
         def _temperance(game, _selected, _params):
             total = sum(max(getattr(j, "cost", 0) // 2, 0) for j in game.player.jokers)
             total = min(total, 50)
             game.player.money += total
-            print(f"Temperance grants ${total}. Current money: ${game.player.money}.")
+            notify(f"Temperance grants ${total}. Current money: ${game.player.money}.")
 
         actions = {
             "apply_enhancement": _apply_enhancement,
@@ -181,14 +175,15 @@ class TarotCard:
 
         func = actions.get(self.action)
         if func:
-            func(game, cards, self.params)
+            with game.deck.changing(cards):
+                func(game, cards, self.params)
         else:
             if self.name.startswith("The Fool"):
                 _copy_last(game, cards, self.params)
             elif self.name.startswith("Temperance"):
                 _temperance(game, cards, self.params)
             else:
-                print(f"{self.name} has no effect.")
+                notify(f"{self.name} has no effect.")
 
         game.last_used_card = self
 
@@ -218,8 +213,8 @@ class TarotCard:
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
-def load_tarot_cards() -> list[TarotCard]:
-    """Load tarot cards from the JSON data file."""
+def _parse_tarot_cards() -> list[TarotCard]:
+    """Parse the Tarot definitions in ``data/tarot_cards.json``."""
 
     with open(DATA_DIR / "tarot_cards.json", encoding="utf-8") as f:
         raw = json.load(f)
@@ -244,6 +239,17 @@ def load_tarot_cards() -> list[TarotCard]:
     return cards
 
 
+TAROT_CARDS: Catalog[TarotCard] = Catalog(
+    "tarot_cards", _parse_tarot_cards, DATA_DIR / "tarot_cards.json"
+)
+
+
+def load_tarot_cards() -> list[TarotCard]:
+    """Fresh copies of every Tarot card, in data file order."""
+
+    return TAROT_CARDS.instances()
+
+
 def tarot_card_from_dict(data: dict) -> TarotCard:
     """Recreate a ``TarotCard`` instance from serialized data."""
 
@@ -7,21 +7,133 @@ object-oriented CLI that manages user interaction.  The previous
 implementation relied on a collection of loose functions; converting it
 into a class keeps related behaviour together and makes it easier to
 extend or test in isolation.
+
+The game itself is headless: the CLI prints the events it emits and
+turns what the user types into :mod:`balatro.core.actions`.  Modules
+only some commands need (the advisor, the odds, recording and autosaves)
+are imported when those commands are first used, so the game starts
+without them.
 """
 
 from typing import Optional
 
-from .core.game import Game, save_game, load_game
-from .utils import get_user_input
+from .cards.cards import SUIT_SORT_ORDER
+from .core.actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    SellItem,
+    SortHand,
+    UseConsumable,
+)
+from .core.game import Game, Phase, save_game, load_game
+from .utils import calculate_sell_value, get_user_input
+
+# Save file used by the 'v' and 'l' commands for each save format.
+SAVE_FILES = {"json": "balatro_save.json", "binary": "balatro_save.bin"}
+
+# Shop prefixes for selling inventory items, e.g. ``j0`` sells Joker 0.
+SELL_PREFIXES = {"j": "joker", "t": "tarot", "s": "spectral", "p": "planet"}
 
 
 class BalatroCLI:
     """Simple command-line runner for Balatro."""
 
-    def __init__(self, deck_type: str = "Base") -> None:
-        self.game = Game(deck_type=deck_type)
-        print(f"You have chosen the {self.game.deck.name}!")
-        self.game.draw_hand()
+    def __init__(
+        self,
+        deck_type: str = "Base",
+        seed: int | str | None = None,
+        game: Game | None = None,
+        record: str | None = None,
+        save_format: str = "json",
+        autosave: str | None = None,
+        fsync_interval: float | None = 1.0,
+        compact_every: int = 1000,
+    ) -> None:
+        """Start a new game, or continue ``game`` (e.g. a replayed one).
+
+        ``record`` names a file that receives the seed and every action, to
+        be replayed with ``python main.py replay``.  ``save_format`` is
+        ``"json"`` or ``"binary"``.  ``autosave`` is the base path of an
+        autosave :class:`~balatro.core.journal.Journal`; a game found there
+        is recovered instead of starting a new one.
+        """
+        self.advisor = None
+        self.save_format = save_format
+        self.save_file = SAVE_FILES[save_format]
+        self.autosave = autosave
+        self.journal_options = {"fsync_interval": fsync_interval, "compact_every": compact_every}
+        if game is None and autosave:
+            from .core.journal import Journal
+
+            journal = Journal.recover(autosave, **self.journal_options)
+            if journal is not None:
+                game = journal.game
+                print(f"Recovered the autosave at {autosave} ({journal.recovered} actions replayed).")
+                if record:
+                    print("Not recording: a recovered game cannot be replayed from its seed.")
+                    record = None
+        if game is None:
+            game = Game(deck_type=deck_type, seed=seed)
+            print(f"You have chosen the {game.deck.name}! (seed {game.seed})")
+            game.draw_hand()
+        self.game = self._attach(game)
+        if record:
+            from .core.action_log import ActionLog
+
+            log = game.action_log or ActionLog(game.seed, game.deck_key)
+            log.open(record)
+            log.attach(game)
+            print(f"Recording actions to {record}")
+
+    # ------------------------------------------------------------------
+    # Engine plumbing
+    def _attach(self, game: Game) -> Game:
+        """Render ``game``'s events on the terminal."""
+        game.listeners.append(self._render)
+        return game
+
+    def _stop_recording(self, reason: str) -> None:
+        log = self.game.action_log
+        if log is not None:
+            log.close()
+            self.game.action_log = None
+            print(f"Stopped recording: {reason}")
+
+    def _start_autosave(self) -> None:
+        """Journal the current game once it waits for a play or discard."""
+        if self.autosave and self.game.journal is None and self.game.phase is Phase.PLAYING:
+            from .core.journal import Journal
+
+            Journal.start(self.autosave, self.game, **self.journal_options)
+
+    def _stop_autosave(self) -> None:
+        journal = self.game.journal
+        if journal is not None:
+            journal.close()
+
+    @staticmethod
+    def _render(event) -> None:
+        message = event.message
+        if message:
+            print(message)
+
+    @staticmethod
+    def _parse_indices(text: str) -> tuple[int, ...] | None:
+        try:
+            return tuple(int(idx) for idx in text.split())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _asks_to_apply(item) -> bool:
+        """Whether buying or picking ``item`` offers to apply it right away."""
+        from .cards.planet_cards import PlanetCard
+
+        return isinstance(item, PlanetCard) or getattr(item, "targets", None) == 0
 
     # ------------------------------------------------------------------
     # Helper methods
@@ -35,67 +147,225 @@ class BalatroCLI:
         print("  's': Use a Spectral card from your inventory.")
         print("  'o': Sort your hand by rank or suit.")
         print("  'c': View the remaining deck.")
+        print("  'b': Show the best plays for your hand.")
+        print("  'a': Ask the advisor what to play or discard next.")
+        print("  'odds': Odds of each hand after discarding the selected cards.")
         print("  'v': Save the current game.")
         print("  'l': Load a previously saved game.")
         print("  'q': Quit the game.")
         print("  Type 'exit' at any prompt to quit immediately.")
         print("--------------------")
 
+    def _print_best_plays(self) -> None:
+        """Display the highest-scoring plays available in the current hand."""
+        from .core.best_play import best_plays_for
+        from .core.scoring import play_distribution
+
+        plays = best_plays_for(self.game)
+        if not plays:
+            print("No cards in hand to play.")
+            return
+        needed = self.game.blind_manager.current.score_required - self.game.player.score
+        print("\n--- Best Plays ---")
+        for play in plays:
+            indices = " ".join(str(i) for i in play.indices)
+            cards = ", ".join(str(c) for c in play.cards)
+            line = f"  p {indices}: {play.hand_type.value} ({cards}) for {play.score} points"
+            dist = play_distribution(self.game, play.cards)
+            if dist is not None and len(dist.values) > 1:
+                line += (
+                    f" (Lucky: EV {dist.expected_value:.0f},"
+                    f" {dist.probability_at_least(needed):.0%} to clear)"
+                )
+            print(line)
+        print("--------------------")
+
+    def _print_advice(self) -> None:
+        """Display the advisor's pick for the next play or discard."""
+        if self.advisor is None:
+            from .core.advisor import PlayAdvisor
+
+            self.advisor = PlayAdvisor()
+        advice = self.advisor.advise(self.game)
+        if advice is None:
+            print("No cards in hand to play.")
+            return
+        verb = "d" if advice.discard else "p"
+        indices = " ".join(str(i) for i in advice.action.indices)
+        cards = ", ".join(str(c) for c in advice.cards)
+        print(
+            f"Advisor: {verb} {indices} ({cards}), {advice.probability:.0%} to clear the blind"
+            f" ({advice.simulations} of {advice.total} simulations)"
+        )
+
+    def _print_odds(self, card_indices: list[int]) -> None:
+        """Display the odds of each hand after discarding ``card_indices``."""
+        from .core.odds import discard_odds
+
+        odds = discard_odds(self.game, card_indices)
+        print(f"\n--- Odds after drawing {odds.draws} card(s) ---")
+        suit, best = max(odds.flush_by_suit.items(), key=lambda item: item[1])
+        print(f"  Flush: {odds.flush:.1%} (best suit {suit.value}: {best:.1%})")
+        print(f"  Straight: {odds.straight:.1%}")
+        for n, label in (
+            (2, "Pair"),
+            (3, "Three of a Kind"),
+            (4, "Four of a Kind"),
+            (5, "Five of a Kind"),
+        ):
+            print(f"  {label}: {odds.of_a_kind[n]:.1%}")
+        print("--------------------")
+
+    def _print_deck(self) -> None:
+        deck = self.game.deck
+        print("\n--- Remaining Deck ---")
+        # The draw pile is kept unordered, so list it in suit order.
+        remaining = sorted(
+            deck.cards, key=lambda c: SUIT_SORT_ORDER[c.suit_code] << 4 | c.rank_value
+        )
+        for i, card in enumerate(remaining):
+            print(f"[{i}] {card}")
+        print(
+            f"{len(deck.cards)} to draw, {len(deck.discard_pile)} in discard pile, "
+            f"{len(deck.destroyed)} destroyed"
+        )
+        print("--------------------")
+
+    def _print_shop(self) -> None:
+        player = self.game.player
+        print(f"--- Shop Items (Money: ${self.game.money}) ---")
+        for i, item in enumerate(self.game.shop.items):
+            desc = getattr(item, "description", "")
+            print(f"[{i}] {item.name} - Cost: ${item.cost} - {desc}")
+        for prefix, title, items in (
+            ("j", "Jokers", player.jokers),
+            ("t", "Tarot Cards", player.tarot_cards),
+            ("s", "Spectral Cards", player.spectral_cards),
+            ("p", "Planet Cards", player.planet_cards),
+        ):
+            if items:
+                print(f"--- Sell {title} ---")
+                for i, item in enumerate(items):
+                    print(f"[{prefix}{i}] {item.name} - Sell for ${calculate_sell_value(item)}")
+        print("[L] Leave shop")
+        print("------------------")
+
+    def _confirm_apply(self) -> bool:
+        return get_user_input("Apply this card now? (y/n): ").strip().lower() == "y"
+
+    # ------------------------------------------------------------------
+    # Prompts for each engine phase
+    def _shop_prompt(self) -> None:
+        self._print_shop()
+        choice = get_user_input(
+            "Select item to purchase or type 'leave' to continue: "
+        ).strip().lower()
+        if choice in ("", "leave", "l"):
+            self.game.step(LeaveShop())
+        elif choice[:1] in SELL_PREFIXES and choice[1:].isdigit():
+            self.game.step(SellItem(SELL_PREFIXES[choice[0]], int(choice[1:])))
+        elif choice.isdigit():
+            idx = int(choice)
+            items = self.game.shop.items
+            use = False
+            if idx < len(items) and self._asks_to_apply(items[idx]):
+                if self.game.money >= items[idx].cost:
+                    use = self._confirm_apply()
+            self.game.step(BuyItem(idx, use))
+        else:
+            print("Invalid selection.")
+
+    def _pack_prompt(self) -> None:
+        choice = get_user_input("Choose an item by index or press Enter to skip: ").strip()
+        if not choice:
+            self.game.step(OpenPackChoice(None))
+            return
+        if not choice.isdigit():
+            print("Invalid selection.")
+            return
+        from .cards.jokers import Joker
+
+        idx = int(choice)
+        options = self.game.pack.options
+        use = False
+        if idx < len(options) and not isinstance(options[idx], Joker):
+            # Targeted cards from a pack are applied to the pack's cards.
+            use = not self._asks_to_apply(options[idx]) or self._confirm_apply()
+        self.game.step(OpenPackChoice(idx, use))
+
+    def _target_prompt(self) -> None:
+        selection = get_user_input(
+            "Select target indices separated by space or press Enter to keep card: "
+        ).strip()
+        indices = self._parse_indices(selection)
+        if indices is None:
+            print("Invalid card selection.")
+            return
+        self.game.step(ChooseTargets(indices))
+
     def _handle_action(self, action: str, additional_input: Optional[str]) -> bool:
         """Handle a single user action.
 
         Returns ``True`` to continue the game loop or ``False`` to quit.
         """
-        card_indices: list[int] = []
-        selected_cards = []
+        card_indices: tuple[int, ...] = ()
         if additional_input:
-            try:
-                card_indices = [int(idx) for idx in additional_input.split()]
-            except ValueError:
+            card_indices = self._parse_indices(additional_input)
+            if card_indices is None:
                 print("Please provide valid card indices.")
-                card_indices = []
-            selected_cards = [
-                self.game.player.hand[i]
-                for i in card_indices
-                if 0 <= i < len(self.game.player.hand)
-            ]
+                card_indices = ()
 
         if action == "q":
             return False
         if action == "v":
-            save_game(self.game)
+            save_game(self.game, self.save_file, self.save_format)
+            print(f"Game saved to {self.save_file}")
         elif action == "l":
-            loaded_game = load_game()
-            if loaded_game:
-                self.game = loaded_game
+            try:
+                loaded_game = load_game(self.save_file)
+            except Exception as e:
+                print(f"Error loading game: {e}")
+            else:
+                if loaded_game:
+                    self._stop_recording("a loaded game cannot be replayed from its seed.")
+                    self._stop_autosave()
+                    self.game = self._attach(loaded_game)
+                    print(f"Game loaded from {self.save_file}")
+                else:
+                    print(f"No save file found at {self.save_file}")
         elif action == "h":
             self._print_help()
         elif action == "o":
-            self.game.change_sort_type()
-            self.game.sort_hand()
+            self.game.step(SortHand())
             print("Hand sorted.")
         elif action == "p":
-            if selected_cards:
-                self.game.play_hand(selected_cards)
+            if card_indices:
+                self.game.step(PlayCards(card_indices))
             else:
                 print("Did you list the cards you want to play after 'p'?")
         elif action == "d":
-            if selected_cards:
-                self.game.discard_cards(card_indices)
+            if card_indices:
+                self.game.step(DiscardCards(card_indices))
             else:
                 print("Did you list the cards you want to discard after 'd'?")
         elif action == "t":
             if additional_input and additional_input.strip().isdigit():
-                self.game.use_tarot_card(int(additional_input))
+                self.game.step(UseConsumable("tarot", int(additional_input)))
             else:
                 print("Provide the index of the Tarot card to use.")
         elif action == "s":
             if additional_input and additional_input.strip().isdigit():
-                self.game.use_spectral_card(int(additional_input))
+                self.game.step(UseConsumable("spectral", int(additional_input)))
             else:
                 print("Provide the index of the Spectral card to use.")
         elif action == "c":
-            self.game.show_deck()
+            self._print_deck()
+        elif action == "b":
+            self._print_best_plays()
+        elif action == "a":
+            self._print_advice()
+        elif action == "odds":
+            self._print_odds(card_indices)
         else:
             print("Invalid action or card indices. Please try again.")
         return True
@@ -104,21 +374,41 @@ class BalatroCLI:
     def run(self) -> Game:
         """Start the interactive command loop."""
         self._print_help()
+        try:
+            return self._loop()
+        finally:
+            self._stop_autosave()
+
+    def _loop(self) -> Game:
         while True:
             while not self.game.game_over:
+                self._start_autosave()
+                if self.game.phase is Phase.SHOP:
+                    self._shop_prompt()
+                    continue
+                if self.game.phase is Phase.PACK:
+                    self._pack_prompt()
+                    continue
+                if self.game.phase is Phase.TARGETING:
+                    self._target_prompt()
+                    continue
                 print(self.game)
                 user_input = get_user_input("Enter your action: ").strip().lower()
-                action = user_input[:1]
-                additional_input = user_input[1:]
+                if user_input.startswith("odds"):
+                    action, additional_input = "odds", user_input[4:]
+                else:
+                    action = user_input[:1]
+                    additional_input = user_input[1:]
                 if not self._handle_action(action, additional_input):
                     return self.game
             again = get_user_input("Play again? (y/n): ").strip().lower()
             if again == "y":
                 deck_type = self.game.deck_key
-                self.game = Game(deck_type=deck_type)
+                self._stop_recording("the log holds a single game.")
+                self._stop_autosave()
+                self.game = self._attach(Game(deck_type=deck_type))
                 print(f"You have chosen the {self.game.deck.name}!")
                 self.game.draw_hand()
-                self.game.game_over = False
                 self._print_help()
             else:
                 break
@@ -1,11 +1,53 @@
-"""Core game components."""
+"""Core game components.
+
+The names below are imported from their modules on first access, so
+importing one core module (say :mod:`balatro.core.rng`) does not load the
+whole engine.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    ".game": ("Game", "Phase", "SAVE_FORMATS", "save_game", "load_game"),
+    ".actions": (
+        "BuyItem",
+        "ChooseTargets",
+        "DiscardCards",
+        "LeaveShop",
+        "OpenPackChoice",
+        "PlayCards",
+        "SellItem",
+        "SortHand",
+        "UseConsumable",
+    ),
+    ".action_log": ("ActionLog", "decode_action", "encode_action"),
+    ".journal": ("Journal",),
+    ".player": ("Player",),
+    ".blinds": ("BlindManager", "SmallBlind", "BigBlind", "BossBlind"),
+    ".best_play": ("Play", "find_best_plays", "best_plays_for"),
+    ".scoring": ("ScoreDistribution", "score_distribution", "play_distribution"),
+    ".odds": ("DrawOdds", "draw_odds", "discard_odds"),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .game import Game, save_game, load_game
-from .player import Player
-from .blinds import BlindManager, SmallBlind, BigBlind, BossBlind
 
 __all__ = [
     "Game",
+    "Phase",
+    "SAVE_FORMATS",
     "save_game",
     "load_game",
     "Player",
@@ -13,4 +55,26 @@ __all__ = [
     "SmallBlind",
     "BigBlind",
     "BossBlind",
+    "Play",
+    "find_best_plays",
+    "best_plays_for",
+    "ScoreDistribution",
+    "score_distribution",
+    "play_distribution",
+    "DrawOdds",
+    "draw_odds",
+    "discard_odds",
+    "PlayCards",
+    "DiscardCards",
+    "UseConsumable",
+    "BuyItem",
+    "SellItem",
+    "OpenPackChoice",
+    "ChooseTargets",
+    "LeaveShop",
+    "SortHand",
+    "ActionLog",
+    "Journal",
+    "encode_action",
+    "decode_action",
 ]
@@ -0,0 +1,224 @@
+"""Seeded action logs for reproducing and replaying games.
+
+A game is fully determined by its deck, its seed and the actions passed
+to :meth:`~balatro.core.game.Game.step`, so an :class:`ActionLog` stores
+only those.  Attached to a game it records every action as it is taken;
+:meth:`ActionLog.replay` rebuilds the game headlessly from the seed.
+
+On disk a log is a text file: a JSON header line with the seed and deck,
+then one action per line.  The same actions only replay to the same game
+with the same rules and cards, so the header also carries the format
+version, bumped whenever the engine plays an action differently, and the
+CRC-32 of the catalog names (see
+:func:`~balatro.core.binary_save.catalog_checksum`); a log whose version
+or catalogs differ is refused.  A line is the action's code from
+:data:`ACTION_CODES` followed by its fields: integers as digits, index
+tuples comma-separated (``_`` when empty), booleans as ``y``/``n``,
+``None`` as ``-`` and strings as they are.  For example ``p 0,2,4`` plays
+three cards, ``b 3 n`` buys shop item 3 without using it and ``k - n``
+skips a booster pack.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, TextIO
+
+from .actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    SellItem,
+    SortHand,
+    UseConsumable,
+)
+from .game import Game
+
+FORMAT = "balatro-actions"
+# Version 2: Jokers that change hand size, hands, discards and hand rules
+# are modelled, so version 1 logs no longer replay to the same games.
+FORMAT_VERSION = 2
+
+ACTION_CODES = {
+    "p": PlayCards,
+    "d": DiscardCards,
+    "u": UseConsumable,
+    "b": BuyItem,
+    "s": SellItem,
+    "k": OpenPackChoice,
+    "c": ChooseTargets,
+    "l": LeaveShop,
+    "o": SortHand,
+}
+_CODES = {cls: code for code, cls in ACTION_CODES.items()}
+
+
+def _field_parser(annotation) -> Callable[[str], object]:
+    """Parser of one encoded field, chosen from the action's annotation."""
+
+    # NamedTuple keeps postponed annotations as ForwardRefs.
+    annotation = getattr(annotation, "__forward_arg__", annotation)
+    if annotation.startswith("tuple"):
+        def parse(text: str) -> object:
+            return () if text == "_" else tuple(int(i) for i in text.split(","))
+    elif annotation.startswith("int"):
+        parse = int
+    elif annotation.startswith("bool"):
+        def parse(text: str) -> object:
+            return text == "y"
+    else:
+        parse = str
+    if "None" not in annotation:
+        return parse
+    return lambda text: None if text == "-" else parse(text)
+
+
+_PARSERS = {
+    code: [_field_parser(cls.__annotations__[field]) for field in cls._fields]
+    for code, cls in ACTION_CODES.items()
+}
+
+
+def _encode_field(value) -> str:
+    if value is None:
+        return "-"
+    if value is True:
+        return "y"
+    if value is False:
+        return "n"
+    if isinstance(value, (tuple, list)):
+        return ",".join(map(str, value)) or "_"
+    return str(value)
+
+
+def encode_action(action) -> str:
+    """Return the one-line text form of ``action``."""
+
+    code = _CODES.get(type(action))
+    if code is None:
+        raise ValueError(f"Cannot encode action: {action!r}")
+    return " ".join([code, *map(_encode_field, action)])
+
+
+def decode_action(line: str):
+    """Parse a line written by :func:`encode_action`."""
+
+    code, *fields = line.split()
+    parsers = _PARSERS.get(code)
+    if parsers is None or len(fields) > len(parsers):
+        raise ValueError(f"Invalid action line: {line!r}")
+    return ACTION_CODES[code](*(parse(text) for parse, text in zip(parsers, fields)))
+
+
+class ActionLog:
+    """The seed, deck and actions of one game.
+
+    Attach the log to a freshly dealt game with :meth:`attach`; after
+    :meth:`open` every recorded action is also appended and flushed to a
+    file, so the log survives a crash of the session.
+    """
+
+    def __init__(
+        self, seed: int | str, deck_type: str = "Base", actions: list | None = None
+    ) -> None:
+        self.seed = seed
+        self.deck_type = deck_type
+        self.actions: list = [] if actions is None else actions
+        self._stream: TextIO | None = None
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __repr__(self) -> str:
+        return f"ActionLog(seed={self.seed!r}, deck={self.deck_type!r}, actions={len(self)})"
+
+    # ------------------------------------------------------------------
+    def record(self, action) -> None:
+        self.actions.append(action)
+        if self._stream is not None:
+            self._stream.write(encode_action(action) + "\n")
+            self._stream.flush()
+
+    def attach(self, game) -> None:
+        """Record every action ``game`` takes from now on."""
+
+        game.action_log = self
+
+    def _header(self) -> str:
+        from .binary_save import catalog_checksum
+
+        return json.dumps(
+            {
+                "format": FORMAT,
+                "version": FORMAT_VERSION,
+                "catalogs": catalog_checksum(),
+                "seed": self.seed,
+                "deck": self.deck_type,
+            }
+        )
+
+    def open(self, filename: str) -> None:
+        """Write the log so far to ``filename`` and keep appending to it."""
+
+        self.close()
+        self.save(filename)
+        self._stream = open(filename, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def save(self, filename: str) -> None:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self._header() + "\n")
+            for action in self.actions:
+                f.write(encode_action(action) + "\n")
+
+    @classmethod
+    def load(cls, filename: str) -> "ActionLog":
+        with open(filename, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("format") != FORMAT:
+                raise ValueError(f"{filename} is not an action log")
+            version = header.get("version", 0)
+            if version > FORMAT_VERSION:
+                raise ValueError(f"{filename} needs a newer action log version")
+            if version < FORMAT_VERSION:
+                raise ValueError(f"{filename} was recorded with older game rules")
+            from .binary_save import catalog_checksum
+
+            if header.get("catalogs") != catalog_checksum():
+                raise ValueError(f"{filename} was recorded with a different card catalog")
+            actions = [decode_action(line) for line in f if line.strip()]
+        return cls(header["seed"], header.get("deck", "Base"), actions)
+
+    # ------------------------------------------------------------------
+    def new_game(self) -> Game:
+        """The game as it was dealt, before the first action."""
+
+        game = Game(deck_type=self.deck_type, seed=self.seed)
+        game.show_breakdown = False
+        game.draw_hand()
+        return game
+
+    def replay(self, stop: int | None = None) -> Game:
+        """Replay the first ``stop`` actions (all by default) headlessly."""
+
+        game = self.new_game()
+        step = game.step
+        for action in self.actions[:stop]:
+            step(action)
+        return game
+
+
+__all__ = [
+    "ActionLog",
+    "ACTION_CODES",
+    "FORMAT_VERSION",
+    "decode_action",
+    "encode_action",
+]
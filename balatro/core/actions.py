@@ -0,0 +1,78 @@
+"""Typed actions accepted by :meth:`balatro.core.game.Game.step`.
+
+Indices refer to the lists the engine currently exposes: the player's
+hand, the shop's ``items``, an inventory, the open pack's options or the
+candidates of a pending target choice.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class PlayCards(NamedTuple):
+    """Play the hand cards at ``indices``."""
+
+    indices: tuple[int, ...]
+
+
+class DiscardCards(NamedTuple):
+    """Discard the hand cards at ``indices`` and draw replacements."""
+
+    indices: tuple[int, ...]
+
+
+class UseConsumable(NamedTuple):
+    """Use a Tarot, Spectral or Planet card from the inventory.
+
+    ``kind`` is ``"tarot"``, ``"spectral"`` or ``"planet"``.  When the card
+    needs targets and ``targets`` is ``None`` the engine asks for them with
+    a :class:`~balatro.events.TargetsRequested` event.
+    """
+
+    kind: str
+    index: int
+    targets: tuple[int, ...] | None = None
+
+
+class BuyItem(NamedTuple):
+    """Buy shop item ``index``.
+
+    Buying a booster pack opens it.  ``use`` applies a bought consumable
+    at once instead of storing it.
+    """
+
+    index: int
+    use: bool = False
+
+
+class SellItem(NamedTuple):
+    """Sell a ``"joker"``, ``"tarot"``, ``"spectral"`` or ``"planet"`` card."""
+
+    kind: str
+    index: int
+
+
+class OpenPackChoice(NamedTuple):
+    """Take option ``index`` from the open booster pack, or skip with ``None``.
+
+    ``use`` applies the card at once; targeted Tarot and Spectral cards
+    then ask for targets among the pack's cards.
+    """
+
+    index: int | None
+    use: bool = False
+
+
+class ChooseTargets(NamedTuple):
+    """Resolve a pending target choice; no indices keeps the card."""
+
+    indices: tuple[int, ...]
+
+
+class LeaveShop(NamedTuple):
+    """Leave the shop and start the next blind."""
+
+
+class SortHand(NamedTuple):
+    """Toggle the hand between rank and suit order."""
@@ -0,0 +1,343 @@
+"""Search-based advice on which cards to play or discard.
+
+:class:`PlayAdvisor` plans the rest of the current blind: the sequence of
+plays and discards over the player's remaining ``hands`` and ``discards``
+that most often reaches the blind's ``score_required``.  It runs Monte
+Carlo tree search over *determinizations*: every iteration shuffles the
+unseen cards (the draw pile, then the discard pile) into one possible
+draw order and plays it out, so the statistics at each node average over
+the draws the player cannot see yet.  Nodes are keyed by the cards an
+action uses rather than by hand positions, which keeps a node meaningful
+across determinizations that deal different hands (information-set MCTS).
+
+Each action is scored with :func:`~balatro.core.best_play.find_best_plays`,
+so Jokers, planet bonuses and Splash count but Lucky cards and random
+Joker effects are assumed not to trigger, and Joker effects that read the
+game state (money, discards left, the deck) or pay out are ignored.  Candidate
+actions are the best few plays and a handful of discards that keep a
+strong play or a flush draw; rollouts play greedily.
+
+The search runs for a time budget or a fixed number of iterations and
+keeps its tree between calls: when the game has moved on by the advised
+action, the matching subtree becomes the new root.
+"""
+
+from __future__ import annotations
+
+import time
+from math import log, sqrt
+from typing import NamedTuple
+
+from ..cards.cards import Card
+from .actions import DiscardCards, PlayCards
+from .best_play import find_best_plays
+from .poker import PokerHand
+from .rng import RngStream
+
+# Exploration constant of the UCB1 selection rule.
+EXPLORATION = 0.7
+
+# Weight of the score reached by a run that fails the blind, so that runs
+# which cannot clear it still prefer higher-scoring lines.
+TIE_BREAK = 0.01
+
+# Hand types that the rollout policy discards around, like the greedy bot.
+_WEAK = (PokerHand.HIGH_CARD, PokerHand.PAIR)
+
+# Candidate actions are cached per hand; the cache is dropped past this size.
+_CACHE_LIMIT = 50_000
+
+
+class Advice(NamedTuple):
+    """The advised action and what the search knows about it.
+
+    ``probability`` is the share of simulations through the action that
+    cleared the blind; ``simulations`` of ``total`` root simulations went
+    through it.
+    """
+
+    action: PlayCards | DiscardCards
+    cards: list[Card]
+    probability: float
+    simulations: int
+    total: int
+
+    @property
+    def discard(self) -> bool:
+        return isinstance(self.action, DiscardCards)
+
+
+class _Node:
+    __slots__ = ("children", "visits", "wins", "value", "available")
+
+    def __init__(self) -> None:
+        self.children: dict[tuple, _Node] = {}
+        self.visits = 0
+        self.wins = 0
+        self.value = 0.0
+        self.available = 0
+
+
+class PlayAdvisor:
+    """Monte Carlo tree search over the plays and discards left in a blind.
+
+    ``budget`` is the search time per call in seconds; ``iterations``,
+    when given, replaces it with a fixed number of simulations, which keeps
+    results reproducible for a given ``rng``.  ``plays`` is the number of
+    best plays considered in each hand.
+    """
+
+    def __init__(
+        self,
+        budget: float = 0.05,
+        iterations: int | None = None,
+        plays: int = 4,
+        seed: int | str | None = None,
+    ) -> None:
+        self.budget = budget
+        self.iterations = iterations
+        self.plays = plays
+        self.rng = RngStream(seed)
+        self._pipeline = None
+        self._bonuses: dict[str, dict[str, int]] = {}
+        self._hand_size = 0
+        self._root: _Node | None = None
+        self._state: tuple | None = None
+        self._context: tuple | None = None
+        self._expected: tuple | None = None
+        self._cache: dict[tuple, list] = {}
+
+    # ------------------------------------------------------------------
+    def advise(self, game, rng=None) -> Advice | None:
+        """Search from ``game``'s position and return the best action.
+
+        Returns ``None`` when the hand is empty or no hands are left.
+        """
+
+        player = game.player
+        if not player.hand or player.hands <= 0:
+            return None
+        rng = rng or self.rng
+        self._pipeline = player.joker_pipeline
+        self._bonuses = player.hand_bonuses
+        self._hand_size = player.hand_size
+        root = self._reuse(game)
+
+        deck = game.deck
+        unseen = list(deck.cards)
+        pile = list(deck.discard_pile)
+        hand = list(player.hand)
+        needed = game.blind_manager.current.score_required - player.score
+        hands, discards = player.hands, player.discards
+
+        iterate = self._iterate
+        if self.iterations is not None:
+            for _ in range(self.iterations):
+                iterate(root, hand, hands, discards, needed, unseen, pile, rng)
+        else:
+            deadline = time.perf_counter() + self.budget
+            while True:
+                for _ in range(2):
+                    iterate(root, hand, hands, discards, needed, unseen, pile, rng)
+                if time.perf_counter() >= deadline:
+                    break
+
+        options = self._candidates(hand, discards > 0)
+        key, cards, _, _ = max(
+            options,
+            key=lambda option: (
+                root.children[option[0]].visits if option[0] in root.children else -1,
+                self._mean(root.children.get(option[0])),
+            ),
+        )
+        child = root.children[key]
+        positions = {id(card): i for i, card in enumerate(player.hand)}
+        indices = tuple(sorted(positions[id(card)] for card in cards))
+        is_play = key[0]
+        action = PlayCards(indices) if is_play else DiscardCards(indices)
+        self._expected = (
+            self._state[:3],
+            hands - 1 if is_play else hands,
+            discards if is_play else discards - 1,
+            frozenset(key[1]),
+            child,
+        )
+        return Advice(
+            action,
+            list(cards),
+            child.wins / child.visits if child.visits else 0.0,
+            child.visits,
+            root.visits,
+        )
+
+    def reset(self) -> None:
+        """Forget the search tree and the cached candidate actions."""
+
+        self._root = self._state = self._context = self._expected = None
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    def _reuse(self, game) -> _Node:
+        """Return the root for ``game``: the previous tree, a subtree or a new node."""
+
+        player = game.player
+        context = (
+            id(self._pipeline),
+            tuple((name, b["chips"], b["mult"]) for name, b in self._bonuses.items()),
+            self._hand_size,
+        )
+        blind = (game.seed, game.ante, game.blind_manager.index)
+        hand_ids = frozenset(map(id, player.hand))
+        cards = frozenset((id(c), c.code) for c in player.hand)
+        state = (*blind, player.hands, player.discards, player.score, cards)
+        if context != self._context:
+            self._cache.clear()
+            self._context = context
+            self._root = self._expected = None
+
+        root = None
+        if self._root is not None and state == self._state:
+            root = self._root
+        elif self._expected is not None:
+            expected_blind, hands, discards, used, child = self._expected
+            if (
+                expected_blind == blind
+                and (hands, discards) == (player.hands, player.discards)
+                and used.isdisjoint(hand_ids)
+            ):
+                root = child
+        self._root = root or _Node()
+        self._state = state
+        self._expected = None
+        return self._root
+
+    @staticmethod
+    def _mean(node: _Node | None) -> float:
+        return node.value / node.visits if node and node.visits else 0.0
+
+    def _candidates(self, hand: list[Card], can_discard: bool) -> list[tuple]:
+        """``(key, cards, score, hand type)`` of the actions searched from ``hand``.
+
+        ``key`` is ``(is_play, card ids)``; ``score`` and ``hand type`` are
+        ``None`` for discards.  Plays come first, best first.
+        """
+
+        # Codes are part of the key: Tarot cards change cards in place.
+        cache_key = (frozenset((id(c), c.code) for c in hand), can_discard)
+        options = self._cache.get(cache_key)
+        if options is not None:
+            return options
+
+        plays = find_best_plays(hand, self._pipeline, self._bonuses, self.plays)
+        options = [
+            ((True, tuple(map(id, p.cards))), p.cards, p.score, p.hand_type) for p in plays
+        ]
+        if can_discard:
+            seen = set()
+            keeps = [p.cards for p in plays[:3]]
+            suits: dict[int, list[Card]] = {}
+            for card in hand:
+                suits.setdefault(card.suit_code, []).append(card)
+            flush = max(suits.values(), key=len)
+            if 3 <= len(flush) < 5:
+                keeps.append(flush)
+            for keep in keeps:
+                kept = set(map(id, keep))
+                rest = sorted(
+                    (c for c in hand if id(c) not in kept), key=lambda c: c.rank_value
+                )[:5]
+                ids = tuple(map(id, rest))
+                if rest and frozenset(ids) not in seen:
+                    seen.add(frozenset(ids))
+                    options.append(((False, ids), rest, None, None))
+
+        if len(self._cache) >= _CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[cache_key] = options
+        return options
+
+    def _iterate(
+        self,
+        root: _Node,
+        hand: list[Card],
+        hands: int,
+        discards: int,
+        needed: float,
+        unseen: list[Card],
+        pile: list[Card],
+        rng,
+    ) -> None:
+        """Run one determinized simulation from ``root`` and back it up."""
+
+        order = unseen[:]
+        rng.shuffle(order)
+        if pile:
+            rest = pile[:]
+            rng.shuffle(rest)
+            order += rest
+        pos = 0
+        size = self._hand_size
+        candidates = self._candidates
+        node: _Node | None = root
+        path = [root]
+        score = 0.0
+
+        while score < needed and hands > 0 and hand:
+            options = candidates(hand, discards > 0)
+            if node is not None:
+                # Every action legal in this determinization is available;
+                # the first one never simulated is expanded, otherwise UCB1.
+                children = node.children
+                chosen = None
+                for option in options:
+                    child = children.get(option[0])
+                    if child is None:
+                        child = children[option[0]] = _Node()
+                    child.available += 1
+                    if chosen is None and not child.visits:
+                        chosen = option
+                if chosen is None:
+                    best = -1.0
+                    for option in options:
+                        child = children[option[0]]
+                        ucb = child.value / child.visits + EXPLORATION * sqrt(
+                            log(child.available) / child.visits
+                        )
+                        if ucb > best:
+                            best, chosen = ucb, option
+                    node = children[chosen[0]]
+                else:
+                    node = None
+                path.append(children[chosen[0]])
+            else:
+                # Rollout: play the best hand, discarding around weak ones.
+                chosen = options[0]
+                if chosen[3] in _WEAK and discards and hands > 1 and len(options) > 1:
+                    for option in options:
+                        if not option[0][0]:
+                            chosen = option
+                            break
+
+            key, cards, gained, _ = chosen
+            used = set(key[1])
+            hand = [c for c in hand if id(c) not in used]
+            if key[0]:
+                score += gained
+                hands -= 1
+            else:
+                discards -= 1
+            need = size - len(hand)
+            if need > 0:
+                hand += order[pos : pos + need]
+                pos += need
+
+        cleared = score >= needed
+        value = 1.0 if cleared else TIE_BREAK * min(score / needed, 1.0)
+        for visited in path:
+            visited.visits += 1
+            visited.wins += cleared
+            visited.value += value
+
+
+
+__all__ = ["Advice", "PlayAdvisor", "EXPLORATION", "TIE_BREAK"]
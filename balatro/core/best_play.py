@@ -0,0 +1,326 @@
+"""Search for the highest-scoring plays available in a hand.
+
+The engine scores every distinct play that can be made from the current
+hand with the same rules as :func:`balatro.core.scoring.calculate_score`
+(Jokers, planet ``hand_bonuses`` and Splash included) but without touching
+game state.  Lucky cards and random Joker effects are assumed not to
+trigger, and Joker effects that read the game state need a
+:class:`~balatro.core.joker_effects.ScoreContext`.
+
+Without Splash only the cards forming the hand are scored, so a play that
+carries kickers scores exactly like the same play without them.  The search
+therefore only considers kicker-free plays: single cards, combinations of
+cards whose rank is repeated in hand, and five-card hands that use every
+card.  With Splash every subset of up to five cards is considered, and so
+it is when Jokers read the cards played or held (Half Joker, Blackboard)
+or pick the lowest held card (Raised Fist), since kickers change those.
+Jokers that only add to the held cards' score (Baron, Shoot the Moon)
+keep the kicker-free search: a kicker only takes a card out of the held
+cards without scoring it.  Once-per-hand Jokers that only read the game
+state (Banner, Bull, Blue Joker...) score every play alike.  With Four
+Fingers or Shortcut, which make Flushes and Straights out of other sets of
+cards, every subset is considered too.
+
+Unless a Joker fires on the first scoring card it matches or retriggers
+on a condition, each card's contribution, scored or held, is worked out
+once and plays are scored by adding them up.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations, product
+from typing import NamedTuple
+
+from ..cards.cards import Card
+from .poker import NO_RULES, PokerHand, _STRAIGHT_MASKS, hand_cache
+from .joker_effects import KEY_MASK, ScoreContext, hook_amounts
+from .joker_pipeline import JokerPipeline, _lineup_order
+from .scoring import HAND_SCORES, card_contribution, score_hand
+
+
+class Play(NamedTuple):
+    """A candidate play and the score it would make."""
+
+    indices: tuple[int, ...]
+    cards: list[Card]
+    hand_type: PokerHand
+    score: float
+    chips: float
+    mult: float
+
+
+def find_best_plays(
+    hand: list[Card],
+    jokers: list | JokerPipeline,
+    hand_bonuses: dict[str, dict[str, int]],
+    top: int = 5,
+    context: ScoreContext | None = None,
+) -> list[Play]:
+    """Return up to ``top`` distinct plays from ``hand``, best first.
+
+    ``jokers`` may be a list of Jokers or a compiled
+    :class:`~balatro.core.joker_pipeline.JokerPipeline`.  Without a
+    ``context`` Joker effects that read the game state are ignored.
+    ``indices`` refer to positions in ``hand`` so the result can be passed
+    straight to :meth:`balatro.core.game.Game.play_hand` or used to build a
+    CLI command.
+    """
+
+    pipeline = jokers if isinstance(jokers, JokerPipeline) else JokerPipeline(jokers)
+    values = [c.rank_value for c in hand]
+    suits = [c.suit_code for c in hand]
+    splash = pipeline.splash
+    hand_cache.rules = rules = pipeline.rules.hand_rules
+    custom_rules = rules != NO_RULES
+    stateful = context is not None and pipeline.needs_context
+    reads_hand = stateful and pipeline.reads_hand
+    held_contributions = (
+        [_held_contribution(c, pipeline) for c in hand] if pipeline.per_held else None
+    )
+    kickers = (
+        splash
+        or custom_rules
+        or reads_hand
+        or (
+            held_contributions is not None
+            and (pipeline.held_first or not all(map(_only_adds, held_contributions)))
+        )
+    )
+    positions = range(len(hand))
+    # (hand type, scored cards or whole play) -> (play, scored cards)
+    plays: dict[tuple[PokerHand, tuple[int, ...]], tuple[tuple[int, ...], tuple[int, ...]]] = {}
+
+    def consider(combo: tuple[int, ...]) -> None:
+        if custom_rules:
+            hand_type, used_cards = hand_cache.evaluate([hand[i] for i in combo])
+        else:
+            suit = suits[combo[0]]
+            is_flush = len(combo) == 5 and all(suits[i] == suit for i in combo)
+            hand_type, used_mask = hand_cache.classify([values[i] for i in combo], is_flush)
+        if splash:
+            plays.setdefault((hand_type, combo), (combo, combo))
+            return
+        if custom_rules:
+            in_use = {id(card) for card in used_cards}
+            used = tuple(i for i in combo if id(hand[i]) in in_use)
+        else:
+            used = tuple(i for i in combo if used_mask >> values[i] & 1)
+        if kickers:
+            plays.setdefault((hand_type, combo), (combo, used))
+        elif len(used) == len(combo):
+            plays.setdefault((hand_type, used), (combo, used))
+
+    if kickers:
+        # With Splash every played card scores and no card lowers the
+        # score, so a play is dominated when one more card of a new rank
+        # keeps its hand type.  That holds unless the extra card completes
+        # a Straight or Flush.  Jokers acting on the held or played cards
+        # break that.
+        prune = splash and not (pipeline.per_held or reads_hand or custom_rules)
+        for size in range(1, 6):
+            if prune and size < 5 and _all_extendable(size, values, suits):
+                continue
+            for combo in combinations(positions, size):
+                if prune and size < 5 and _extendable(combo, values, suits):
+                    continue
+                consider(combo)
+    else:
+        for i in positions:
+            plays.setdefault((PokerHand.HIGH_CARD, (i,)), ((i,), (i,)))
+
+        by_rank: dict[int, list[int]] = {}
+        by_suit: dict[int, list[int]] = {}
+        for i in positions:
+            by_rank.setdefault(values[i], []).append(i)
+            by_suit.setdefault(suits[i], []).append(i)
+
+        # Pairs, trips, quads, two pair, full house and five of a kind only
+        # ever use cards whose rank is repeated in hand.
+        repeated = [i for i in positions if len(by_rank[values[i]]) > 1]
+        for size in range(2, 6):
+            for combo in combinations(repeated, size):
+                consider(combo)
+        # Flushes need five cards of one suit.
+        for group in by_suit.values():
+            if len(group) >= 5:
+                for combo in combinations(group, 5):
+                    consider(combo)
+        # Straights need one card of each rank in a five-rank window.
+        rank_mask = sum(1 << v for v in by_rank)
+        for window in _STRAIGHT_MASKS:
+            if rank_mask & window == window:
+                groups = [by_rank[v] for v in range(15) if window >> v & 1]
+                for combo in product(*groups):
+                    consider(tuple(sorted(combo)))
+
+    results: list[Play] = []
+    held_first = pipeline.held_first
+    if (
+        pipeline.scored_first
+        or pipeline.retrigger_hooks
+        or any(hook.retrigger for hook in held_first)
+    ):
+        for (hand_type, _), (combo, scored) in plays.items():
+            played = [hand[i] for i in combo]
+            held = [card for i, card in enumerate(hand) if i not in combo]
+            if context is not None:
+                context.played = played
+            chips, mult, _ = score_hand(
+                hand_type,
+                [hand[i] for i in scored],
+                pipeline,
+                hand_bonuses,
+                held=held,
+                context=context if stateful else None,
+            )
+            results.append(Play(combo, played, hand_type, chips * mult, chips, mult))
+    else:
+        # Each card adds the same chips and mult steps to any play it is
+        # scored in, or held during, so those are worked out once.
+        contributions = [_contribution(c, pipeline) for c in hand]
+        # Held contributions of a card that also gets ``first`` hooks.
+        with_first: dict[tuple, tuple[float, tuple]] = {}
+        # Chips and mult of each hand type before any card.
+        starts: dict[PokerHand, tuple[int, int]] = {}
+        for (hand_type, _), (combo, scored) in plays.items():
+            start = starts.get(hand_type)
+            if start is None:
+                base = HAND_SCORES[hand_type]
+                bonus = hand_bonuses.get(hand_type.name) or {"chips": 0, "mult": 0}
+                start = starts[hand_type] = (
+                    base["chips"] + bonus["chips"],
+                    base["mult"] + bonus["mult"],
+                )
+            chips, mult = start
+            for i in scored:
+                card_chips, steps = contributions[i]
+                chips += card_chips
+                for added, factor in steps:
+                    mult = (mult + added) * factor
+            if held_contributions is not None:
+                held = [i for i in positions if i not in combo]
+                extra: dict[int, tuple] = {}
+                for hook in held_first:
+                    j = JokerPipeline._lowest(hook, [hand[i] for i in held])
+                    if j is not None:
+                        extra[held[j]] = extra.get(held[j], ()) + (hook,)
+                for i in held:
+                    if i in extra:
+                        key = (i, extra[i])
+                        if key not in with_first:
+                            with_first[key] = _held_contribution(hand[i], pipeline, extra[i])
+                        card_chips, steps = with_first[key]
+                    else:
+                        card_chips, steps = held_contributions[i]
+                    chips += card_chips
+                    for added, factor in steps:
+                        mult = (mult + added) * factor
+            played = [hand[i] for i in combo]
+            if stateful:
+                context.played = played
+                context.hand_type = hand_type
+                context.scoring = [hand[i] for i in scored]
+                if reads_hand:
+                    context.held = [card for i, card in enumerate(hand) if i not in combo]
+                chips, mult = pipeline.apply(hand_type, chips, mult, context=context)
+            else:
+                chips, mult = pipeline.apply(hand_type, chips, mult)
+            results.append(Play(combo, played, hand_type, chips * mult, chips, mult))
+
+    results.sort(key=lambda p: (-p.score, len(p.indices)))
+    return results[:top]
+
+
+def _contribution(card: Card, pipeline: JokerPipeline) -> tuple[float, tuple]:
+    """:func:`card_contribution` of ``card`` with its Jokers, over every trigger."""
+
+    chips, steps = card_contribution(card)
+    key = card.code & KEY_MASK
+    hooks = pipeline.scored[key]
+    if hooks:
+        steps = list(steps)
+        for hook in hooks:
+            amounts = hook_amounts(hook, card, None) if hook.chance >= 1 else None
+            if amounts is not None:
+                chips += amounts[0]
+                if amounts[1] or amounts[2] != 1:
+                    steps.append((amounts[1], amounts[2]))
+        steps = tuple(steps)
+    triggers = 1 + pipeline.scored_retriggers[key]
+    return chips * triggers, steps * triggers
+
+
+def _held_contribution(
+    card: Card, pipeline: JokerPipeline, first: tuple = ()
+) -> tuple[float, tuple]:
+    """Chips and mult steps the held-card Jokers add for ``card`` held, over every trigger.
+
+    ``first`` are the ``first`` hooks that pick ``card`` as the lowest held.
+    """
+
+    hooks = pipeline.held[card.code & KEY_MASK]
+    if first:
+        hooks = sorted(hooks + first, key=_lineup_order)
+    chips = 0
+    steps = []
+    for hook in hooks:
+        amounts = hook_amounts(hook, card, None) if hook.chance >= 1 else None
+        if amounts is not None:
+            chips += amounts[0]
+            if amounts[1] or amounts[2] != 1:
+                steps.append((amounts[1], amounts[2]))
+    if not steps and not chips:
+        return 0, ()
+    triggers = 1 + pipeline.held_retriggers[card.code & KEY_MASK]
+    return chips * triggers, tuple(steps) * triggers
+
+
+def _only_adds(contribution: tuple[float, tuple]) -> bool:
+    """Whether a card's contribution can only raise a score."""
+
+    chips, steps = contribution
+    return chips >= 0 and all(added >= 0 and factor >= 1 for added, factor in steps)
+
+
+def _all_extendable(size: int, values: list[int], suits: list[int]) -> bool:
+    """Return True if every play of ``size`` cards is :func:`_extendable`.
+
+    Fewer than four cards leave out a new rank unless they hold every rank
+    in hand.  Four cards hold at most four ranks; only two new ranks can
+    complete a Straight with them, and none a Flush unless five cards
+    share a suit.
+    """
+
+    ranks = len(set(values))
+    if size < 4:
+        return ranks > size
+    return ranks > 6 and max(map(suits.count, set(suits))) < 5
+
+
+def _extendable(combo: tuple[int, ...], values: list[int], suits: list[int]) -> bool:
+    """Return True if a card of a new rank can join ``combo`` keeping its type."""
+
+    ranks = 0
+    for i in combo:
+        ranks |= 1 << values[i]
+    for j in range(len(values)):
+        if ranks >> values[j] & 1:
+            continue
+        if len(combo) < 4:
+            return True
+        if (ranks | 1 << values[j]) in _STRAIGHT_MASKS:
+            continue
+        suit = suits[j]
+        if all(suits[i] == suit for i in combo):
+            continue
+        return True
+    return False
+
+
+def best_plays_for(game, top: int = 5) -> list[Play]:
+    """Convenience wrapper returning the best plays for ``game``'s hand."""
+
+    player = game.player
+    return find_best_plays(
+        player.hand, player.joker_pipeline, player.hand_bonuses, top, ScoreContext(game)
+    )
@@ -0,0 +1,346 @@
+"""Compact, versioned binary encoding of saved games.
+
+:func:`dumps` stores exactly the state that :meth:`Game.to_dict` does, in
+a fraction of the space: cards are their packed ``Card.code`` integers
+and catalog items (Jokers, vouchers and consumables) are ids into the
+data files instead of full dicts with description text.  :func:`loads`
+rebuilds the game from catalog prototypes, so it never reparses JSON or
+rebuilds cards from their enum values.
+
+Layout, little-endian throughout:
+
+* header: :data:`MAGIC`, format version (``B``) and the CRC-32 of the
+  catalog names (``I``), so a save is refused when the catalogs it was
+  written against have changed;
+* deck type and seed, as length-prefixed strings or a ``Q`` integer;
+* the state of every random stream (``Q`` each);
+* the scalar game and player state (:data:`_STATE`);
+* since version 2, round earnings, whether a voucher was bought this
+  ante and the last Tarot, Spectral or Planet card used (:data:`_EXTRA`),
+  which JSON saves drop but a snapshot must keep to replay actions;
+* planet bonuses, as hand index, chips and mult;
+* the draw pile, discard pile, destroyed cards and hand, each as a
+  ``H`` count followed by ``H`` card codes;
+* since version 3, how many times each hand type was played this run,
+  as a ``B`` count of hand index and ``I`` count pairs;
+* Jokers as catalog id, rounds active, debuffed flag, edition (since
+  version 2), counter and target (since version 3) and sticker types;
+* vouchers, Tarot, Spectral and Planet cards as catalog id and cost.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+
+from ..cards.catalog import clone
+from ..cards.cards import EDITIONS, Card, Edition
+from ..cards.jokers import JOKERS
+from ..cards.planet_cards import PLANET_CARDS, PlanetCard
+from ..cards.spectral_cards import SPECTRAL_CARDS, SpectralCard
+from ..cards.tarot_cards import TAROT_CARDS, TarotCard
+from ..shop.stickers import Sticker, StickerType
+from ..shop.vouchers import VOUCHERS
+from .game import Game
+from .poker import PokerHand
+from .rng import STREAMS
+
+MAGIC = b"BLSV"
+VERSION = 3
+
+_HEADER = struct.Struct("<4sBI")
+# round, ante, blind index, game over, Ectoplasm uses, money, hands,
+# discards, hand size before Jokers, score, sort by suit, consumable slots.
+_STATE = struct.Struct("<HHBBHihhhdBB")
+# Round earnings, voucher purchased, last used card (kind, catalog id).
+_EXTRA = struct.Struct("<iBBH")
+_BONUS = struct.Struct("<Bii")
+_PLAYED = struct.Struct("<BI")
+_JOKER = struct.Struct("<HHBBiBB")
+_JOKER_V2 = struct.Struct("<HHBBB")
+_JOKER_V1 = struct.Struct("<HHBB")
+_ITEM = struct.Struct("<HH")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U64 = struct.Struct("<Q")
+
+# Player inventories stored as catalog ids, with the catalog of each.
+_INVENTORIES = (
+    ("jokers", JOKERS),
+    ("vouchers", VOUCHERS),
+    ("tarot_cards", TAROT_CARDS),
+    ("spectral_cards", SPECTRAL_CARDS),
+    ("planet_cards", PLANET_CARDS),
+)
+# Catalogs that ``last_used_card`` can come from, by kind 1, 2 and 3.
+_LAST_USED = (
+    (TarotCard, "tarot_cards"),
+    (SpectralCard, "spectral_cards"),
+    (PlanetCard, "planet_cards"),
+)
+_EDITION_IDS = {edition: i for i, edition in enumerate(EDITIONS)}
+_HANDS = list(PokerHand)
+_HAND_IDS = {hand.name: i for i, hand in enumerate(_HANDS)}
+_STICKERS = list(StickerType)
+_STICKER_IDS = {sticker: i for i, sticker in enumerate(_STICKERS)}
+
+# Catalog definitions and name -> id maps by inventory, loaded on first use.
+_catalogs: dict[str, tuple[tuple, dict[str, int]]] = {}
+_checksum = 0
+# One prototype Card per code; loaded cards are copies of them.
+_card_prototypes: dict[int, Card] = {}
+
+
+def _catalog(attr: str) -> tuple[tuple, dict[str, int]]:
+    global _checksum
+    if not _catalogs:
+        names = []
+        for name, catalog in _INVENTORIES:
+            _catalogs[name] = (catalog.definitions, catalog.ids)
+            names.extend(catalog.ids)
+        _checksum = zlib.crc32("\n".join(names).encode())
+    return _catalogs[attr]
+
+
+def catalog_checksum() -> int:
+    """CRC-32 of the catalog names, which saves and action logs are written against."""
+
+    _catalog("jokers")
+    return _checksum
+
+
+def _codes(cards: list[Card]) -> bytes:
+    codes = array("H", [card.code for card in cards])
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return _U16.pack(len(codes)) + codes.tobytes()
+
+
+def _string(text: str) -> bytes:
+    data = text.encode()
+    return _U8.pack(len(data)) + data
+
+
+def dumps(game: Game) -> bytes:
+    """Encode ``game`` in the binary save format."""
+
+    player = game.player
+    parts = [_HEADER.pack(MAGIC, VERSION, catalog_checksum()), _string(game.deck_key)]
+
+    seed = game.seed
+    if isinstance(seed, int) and 0 <= seed < 1 << 64:
+        parts += [b"\x00", _U64.pack(seed)]
+    else:
+        parts += [b"\x01" if isinstance(seed, int) else b"\x02", _string(str(seed))]
+    parts.append(b"".join(_U64.pack(getattr(game.rng, name).getstate()) for name in STREAMS))
+
+    parts.append(
+        _STATE.pack(
+            game.round,
+            game.ante,
+            game.blind_manager.index,
+            game.game_over,
+            game.ectoplasm_uses,
+            player.money,
+            player.hands,
+            player.discards,
+            player.base_hand_size,
+            player.score,
+            player.sort_by == "suit",
+            player.consumable_slots,
+        )
+    )
+    last_kind, last_id = 0, 0
+    last = game.last_used_card
+    if last is not None:
+        for kind, (cls, attr) in enumerate(_LAST_USED, 1):
+            if isinstance(last, cls) and last.name in _catalog(attr)[1]:
+                last_kind, last_id = kind, _catalog(attr)[1][last.name]
+                break
+    parts.append(_EXTRA.pack(game.round_earnings, game.voucher_purchased, last_kind, last_id))
+    parts.append(_U8.pack(len(player.hand_bonuses)))
+    for name, bonus in player.hand_bonuses.items():
+        parts.append(_BONUS.pack(_HAND_IDS[name], bonus["chips"], bonus["mult"]))
+    parts.append(_U8.pack(len(player.hands_played)))
+    for name, count in player.hands_played.items():
+        parts.append(_PLAYED.pack(_HAND_IDS[name], count))
+
+    deck = game.deck
+    for cards in (deck.cards, deck.discard_pile, deck.destroyed, player.hand):
+        parts.append(_codes(cards))
+
+    for attr, _ in _INVENTORIES:
+        items = getattr(player, attr)
+        ids = _catalog(attr)[1]
+        parts.append(_U8.pack(len(items)))
+        for item in items:
+            try:
+                item_id = ids[item.name]
+            except KeyError:
+                raise ValueError(f"{item.name} is not in the card catalog") from None
+            if attr == "jokers":
+                stickers = bytes(_STICKER_IDS[s.sticker_type] for s in item.stickers)
+                edition = _EDITION_IDS[getattr(item, "edition", Edition.NONE)]
+                parts.append(
+                    _JOKER.pack(
+                        item_id,
+                        item.rounds_active,
+                        item.is_debuffed,
+                        edition,
+                        item.counter,
+                        item.target,
+                        len(stickers),
+                    )
+                )
+                parts.append(stickers)
+            else:
+                parts.append(_ITEM.pack(item_id, item.cost))
+    return b"".join(parts)
+
+
+def _cards(data: memoryview, offset: int) -> tuple[list[Card], int]:
+    (count,) = _U16.unpack_from(data, offset)
+    offset += 2
+    codes = array("H")
+    codes.frombytes(data[offset : offset + 2 * count])
+    if sys.byteorder == "big":
+        codes.byteswap()
+    cards = []
+    prototypes = _card_prototypes
+    for code in codes:
+        card = prototypes.get(code)
+        if card is None:
+            card = prototypes[code] = Card.from_code(code)
+        cards.append(card.copy())
+    return cards, offset + 2 * count
+
+
+def _read_string(data: memoryview, offset: int) -> tuple[str, int]:
+    size = data[offset]
+    return bytes(data[offset + 1 : offset + 1 + size]).decode(), offset + 1 + size
+
+
+def loads(data: bytes) -> Game:
+    """Rebuild a game from bytes written by :func:`dumps`."""
+
+    data = memoryview(data)
+    magic, version, checksum = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a binary save file.")
+    if version > VERSION:
+        raise ValueError(f"Save format version {version} is newer than this game.")
+    if checksum != catalog_checksum():
+        raise ValueError("The save was written with a different card catalog.")
+    offset = _HEADER.size
+
+    deck_type, offset = _read_string(data, offset)
+    kind = data[offset]
+    offset += 1
+    if kind == 0:
+        (seed,) = _U64.unpack_from(data, offset)
+        offset += 8
+    else:
+        seed, offset = _read_string(data, offset)
+        if kind == 1:
+            seed = int(seed)
+    game = Game(deck_type=deck_type, seed=seed)
+    for name in STREAMS:
+        getattr(game.rng, name).setstate(_U64.unpack_from(data, offset)[0])
+        offset += 8
+
+    player = game.player
+    (
+        game.round,
+        game.ante,
+        game.blind_manager.index,
+        game_over,
+        game.ectoplasm_uses,
+        player.money,
+        player.hands,
+        player.discards,
+        player.base_hand_size,
+        score,
+        by_suit,
+        player.consumable_slots,
+    ) = _STATE.unpack_from(data, offset)
+    offset += _STATE.size
+    game.game_over = bool(game_over)
+    player.score = int(score) if score.is_integer() else score
+    player.sort_by = "suit" if by_suit else "rank"
+    if version >= 2:
+        earnings, voucher, last_kind, last_id = _EXTRA.unpack_from(data, offset)
+        offset += _EXTRA.size
+        game.round_earnings = earnings
+        game.voucher_purchased = bool(voucher)
+        if last_kind:
+            game.last_used_card = clone(_catalog(_LAST_USED[last_kind - 1][1])[0][last_id])
+
+    bonuses = {}
+    for _ in range(data[offset]):
+        hand, chips, mult = _BONUS.unpack_from(data, offset + 1)
+        bonuses[_HANDS[hand].name] = {"chips": chips, "mult": mult}
+        offset += _BONUS.size
+    offset += 1
+    player.hand_bonuses = bonuses
+    if version >= 3:
+        played = {}
+        for _ in range(data[offset]):
+            hand, count = _PLAYED.unpack_from(data, offset + 1)
+            played[_HANDS[hand].name] = count
+            offset += _PLAYED.size
+        offset += 1
+        player.hands_played = played
+
+    deck = game.deck
+    draw, offset = _cards(data, offset)
+    deck.cards = draw
+    deck.discard_pile, offset = _cards(data, offset)
+    deck.destroyed, offset = _cards(data, offset)
+    player.hand, offset = _cards(data, offset)
+
+    for attr, _ in _INVENTORIES:
+        prototypes = _catalog(attr)[0]
+        count = data[offset]
+        offset += 1
+        items = []
+        for _ in range(count):
+            if attr == "jokers":
+                counter = target = 0
+                if version >= 3:
+                    item_id, rounds, debuffed, edition, counter, target, stickers = (
+                        _JOKER.unpack_from(data, offset)
+                    )
+                    offset += _JOKER.size
+                elif version == 2:
+                    item_id, rounds, debuffed, edition, stickers = _JOKER_V2.unpack_from(data, offset)
+                    offset += _JOKER_V2.size
+                else:
+                    item_id, rounds, debuffed, stickers = _JOKER_V1.unpack_from(data, offset)
+                    offset += _JOKER_V1.size
+                    edition = 0
+                joker = clone(prototypes[item_id])
+                if edition:
+                    joker.edition = EDITIONS[edition]
+                joker.rounds_active = rounds
+                joker.is_debuffed = bool(debuffed)
+                if counter or target:
+                    joker.counter = counter
+                    joker.target = target
+                joker.stickers = [
+                    Sticker(_STICKERS[i]) for i in data[offset : offset + stickers]
+                ]
+                offset += stickers
+                items.append(joker)
+            else:
+                item_id, cost = _ITEM.unpack_from(data, offset)
+                offset += _ITEM.size
+                item = clone(prototypes[item_id])
+                item.cost = cost
+                items.append(item)
+        setattr(player, attr, items)
+    return game
+
+
+__all__ = ["MAGIC", "VERSION", "catalog_checksum", "dumps", "loads"]
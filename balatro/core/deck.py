@@ -1,70 +1,212 @@
 """This module defines the BaseDeck class and its subclasses for different deck types."""
 
+from __future__ import annotations
+
 import random
-from ..cards.cards import Card, Suit, Rank
+from contextlib import contextmanager
+
+from ..cards.cards import (
+    ENHANCEMENT_SHIFT,
+    ENHANCEMENTS,
+    RANKS,
+    SUITS,
+    Card,
+    Enhancement,
+    Rank,
+    Suit,
+)
+
+# The 52 standard cards; new decks copy them rather than building each card.
+_STANDARD_CARDS = [Card(suit, rank) for suit in Suit for rank in Rank]
+
 
 class BaseDeck:
-    """Represents a standard deck of playing cards."""
-    def __init__(self):
-        """Initializes a BaseDeck with 52 standard playing cards."""
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+    """Represents a standard deck of playing cards.
+
+    Cards live in three zones: the draw pile (``cards``), the
+    ``discard_pile`` that played and discarded cards go to, and the
+    ``destroyed`` zone for cards removed from the run.  Each draw takes a
+    uniformly random card from the draw pile (an incremental Fisher-Yates
+    shuffle), so the pile never has to be shuffled as a whole: returning
+    cards, drawing them and moving the discard pile back with
+    :meth:`reshuffle` all cost O(1) per card however large the deck grows.
+    """
+    def __init__(self, rng: random.Random | None = None):
+        """Initializes a BaseDeck with 52 standard playing cards.
+
+        Args:
+            rng (random.Random, optional): Random stream used for drawing.
+                Defaults to the global ``random`` module.
+        """
+        self.rng = rng if rng is not None else random
+        self.cards = [card.copy() for card in _STANDARD_CARDS]
+        self.discard_pile: list[Card] = []
+        self.destroyed: list[Card] = []
         self.name = "Base Deck"
         self.description = "A standard 52-card deck."
 
     def __repr__(self):
         """Returns a string representation of the Deck object for debugging."""
-        return f"Deck(name='{self.name}', cards={len(self.cards)})"
+        return (
+            f"Deck(name='{self.name}', cards={len(self.cards)}, "
+            f"discarded={len(self.discard_pile)}, destroyed={len(self.destroyed)})"
+        )
+
+    @property
+    def cards(self) -> list[Card]:
+        """The draw pile."""
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self._cards = cards
+        self._pile_ids: set[int] = {id(card) for card in cards}
+        self.rank_counts = ranks = [0] * len(RANKS)
+        self.suit_counts = suits = [0] * len(SUITS)
+        self.enhancement_counts = enhancements = [0] * len(ENHANCEMENTS)
+        # Same counts as _count(card, 1), inlined for whole-deck loads.
+        for card in cards:
+            code = card.code
+            ranks[code & 0b1111] += 1
+            suits[card.suit_code] += 1
+            enhancements[code >> ENHANCEMENT_SHIFT & 0b111] += 1
+
+    def _count(self, card: Card, delta: int) -> None:
+        code = card.code
+        self.rank_counts[code & 0b1111] += delta
+        self.suit_counts[card.suit_code] += delta
+        self.enhancement_counts[code >> ENHANCEMENT_SHIFT & 0b111] += delta
+        if delta > 0:
+            self._pile_ids.add(id(card))
+        else:
+            self._pile_ids.discard(id(card))
+
+    @contextmanager
+    def changing(self, cards: list[Card]):
+        """Keep the counts right while ``cards`` are modified in place.
+
+        Only cards that are in the draw pile are recounted.
+        """
+        tracked = [card for card in cards if id(card) in self._pile_ids]
+        for card in tracked:
+            self._count(card, -1)
+        try:
+            yield
+        finally:
+            for card in tracked:
+                self._count(card, 1)
+
+    def clone(self, rng, copy_card=None) -> "BaseDeck":
+        """Return a copy of the deck drawing from ``rng``.
+
+        The zone lists are always copied.  ``copy_card`` maps each card to
+        its copy; without it the copy shares the Card objects themselves.
+        """
+        deck = object.__new__(type(self))
+        deck.__dict__.update(self.__dict__)
+        deck.rng = rng
+        if copy_card is None:
+            deck._cards = self._cards[:]
+            deck.discard_pile = self.discard_pile[:]
+            deck.destroyed = self.destroyed[:]
+            deck._pile_ids = set(self._pile_ids)
+        else:
+            deck._cards = [copy_card(c) for c in self._cards]
+            deck.discard_pile = [copy_card(c) for c in self.discard_pile]
+            deck.destroyed = [copy_card(c) for c in self.destroyed]
+            deck._pile_ids = {id(c) for c in deck._cards}
+        deck.rank_counts = self.rank_counts[:]
+        deck.suit_counts = self.suit_counts[:]
+        deck.enhancement_counts = self.enhancement_counts[:]
+        return deck
+
+    def composition(self) -> tuple[dict[Rank, int], dict[Suit, int], dict[Enhancement, int]]:
+        """Return the draw pile's rank, suit and enhancement counts by enum."""
+        return (
+            dict(zip(RANKS, self.rank_counts)),
+            dict(zip(SUITS, self.suit_counts)),
+            dict(zip(ENHANCEMENTS, self.enhancement_counts)),
+        )
 
     def shuffle(self):
-        """Shuffles the cards in the deck randomly."""
-        random.shuffle(self.cards)
+        """Shuffles the draw pile randomly."""
+        self.rng.shuffle(self.cards)
+
+    def reshuffle(self):
+        """Moves the discard pile back into the draw pile.
+
+        Called at round boundaries and when the draw pile runs out.  Draws
+        are random, so no shuffle is needed.
+        """
+        if self.discard_pile:
+            for card in self.discard_pile:
+                self._count(card, 1)
+            self._cards.extend(self.discard_pile)
+            self.discard_pile.clear()
 
     def draw(self, num_cards: int = 1):
-        """Draws a specified number of cards from the top of the deck."
+        """Draws a specified number of random cards from the draw pile.
+
+        When the draw pile runs out, the discard pile is shuffled back in
+        and drawing continues from it.
 
         Args:
             num_cards (int, optional): The number of cards to draw. Defaults to 1.
 
         Returns:
-            list[Card]: A list of drawn Card objects.
+            list[Card]: A list of drawn Card objects, fewer than requested
+            only if the draw and discard piles together run out.
         """
-        if num_cards > len(self.cards):
-            # In a real game, you might handle this differently
-            # (e.g., reshuffle discard pile), but for now, we'll just return what's left.
-            drawn_cards = self.cards[:]
-            self.cards = []
-            return drawn_cards
-
-        drawn_cards = [self.cards.pop() for _ in range(num_cards)]
-        return drawn_cards
+        cards = self._cards
+        rand = self.rng.random
+        count = self._count
+        drawn = []
+        for _ in range(num_cards):
+            size = len(cards)
+            if not size:
+                if not self.discard_pile:
+                    break
+                self.reshuffle()
+                size = len(cards)
+            # Swap a random card to the end so it can be popped in O(1).
+            j = int(rand() * size)
+            cards[j], cards[-1] = cards[-1], cards[j]
+            card = cards.pop()
+            count(card, -1)
+            drawn.append(card)
+        return drawn
 
     def return_cards(self, cards: list[Card]) -> None:
-        """Return cards to the deck and reshuffle."""
-        if not cards:
-            return
-        self.cards.extend(cards)
-        self.shuffle()
+        """Put played or discarded cards on the discard pile.
+
+        The draw pile counts are unchanged until :meth:`reshuffle`.
+        """
+        self.discard_pile.extend(cards)
+
+    def destroy(self, cards: list[Card]) -> None:
+        """Move cards that were removed from play into the destroyed zone."""
+        self.destroyed.extend(cards)
 
 class RedDeck(BaseDeck):
     """Represents the Red Deck, which provides an extra discard every round."""
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         """Initializes a RedDeck."""
-        super().__init__()
+        super().__init__(rng)
         self.name = "Red Deck"
         self.description = "+1 discard every round."
 
 class GreenDeck(BaseDeck):
     """Represents the Green Deck, which provides money per remaining hand/discard but no interest."""
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         """Initializes a GreenDeck."""
-        super().__init__()
+        super().__init__(rng)
         self.name = "Green Deck"
         self.description = "At end of each Round: $2 per remaining Hand, $1 per remaining Discard. Earn no Interest."
 
 class YellowDeck(BaseDeck):
     """Represents the Yellow Deck, which provides extra starting money."""
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         """Initializes a YellowDeck."""
-        super().__init__()
+        super().__init__(rng)
         self.name = "Yellow Deck"
         self.description = "Start with extra $10."
\ No newline at end of file
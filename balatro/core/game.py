@@ -1,43 +1,140 @@
 from __future__ import annotations
 
-"""Game engine and orchestration logic."""
+"""Game engine and orchestration logic.
 
-import json
-import random
+:class:`Game` is a headless engine: it is driven with the typed actions of
+:mod:`balatro.core.actions` through :meth:`Game.step` and reports every
+outcome as a typed event from :mod:`balatro.events`.  It never prints or
+reads input; the CLI is just one consumer that renders events and turns
+user input into actions.  Between blinds the game moves through the
+phases in :class:`Phase` (shop, open booster pack, pending target choice)
+so every decision that used to be an ``input()`` prompt is now an action.
+
+The shop, the card catalogs and the save formats are imported where they
+are first used, so dealing the first hand does not load them.
+"""
+
+from enum import Enum
+from typing import Callable, NamedTuple
 
 from .deck import BaseDeck, RedDeck, GreenDeck, YellowDeck
-from ..cards.cards import Card
-from .poker import evaluate_hand
+from ..cards.cards import Card, Edition
+from .poker import evaluate_hand_cached
 from .scoring import calculate_score
-from ..cards.jokers import joker_from_dict, load_jokers
-from ..shop.vouchers import voucher_from_dict
-from .blinds import BlindManager
-from ..shop.shop import Shop
-from ..cards.tarot_cards import tarot_card_from_dict
-from ..cards.spectral_cards import spectral_card_from_dict
-from ..cards.planet_cards import planet_card_from_dict
+from . import joker_effects
+from .joker_effects import ScoreContext
+from .score_trace import ScoreTrace
+from .blinds import BlindManager, BossBlind
 from ..shop.stickers import StickerType
 from .player import Player
-from ..utils import get_user_input
+from .rng import GameRng
+from .actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    SellItem,
+    SortHand,
+    UseConsumable,
+)
+from ..events import (
+    ActionRejected,
+    AnteAdvanced,
+    BlindCleared,
+    BlindStarted,
+    CardsDiscarded,
+    GameOver,
+    HandPlayed,
+    ItemSold,
+    JokerDebuffed,
+    JokerPayout,
+    Notice,
+    PackOpened,
+    RentalCharged,
+    RoundWinnings,
+    ShopOpened,
+    TargetsRequested,
+)
+
+
+class Phase(Enum):
+    """What the engine is waiting for."""
+
+    PLAYING = "playing"
+    SHOP = "shop"
+    PACK = "pack"
+    TARGETING = "targeting"
+    GAME_OVER = "game over"
+
+
+class PendingTargets(NamedTuple):
+    """A consumable waiting for :class:`ChooseTargets`.
+
+    ``kind`` and ``index`` say where the card goes back if the choice is
+    cancelled (``kind`` is ``None`` when it came from a booster pack), and
+    ``resume`` is the phase to return to afterwards.
+    """
+
+    card: object
+    candidates: list[Card]
+    kind: str | None
+    index: int
+    resume: Phase
+
+
+# Player inventories addressed by UseConsumable/SellItem ``kind``:
+# attribute, label used in messages and Player sell method.
+INVENTORIES = {
+    "joker": ("jokers", "Joker", "sell_joker"),
+    "tarot": ("tarot_cards", "Tarot card", "sell_tarot_card"),
+    "spectral": ("spectral_cards", "Spectral card", "sell_spectral_card"),
+    "planet": ("planet_cards", "Planet card", "sell_planet_card"),
+}
+
+
+def _card_copier() -> Callable[[Card], Card]:
+    """Return a function copying each card once, however often it is seen.
+
+    Pack and target candidates refer to cards that are also in the deck
+    or hand, and must map to the same copies.
+    """
+    memo: dict[int, Card] = {}
+
+    def copy_card(card: Card) -> Card:
+        clone = memo.get(id(card))
+        if clone is None:
+            clone = memo[id(card)] = card.copy()
+        return clone
+
+    return copy_card
 
 
 class Game:
     """Represents the main game state and logic for Balatro CLI."""
 
-    def __init__(self, deck_type: str = "Base"):
+    def __init__(self, deck_type: str = "Base", seed: int | str | None = None):
+        self.rng = GameRng(seed)
+        # Callables receiving every emitted event.
+        self.listeners: list[Callable[[object], None]] = []
+        # Records every action passed to step(), see balatro.core.action_log.
+        self.action_log = None
+        # Autosave journal of every action, see balatro.core.journal.
+        self.journal = None
+        self._events: list | None = None
+        self.phase = Phase.PLAYING
+        self.pack = None
+        self.pending: PendingTargets | None = None
         self.round = 1
         self.ante = 1
-        self.game_over = False
         self.deck_key = deck_type
 
         deck_cls = {"Red": RedDeck, "Green": GreenDeck, "Yellow": YellowDeck}.get(
             deck_type, BaseDeck
         )
-        deck = deck_cls()
-        deck.shuffle()
-        self.deck = deck
-
-        self.player = Player(deck)
+        self.deck = deck_cls(self.rng.deck)
+        self.player = Player(self.deck)
 
         if deck_type == "Red":
             self.player.discards += 1
@@ -47,13 +144,44 @@ class Game:
             self.player.money += 10
 
         self.blind_manager = BlindManager()
-        self.shop = Shop()
+        self._shop = None
         self.round_earnings = 0
         self.voucher_purchased = False
         self.last_used_card = None
         self.ectoplasm_uses = 0
+        # Render the chip/mult breakdown of every played hand.
+        self.show_breakdown = True
+        # Card objects are shared with a clone and must be copied before
+        # an effect changes them (see clone()).
+        self._cards_shared = False
         self.activate_vouchers()
 
+    @property
+    def seed(self) -> int | str:
+        return self.rng.seed
+
+    @property
+    def game_over(self) -> bool:
+        return self.phase is Phase.GAME_OVER
+
+    @game_over.setter
+    def game_over(self, value: bool) -> None:
+        self.phase = Phase.GAME_OVER if value else Phase.PLAYING
+
+    @property
+    def shop(self):
+        """The :class:`~balatro.shop.shop.Shop`, created on first use."""
+        shop = self._shop
+        if shop is None:
+            from ..shop.shop import Shop
+
+            shop = self._shop = Shop()
+        return shop
+
+    @shop.setter
+    def shop(self, value) -> None:
+        self._shop = value
+
     @property
     def money(self):
         return self.player.money
@@ -62,12 +190,77 @@ class Game:
     def money(self, value):
         self.player.money = value
 
+    # ------------------------------------------------------------------
+    # Cloning
+    def clone(self, share_cards: bool = False) -> "Game":
+        """Return an independent copy of the game, e.g. for lookahead.
+
+        Only mutable state is copied: card zones, Jokers, inventories, the
+        shop, the pending pack or target choice and the random streams.
+        Catalog data (names, descriptions, owned consumables and vouchers)
+        and the compiled Joker pipeline are shared.  Listeners are not
+        copied, so a clone runs silently.
+
+        With ``share_cards`` the card lists are copied but the Card objects
+        are shared copy-on-write: both games copy their cards before the
+        first Tarot or Spectral effect, the only thing that changes cards in
+        place (Vampire, which strips the enhancements of the cards it
+        scores, copies them before a hand too).  Discarding never copies
+        them.
+        """
+        if share_cards:
+            copy_card = None
+            self._cards_shared = True
+        elif self.pack is None and self.pending is None:
+            # Every card is in exactly one zone, so no memo is needed.
+            copy_card = Card.copy
+        else:
+            copy_card = _card_copier()
+
+        game = object.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        game.listeners = []
+        game.action_log = None
+        game.journal = None
+        game._events = None
+        game._cards_shared = share_cards
+        game.rng = self.rng.clone()
+        game.deck = self.deck.clone(game.rng.deck, copy_card)
+        game.player = self.player.clone(game.deck, copy_card)
+        game.blind_manager = object.__new__(BlindManager)
+        game.blind_manager.__dict__.update(self.blind_manager.__dict__)
+        if self._shop is not None:
+            game._shop = self._shop.clone(copy_card)
+        if self.pack is not None:
+            game.pack = self.pack.clone(copy_card)
+        if self.pending is not None:
+            candidates = self.pending.candidates
+            game.pending = self.pending._replace(
+                candidates=candidates[:] if copy_card is None else [copy_card(c) for c in candidates]
+            )
+        return game
+
+    def _own_cards(self, targets: list[Card]) -> list[Card]:
+        """Stop sharing Card objects with clones; return ``targets`` remapped."""
+        copy_card = _card_copier()
+        self.deck = self.deck.clone(self.deck.rng, copy_card)
+        self.player.deck = self.deck
+        self.player.hand = [copy_card(c) for c in self.player.hand]
+        if self.pack is not None:
+            self.pack.cards = [copy_card(c) for c in self.pack.cards]
+        self._cards_shared = False
+        return [copy_card(c) for c in targets]
+
     # ------------------------------------------------------------------
     # Serialization helpers
     def to_dict(self):
         p = self.player
         return {
             "deck_type": self.deck_key,
+            "rng": self.rng.to_dict(),
+            "deck": [card.to_dict() for card in self.deck.cards],
+            "discard_pile": [card.to_dict() for card in self.deck.discard_pile],
+            "destroyed": [card.to_dict() for card in self.deck.destroyed],
             "player": {
                 "hand": [card.to_dict() for card in p.hand],
                 "jokers": [joker.to_dict() for joker in p.jokers],
@@ -78,11 +271,12 @@ class Game:
                 "money": p.money,
                 "hands": p.hands,
                 "discards": p.discards,
-                "hand_size": p.hand_size,
+                "hand_size": p.base_hand_size,
                 "score": p.score,
                 "sort_by": p.sort_by,
                 "consumable_slots": p.consumable_slots,
                 "hand_bonuses": p.hand_bonuses,
+                "hands_played": p.hands_played,
             },
             "round": self.round,
             "ante": self.ante,
@@ -93,7 +287,18 @@ class Game:
 
     @classmethod
     def from_dict(cls, data):
-        game = cls(deck_type=data["deck_type"])
+        from ..cards.jokers import joker_from_dict
+        from ..cards.planet_cards import planet_card_from_dict
+        from ..cards.spectral_cards import spectral_card_from_dict
+        from ..cards.tarot_cards import tarot_card_from_dict
+        from ..shop.vouchers import voucher_from_dict
+
+        rng_data = data.get("rng")
+        game = cls(deck_type=data["deck_type"], seed=rng_data and rng_data["seed"])
+        if "deck" in data:
+            game.deck.cards = [Card.from_dict(c) for c in data["deck"]]
+            game.deck.discard_pile = [Card.from_dict(c) for c in data.get("discard_pile", [])]
+            game.deck.destroyed = [Card.from_dict(c) for c in data.get("destroyed", [])]
         p_data = data["player"]
         player = game.player
         player.hand = [Card.from_dict(c) for c in p_data["hand"]]
@@ -105,18 +310,72 @@ class Game:
         player.money = p_data["money"]
         player.hands = p_data["hands"]
         player.discards = p_data["discards"]
-        player.hand_size = p_data["hand_size"]
+        player.base_hand_size = p_data["hand_size"]
         player.score = p_data["score"]
         player.sort_by = p_data.get("sort_by", "rank")
         player.consumable_slots = p_data.get("consumable_slots", 2)
         player.hand_bonuses = p_data.get("hand_bonuses", {})
+        player.hands_played = p_data.get("hands_played", {})
         game.round = data["round"]
         game.ante = data["ante"]
         game.game_over = data["game_over"]
         game.blind_manager.index = data["current_blind_index"]
         game.ectoplasm_uses = data.get("ectoplasm_uses", 0)
+        if rng_data:
+            game.rng = GameRng.from_dict(rng_data)
+            game.deck.rng = game.rng.deck
         return game
 
+    # ------------------------------------------------------------------
+    # Engine interface
+    def emit(self, event) -> None:
+        """Deliver ``event`` to the listeners and to the running :meth:`step`."""
+        if self._events is not None:
+            self._events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def step(self, action) -> list:
+        """Apply one action and return the events it produced.
+
+        Actions that do not fit the current :attr:`phase` are rejected with
+        an :class:`~balatro.events.ActionRejected` event and change nothing.
+        The action is recorded in :attr:`action_log` and :attr:`journal`, if
+        any, before it is applied, so a log ends with the action that crashed
+        a session.
+        """
+        if self.action_log is not None:
+            self.action_log.record(action)
+        if self.journal is not None:
+            self.journal.record(action)
+        self._events = events = []
+        try:
+            handler, phases = _ACTIONS.get(type(action), (None, ()))
+            if handler is None:
+                self.emit(ActionRejected(f"Unknown action: {action!r}"))
+            elif self.phase not in phases:
+                name = type(action).__name__
+                self.emit(ActionRejected(f"Cannot {name} while {self.phase.value}."))
+            else:
+                handler(self, action)
+        finally:
+            self._events = None
+        return events
+
+    def _step_play(self, action: PlayCards) -> None:
+        hand = self.player.hand
+        indices = action.indices
+        if not indices:
+            self.emit(ActionRejected("No cards selected to play."))
+        elif any(i < 0 or i >= len(hand) for i in indices) or len(set(indices)) != len(indices):
+            self.emit(ActionRejected("Error: Invalid card index for play."))
+        else:
+            self.play_hand([hand[i] for i in indices])
+
+    def _step_sort(self, action: SortHand) -> None:
+        self.change_sort_type()
+        self.sort_hand()
+
     # ------------------------------------------------------------------
     def __repr__(self):
         return (
@@ -131,30 +390,35 @@ class Game:
     def advance_blind(self):
         cleared_ante = self.blind_manager.advance()
         self.player.score = 0
-        self.player.hands = 4
-        self.player.discards = 3
+        rules = self.player.joker_pipeline.rules
+        self.player.hands = max(1, 4 + rules.hands)
+        self.player.discards = max(0, 3 + rules.discards)
         if self.deck_key == "Red":
             self.player.discards += 1
         if cleared_ante:
-            print("\n--- All Blinds in Ante Cleared! Advancing to next Ante! ---")
             self.ante += 1
             self.voucher_purchased = False
-        print(
-            f"\n--- Advancing to {self.blind_manager.current.name} (Score required: {self.blind_manager.current.score_required}) ---"
-        )
+            self.emit(AnteAdvanced(self.ante))
+        blind = self.blind_manager.current
+        self.emit(BlindStarted(blind.name, blind.score_required))
+        joker_effects.advance(self, joker_effects.BLIND_SELECTED, boss=isinstance(blind, BossBlind))
         # Riff-Raff Joker effect
         for joker in self.player.jokers:
             if joker.name == "Riff-Raff":
-                commons = [j for j in load_jokers() if getattr(j, "rarity", "").lower() == "common"]
+                from ..cards.jokers import JOKERS, jokers_of_rarity
+
+                commons = jokers_of_rarity("common")
                 slots = max(0, 5 - len(self.player.jokers))
                 to_create = min(2, slots)
                 if to_create <= 0:
-                    print("No room for Riff-Raff to create Jokers.")
+                    self.emit(Notice(joker.name, "No room for Riff-Raff to create Jokers."))
                     break
                 for _ in range(to_create):
-                    self.player.jokers.append(random.choice(commons))
+                    self.player.jokers.append(JOKERS.choice(self.rng.jokers, commons))
                 plural = "s" if to_create > 1 else ""
-                print(f"Riff-Raff created {to_create} Common Joker{plural}.")
+                self.emit(
+                    Notice(joker.name, f"Riff-Raff created {to_create} Common Joker{plural}.")
+                )
                 break
 
     def end_of_round_winnings(self) -> int:
@@ -162,6 +426,11 @@ class Game:
         leftover = self.player.hands
         self.player.money += base + leftover
 
+        for joker, amount in self.player.joker_pipeline.end_of_round(ScoreContext(self)):
+            self.player.money += amount
+            self.round_earnings += amount
+            self.emit(JokerPayout(joker, amount, self.player.money))
+
         interest = 0
         if self.player.earns_interest:
             cap = 5
@@ -174,74 +443,64 @@ class Game:
             self.player.money += interest
 
         total = base + leftover + self.round_earnings + interest
-        print(
-            f"End of round winnings: base ${base} + joker/gold ${self.round_earnings} + leftover hands ${leftover} + interest ${interest} = ${total}"
-        )
+        self.emit(RoundWinnings(base, self.round_earnings, leftover, interest, total))
         self.round_earnings = 0
         self.player.hands = 0
         return total
 
     def enter_shop(self):
+        """Stock the shop and wait for shop actions."""
         self.shop.generate_items(self)
-        while True:
-            self.shop.display_items(self.money, self.player)
-            choice = get_user_input(
-                "Select item to purchase or type 'leave' to continue: "
-            ).strip().lower()
-            if choice in ("", "leave", "l"):
-                break
-            if choice[0:1] in {"j", "t", "s", "p"}:
-                try:
-                    idx = int(choice[1:])
-                except ValueError:
-                    print("Invalid selection.")
-                    continue
-                if choice[0] == "j":
-                    self.player.sell_joker(idx)
-                elif choice[0] == "t":
-                    self.player.sell_tarot_card(idx)
-                elif choice[0] == "s":
-                    self.player.sell_spectral_card(idx)
-                else:
-                    self.player.sell_planet_card(idx)
-                continue
-            try:
-                idx = int(choice)
-                self.shop.purchase_item(idx, self)
-            except ValueError:
-                print("Invalid selection.")
+        self.phase = Phase.SHOP
+        self.emit(ShopOpened(self.shop.items))
+
+    def leave_shop(self):
+        """Leave the shop and start the next blind."""
+        self.phase = Phase.PLAYING
+        self.advance_blind()
+        self.draw_hand()
 
     def check_blind_cleared(self):
-        if self.player.score >= self.blind_manager.current.score_required:
+        blind = self.blind_manager.current
+        if self.player.score >= blind.score_required or self._saved_by_mr_bones(blind):
             total = self.end_of_round_winnings()
-            print(
-                f"\n--- {self.blind_manager.current.name} Cleared! You gained ${total}! ---"
-            )
+            self.emit(BlindCleared(blind.name, total))
+            if isinstance(blind, BossBlind):
+                joker_effects.advance(self, joker_effects.BOSS_DEFEATED)
+            joker_effects.advance(self, joker_effects.ROUND_ENDED)
+            # Round boundary: every card goes back into a freshly shuffled deck.
+            self.deck.return_cards(self.player.hand)
+            self.player.hand = []
+            self.deck.reshuffle()
             self.enter_shop()
-            self.advance_blind()
-            self.draw_hand()
             return True
-        print(
-            f"\n--- Failed to clear {self.blind_manager.current.name}! Game Over! ---"
-        )
-        self.game_over = True
+        self.phase = Phase.GAME_OVER
+        self.emit(GameOver(blind.name))
+        return False
+
+    def _saved_by_mr_bones(self, blind) -> bool:
+        """Mr. Bones' rule: a quarter of the required score survives, and he is destroyed."""
+        if self.player.score * 4 < blind.score_required:
+            return False
+        for joker in self.player.jokers:
+            if joker.name == "Mr. Bones" and not joker.is_debuffed:
+                self.player.jokers.remove(joker)
+                self.emit(Notice(joker.name, "Mr. Bones saved the run and was destroyed."))
+                return True
         return False
 
     def end_of_round_effects(self):
+        self.player.invalidate_jokers()
         for joker in self.player.jokers:
             for sticker in joker.stickers:
                 if sticker.sticker_type == StickerType.PERISHABLE:
                     joker.rounds_active += 1
                     if joker.rounds_active >= 5:
                         joker.is_debuffed = True
-                        print(
-                            f"{joker.name} has become debuffed due to Perishable Sticker!"
-                        )
+                        self.emit(JokerDebuffed(joker))
                 elif sticker.sticker_type == StickerType.RENTAL:
                     self.player.money -= 3
-                    print(
-                        f"Rental fee for {joker.name}: -$3. Current money: ${self.player.money}"
-                    )
+                    self.emit(RentalCharged(joker, 3, self.player.money))
 
     # ------------------------------------------------------------------
     # Convenience wrappers that delegate to Player
@@ -257,50 +516,199 @@ class Game:
     def sort_hand(self):
         self.player.sort_hand()
 
-    def use_tarot_card(self, index: int):
-        self.player.use_tarot_card(index, self)
+    def use_tarot_card(self, index: int, targets: list[int] | None = None):
+        self.use_consumable("tarot", index, targets)
 
-    def use_spectral_card(self, index: int):
-        self.player.use_spectral_card(index, self)
+    def use_spectral_card(self, index: int, targets: list[int] | None = None):
+        self.use_consumable("spectral", index, targets)
 
     def use_planet_card(self, index: int):
-        self.player.use_planet_card(index, self)
+        self.use_consumable("planet", index)
+
+    # ------------------------------------------------------------------
+    # Consumables, shop and booster packs
+    def apply_consumable(self, card, targets: list[Card] | None = None) -> None:
+        """Resolve ``card``'s effect, on ``targets`` for Tarot/Spectral cards."""
+        from ..cards.planet_cards import PlanetCard
+
+        if isinstance(card, PlanetCard):
+            card.apply_effect(self)
+            self.last_used_card = card
+            joker_effects.advance(self, joker_effects.CONSUMABLE_USED, card=card, added=(), destroyed=())
+            return
+        targets = targets or []
+        if self._cards_shared:
+            targets = self._own_cards(targets)
+        before = self._all_cards()
+        card.apply_effect(self, targets)
+        after = self._all_cards()
+        joker_effects.advance(
+            self,
+            joker_effects.CONSUMABLE_USED,
+            card=card,
+            added=[c for key, c in after.items() if key not in before],
+            destroyed=[c for key, c in before.items() if key not in after],
+        )
+
+    def _all_cards(self) -> dict[int, Card]:
+        """The player's cards in every zone, by ``id``."""
+        deck = self.deck
+        return {id(c): c for zone in (deck.cards, deck.discard_pile, self.player.hand) for c in zone}
+
+    def use_consumable(self, kind: str, index: int, targets=None) -> None:
+        """Use inventory card ``index`` of ``kind``.
+
+        Targeted cards act on hand cards; without ``targets`` the engine
+        switches to :attr:`Phase.TARGETING` and waits for them.
+        """
+        if kind not in INVENTORIES or kind == "joker":
+            self.emit(ActionRejected(f"Unknown consumable type: {kind}."))
+            return
+        attr, label, _ = INVENTORIES[kind]
+        items = getattr(self.player, attr)
+        if not 0 <= index < len(items):
+            self.emit(ActionRejected(f"Invalid {label} index."))
+            return
+        card = items[index]
+        needed = getattr(card, "targets", 0)
+        hand = self.player.hand
+        if needed > 0 and targets:
+            targets = list(targets)[:needed]
+            if any(i < 0 or i >= len(hand) for i in targets):
+                self.emit(ActionRejected("Invalid card selection."))
+                return
+        items.pop(index)
+        if needed == 0:
+            self.apply_consumable(card)
+        elif not targets:
+            self.request_targets(card, list(hand), kind, index)
+        else:
+            self.apply_consumable(card, [hand[i] for i in targets])
+
+    def request_targets(self, card, candidates: list[Card], kind: str | None = None, index: int = 0):
+        """Wait for the player to choose ``card``'s targets among ``candidates``."""
+        self.pending = PendingTargets(card, candidates, kind, index, self.phase)
+        self.phase = Phase.TARGETING
+        self.emit(TargetsRequested(card, candidates))
+
+    def choose_targets(self, indices) -> None:
+        """Resolve the pending target choice; no indices keeps the card."""
+        pending = self.pending
+        candidates = pending.candidates
+        if any(i < 0 or i >= len(candidates) for i in indices):
+            self.emit(ActionRejected("Invalid card selection."))
+            return
+        self.pending = None
+        self.phase = pending.resume
+        card = pending.card
+        if not indices:
+            if pending.kind is None:
+                from ..shop.shop import gain_consumable
+
+                gain_consumable(self, card)
+            else:
+                getattr(self.player, INVENTORIES[pending.kind][0]).insert(pending.index, card)
+            return
+        chosen = [candidates[i] for i in list(indices)[: card.targets]]
+        self.apply_consumable(card, chosen)
+
+    def buy_item(self, index: int, use: bool = False) -> None:
+        self.shop.purchase_item(index, self, use)
+
+    def sell_item(self, kind: str, index: int) -> None:
+        if kind not in INVENTORIES:
+            self.emit(ActionRejected(f"Unknown item type: {kind}."))
+            return
+        attr, label, sell = INVENTORIES[kind]
+        items = getattr(self.player, attr)
+        item = items[index] if 0 <= index < len(items) else None
+        value = getattr(self.player, sell)(index)
+        if value is None:
+            self.emit(ActionRejected(f"Invalid {label} index."))
+        else:
+            self.emit(ItemSold(item, value))
+            if kind == "joker" and item.name == "Invisible Joker":
+                self._invisible_joker(item)
+            joker_effects.advance(self, joker_effects.CARD_SOLD, item=item)
+
+    def _invisible_joker(self, joker) -> None:
+        """Invisible Joker's rule: sold after two rounds, it duplicates a random Joker."""
+        jokers = self.player.jokers
+        if joker.is_debuffed or joker.counter < 2 or not jokers:
+            return
+        copy = self.rng.jokers.choice(jokers).copy()
+        if getattr(copy, "edition", None) is Edition.NEGATIVE:
+            copy.edition = Edition.NONE
+        jokers.append(copy)
+        self.emit(Notice(joker.name, f"{joker.name} duplicated {copy.name}."))
+
+    def open_pack(self, pack) -> None:
+        """Wait for the player to pick one of ``pack``'s options."""
+        self.pack = pack
+        self.phase = Phase.PACK
+        self.emit(PackOpened(pack.name, pack.options, pack.cards))
+        joker_effects.advance(self, joker_effects.PACK_OPENED)
+
+    def pick_pack_item(self, index: int | None, use: bool = False) -> None:
+        """Take option ``index`` from the open pack, or skip it with ``None``."""
+        pack = self.pack
+        if index is not None and not 0 <= index < len(pack.options):
+            self.emit(ActionRejected("Invalid selection."))
+            return
+        self.pack = None
+        self.phase = Phase.SHOP
+        if index is not None:
+            pack.choose(self, index, use)
+        else:
+            joker_effects.advance(self, joker_effects.PACK_SKIPPED)
 
     def play_hand(self, cards_to_play: list[Card]):
         if len(cards_to_play) > 5: # Player can play less than 5 cards, but not more. 
-            print("Error: You can't play over 5 cards.")
+            self.emit(ActionRejected("Error: You can't play over 5 cards."))
             return
         if not all(c in self.player.hand for c in cards_to_play):
-            print("Error: One or more cards are not in the current hand.")
+            self.emit(ActionRejected("Error: One or more cards are not in the current hand."))
             return
 
+        if self._cards_shared and any(
+            j.name in joker_effects.CHANGES_CARDS for j in self.player.jokers
+        ):
+            cards_to_play = self._own_cards(cards_to_play)
         played_cards = list(cards_to_play)
         for card in cards_to_play:
             self.player.hand.remove(card)
 
-        played_hand_type, hand_cards = evaluate_hand(cards_to_play)
+        played_hand_type, hand_cards = evaluate_hand_cached(
+            cards_to_play, self.player.joker_pipeline.rules.hand_rules
+        )
+        hand_score = 0
+        trace = None
         if played_hand_type:
             scoring_cards = (
-                cards_to_play
-                if any(j.name == "Splash" for j in self.player.jokers)
-                else hand_cards
+                cards_to_play if self.player.joker_pipeline.splash else hand_cards
+            )
+            joker_effects.advance(
+                self,
+                joker_effects.HAND_PLAYED,
+                hand_type=played_hand_type,
+                played=played_cards,
+                scoring=scoring_cards,
             )
-            hand_score, chips, mult, breakdown = calculate_score(
-                played_hand_type, scoring_cards, self.player.jokers, self
+            trace = ScoreTrace() if self.show_breakdown else None
+            hand_score, chips, mult = calculate_score(
+                played_hand_type, scoring_cards, self.player.jokers, self, trace, played_cards
             )
-            for line in breakdown:
-                print(line)
             self.player.score += hand_score
-            print(
-                f"Hand played: {played_hand_type.value} for {hand_score} points!"
+            played = self.player.hands_played
+            played[played_hand_type.name] = played.get(played_hand_type.name, 0) + 1
+            joker_effects.advance(
+                self, joker_effects.HAND_SCORED, hand_type=played_hand_type, played=played_cards
             )
-        else:
-            print("No valid poker hand was played.")
 
         self.deck.return_cards(played_cards)
         self.player.hands -= 1
-        print(
-            f"Played {len(cards_to_play)} cards. {self.player.hands} hands remaining."
+        self.emit(
+            HandPlayed(played_hand_type, played_cards, hand_score, self.player.hands, trace)
         )
 
         if self.player.score >= self.blind_manager.current.score_required:
@@ -315,31 +723,24 @@ class Game:
 
     def discard_cards(self, card_indices: list[int]):
         if self.player.discards <= 0:
-            print("No discards remaining!")
+            self.emit(ActionRejected("No discards remaining!"))
             return
         if not card_indices:
-            print("No cards selected to discard.")
+            self.emit(ActionRejected("No cards selected to discard."))
             return
         if len(card_indices) > 5:
-            print("Error: You can only discard up to 5 cards.")
+            self.emit(ActionRejected("Error: You can only discard up to 5 cards."))
             return
         if any(i < 0 or i >= len(self.player.hand) for i in card_indices):
-            print("Error: Invalid card index for discard.")
+            self.emit(ActionRejected("Error: Invalid card index for discard."))
             return
         if len(card_indices) != len(set(card_indices)):
-            print("Error: Duplicate card indices for discard.")
+            self.emit(ActionRejected("Error: Duplicate card indices for discard."))
             return
 
-        discarded = self.player.discard_cards(card_indices)
-        print(
-            f"Discarded {len(discarded)} cards. {self.player.discards} discards remaining."
-        )
-
-    def show_deck(self):
-        print("\n--- Remaining Deck ---")
-        for i, card in enumerate(self.deck.cards):
-            print(f"[{i}] {card}")
-        print("--------------------")
+        discarded = self.player.discard_cards(list(card_indices))
+        self.emit(CardsDiscarded(discarded, self.player.discards))
+        joker_effects.advance(self, joker_effects.DISCARDED, cards=discarded)
 
     # ------------------------------------------------------------------
     def __str__(self) -> str:
@@ -395,25 +796,63 @@ class Game:
         return "\n".join(lines)
 
 
+# Action type -> (handler, phases in which it is accepted).
+_ACTIONS = {
+    PlayCards: (Game._step_play, (Phase.PLAYING,)),
+    DiscardCards: (lambda g, a: g.discard_cards(list(a.indices)), (Phase.PLAYING,)),
+    UseConsumable: (
+        lambda g, a: g.use_consumable(a.kind, a.index, a.targets),
+        (Phase.PLAYING, Phase.SHOP),
+    ),
+    BuyItem: (lambda g, a: g.buy_item(a.index, a.use), (Phase.SHOP,)),
+    SellItem: (lambda g, a: g.sell_item(a.kind, a.index), (Phase.PLAYING, Phase.SHOP)),
+    OpenPackChoice: (lambda g, a: g.pick_pack_item(a.index, a.use), (Phase.PACK,)),
+    ChooseTargets: (lambda g, a: g.choose_targets(a.indices), (Phase.TARGETING,)),
+    LeaveShop: (lambda g, a: g.leave_shop(), (Phase.SHOP,)),
+    SortHand: (Game._step_sort, (Phase.PLAYING,)),
+}
+
+
 # ----------------------------------------------------------------------
 # Persistence helpers
 
-def save_game(game: Game, filename: str = "balatro_save.json"):
+SAVE_FORMATS = ("json", "binary")
+
+
+def save_game(game: Game, filename: str = "balatro_save.json", format: str = "json"):
+    """Save ``game`` as indented JSON or in the compact binary format.
+
+    See :mod:`balatro.core.binary_save` for the binary layout.
+    """
+    if format == "binary":
+        from .binary_save import dumps
+
+        with open(filename, "wb") as f:
+            f.write(dumps(game))
+        return
+    if format != "json":
+        raise ValueError(f"Unknown save format: {format}")
+    import json
+
     with open(filename, "w") as f:
         json.dump(game.to_dict(), f, indent=4)
-    print(f"Game saved to {filename}")
 
 
 def load_game(filename: str = "balatro_save.json") -> Game | None:
+    """Load a saved game, returning ``None`` if there is no save file.
+
+    The format is recognised from the file's first bytes.  Other errors
+    (for example a corrupt file) propagate to the caller.
+    """
     try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-        game = Game.from_dict(data)
-        print(f"Game loaded from {filename}")
-        return game
+        with open(filename, "rb") as f:
+            data = f.read()
     except FileNotFoundError:
-        print(f"No save file found at {filename}")
-        return None
-    except Exception as e:
-        print(f"Error loading game: {e}")
         return None
+    from .binary_save import MAGIC, loads
+
+    if data.startswith(MAGIC):
+        return loads(data)
+    import json
+
+    return Game.from_dict(json.loads(data))
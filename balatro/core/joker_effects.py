@@ -0,0 +1,1114 @@
+"""Joker effects compiled from ``data/jokers.json``.
+
+Each Joker's ``type`` says what it changes (``+c`` chips, ``+m`` mult,
+``Xm`` a mult factor, ``++`` chips and mult, ``...`` retriggers, ``+$``
+money) and its ``activation`` when (``On Scored``, ``On Held``,
+``Indep.``).  Together they compile into :class:`Hook` records that fire
+in one of four phases:
+
+* :data:`SCORED`: for each scoring card, every time it is triggered;
+* :data:`HELD`: for each card left in hand;
+* :data:`INDEPENDENT`: once per hand, after the cards, in Joker order;
+* :data:`END_OF_ROUND`: once when the blind is cleared (money only).
+
+Amounts come from the data's ``chips``, ``mult``, ``mult_multiplier`` and
+``retrigger`` fields, and hand conditions from ``hand`` (any hand that
+contains it, so a Full House triggers Jolly Joker).  What the data only
+states in prose, such as Greedy Joker's Diamond suit or Banner's "for
+each remaining discard", is in :data:`CONDITIONS`.
+
+Jokers that grow during a run keep what they have gained in
+``Joker.counter``, and Jokers whose suit or card changes every round keep
+it in ``Joker.target``.  :func:`advance` updates both on the game events
+in :data:`GROWTH` (a hand played, a discard, a blind selected...) and the
+lineup is recompiled with the new values.  The same rules carry out the
+effects that happen on those events rather than while scoring: paying
+money, creating Tarot cards, levelling up hands.
+
+Every Joker is accounted for: it compiles into hooks, acts through its
+:data:`GROWTH` rules, changes the rules of the round (:data:`RULES`:
+hand size, hands, discards, debt, which cards make a hand), is one of
+:data:`ENGINE_RULES`, which the engine applies itself (Splash, or
+Blueprint copying its neighbour's hooks), or is one of
+:data:`NOT_MODELLED`, whose effects need events or game objects the
+engine does not have (rerolls, skipped blinds, Boss Blind abilities) and
+which shops and packs never offer.  Jokers that decay as the run goes on
+(Ice Cream, Popcorn, Ramen...) score their starting value.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, NamedTuple
+
+from ..cards.cards import (
+    RANK_CODES,
+    RANKS,
+    SUIT_CODES,
+    SUIT_SHIFT,
+    SUITS,
+    Card,
+    Enhancement,
+    Rank,
+    Seal,
+    Suit,
+)
+from ..events import ItemGained, JokerPayout, Notice
+from ..shop.stickers import StickerType
+from ..utils import calculate_sell_value
+from .poker import NO_RULES, HandRules, PokerHand, evaluate_hand_cached
+
+SCORED = "scored"
+HELD = "held"
+INDEPENDENT = "independent"
+END_OF_ROUND = "end of round"
+PHASES = (SCORED, HELD, INDEPENDENT, END_OF_ROUND)
+
+# Phase of each ``activation``; ``+$`` Jokers marked ``N/A`` pay out at
+# the end of the round.  Other activations (On Played, On Discard) have
+# no scoring effect.
+ACTIVATIONS = {
+    "On Scored": SCORED,
+    "On Held": HELD,
+    "Indep.": INDEPENDENT,
+    "Mixed": INDEPENDENT,
+    "On Other Jokers": INDEPENDENT,
+}
+
+# Cards are indexed by the low six bits of ``Card.code``: rank and suit.
+CARD_KEYS = 1 << SUIT_SHIFT + 2
+KEY_MASK = CARD_KEYS - 1
+
+# Joker slots, as Riff-Raff assumes.
+JOKER_SLOTS = 5
+
+# The hand types that contain each hand ("if played hand contains a Pair").
+CONTAINED_IN = {
+    PokerHand.PAIR: frozenset(
+        {
+            PokerHand.PAIR,
+            PokerHand.TWO_PAIR,
+            PokerHand.THREE_OF_A_KIND,
+            PokerHand.FULL_HOUSE,
+            PokerHand.FOUR_OF_A_KIND,
+            PokerHand.FIVE_OF_A_KIND,
+        }
+    ),
+    PokerHand.TWO_PAIR: frozenset({PokerHand.TWO_PAIR, PokerHand.FULL_HOUSE}),
+    PokerHand.THREE_OF_A_KIND: frozenset(
+        {
+            PokerHand.THREE_OF_A_KIND,
+            PokerHand.FULL_HOUSE,
+            PokerHand.FOUR_OF_A_KIND,
+            PokerHand.FIVE_OF_A_KIND,
+        }
+    ),
+    PokerHand.FOUR_OF_A_KIND: frozenset({PokerHand.FOUR_OF_A_KIND, PokerHand.FIVE_OF_A_KIND}),
+    PokerHand.STRAIGHT: frozenset({PokerHand.STRAIGHT, PokerHand.STRAIGHT_FLUSH}),
+    PokerHand.FLUSH: frozenset({PokerHand.FLUSH, PokerHand.STRAIGHT_FLUSH}),
+}
+
+
+class Hook(NamedTuple):
+    """A compiled Joker effect.
+
+    Applied as ``chips += chips * n`` and
+    ``mult = (mult + mult * n) * factor``, where ``n`` is ``count(context)``
+    or ``card_count(card)`` (1 without either) and a counted factor becomes
+    ``1 + (factor - 1) * n``.  ``money`` is paid ``n`` times over and
+    ``retrigger`` scores the card that many more times.
+
+    A hook fires when ``when(context)`` holds, with probability ``chance``
+    (doubled by Oops! All 6s), for cards whose key is in ``cards`` (every
+    card when ``None``) and that have ``enhancement``, and for the hand
+    types in ``hands``.  A ``first`` hook only fires on the first scoring
+    card it matches, or on the lowest-ranked held card.  ``spread`` adds a
+    random ``0..spread`` to the mult added (Misprint).  ``reads_hand``
+    marks ``when`` and ``count`` conditions on the cards played or held
+    (not only the scoring ones), which the kickers played change.
+    ``is_bonus`` marks mult added from other Jokers, for the score
+    breakdown.  ``order`` is
+    the Joker's position in the lineup: hooks that fire at the same point
+    apply in that order.
+    """
+
+    name: str
+    phase: str
+    chips: float = 0
+    mult: float = 0
+    factor: float = 1
+    money: int = 0
+    retrigger: int = 0
+    cards: frozenset[int] | None = None
+    enhancement: Enhancement | None = None
+    hands: frozenset[PokerHand] | None = None
+    first: bool = False
+    chance: float = 1
+    spread: int = 0
+    when: Callable[["ScoreContext"], bool] | None = None
+    count: Callable[["ScoreContext"], float] | None = None
+    card_count: Callable[[Card], float] | None = None
+    reads_hand: bool = False
+    is_bonus: bool = False
+    order: int = 0
+
+
+class ScoreContext:
+    """Game state that conditional Joker effects read while scoring.
+
+    ``played`` are the cards played this hand; :func:`score_hand` sets the
+    ``hand_type``, the ``scoring`` and ``held`` cards, and ``card`` while
+    a per-card hook fires.  Counts over the full deck (draw pile, discard
+    pile, hand and the cards being played) are taken on first use.
+    """
+
+    __slots__ = (
+        "player",
+        "deck",
+        "played",
+        "hand_type",
+        "scoring",
+        "held",
+        "card",
+        "_full_deck",
+        "_counts",
+    )
+
+    def __init__(self, game, played: list[Card] | tuple = ()) -> None:
+        self.player = game.player
+        self.deck = game.deck
+        self.played = played
+        self.hand_type: PokerHand | None = None
+        self.scoring: list[Card] | tuple = ()
+        self.held: list[Card] | tuple = ()
+        self.card: Card | None = None
+        self._full_deck: list[Card] | None = None
+        self._counts: dict[tuple, int] = {}
+
+    @property
+    def full_deck(self) -> list[Card]:
+        if self._full_deck is None:
+            hand = self.player.hand
+            in_hand = {id(card) for card in hand}
+            self._full_deck = (
+                self.deck.cards
+                + self.deck.discard_pile
+                + hand
+                + [card for card in self.played if id(card) not in in_hand]
+            )
+        return self._full_deck
+
+    def deck_count(self, enhancement: Enhancement | None = None, rank: Rank | None = None) -> int:
+        """Cards in the full deck with ``enhancement`` and ``rank`` (either may be ``None``)."""
+
+        key = (enhancement, rank)
+        count = self._counts.get(key)
+        if count is None:
+            count = self._counts[key] = sum(
+                1
+                for card in self.full_deck
+                if (enhancement is None or card.enhancement is enhancement)
+                and (rank is None or card.rank is rank)
+            )
+        return count
+
+
+def card_keys(ranks=RANKS, suits=SUITS) -> frozenset[int]:
+    """Keys of the cards with any of ``ranks`` and any of ``suits``."""
+
+    return frozenset(RANK_CODES[r] | SUIT_CODES[s] << SUIT_SHIFT for r in ranks for s in suits)
+
+
+FACES = (Rank.JACK, Rank.QUEEN, Rank.KING)
+_DARK = frozenset({Suit.SPADES, Suit.CLUBS})
+# Suits each suit counts as with Smeared Joker.
+_SMEARED = {
+    Suit.HEARTS: (Suit.HEARTS, Suit.DIAMONDS),
+    Suit.DIAMONDS: (Suit.HEARTS, Suit.DIAMONDS),
+    Suit.SPADES: (Suit.SPADES, Suit.CLUBS),
+    Suit.CLUBS: (Suit.SPADES, Suit.CLUBS),
+}
+
+
+_HANDS = list(PokerHand)
+_RANK_MASK = (1 << SUIT_SHIFT) - 1
+
+
+def _counter(jokers, joker) -> int:
+    return joker.counter
+
+
+def _final_hand(ctx: ScoreContext) -> bool:
+    return ctx.player.hands == 1
+
+
+def _seeing_double(ctx: ScoreContext) -> bool:
+    suits = {card.suit for card in ctx.scoring}
+    return Suit.CLUBS in suits and len(suits) > 1
+
+
+# What ``data/jokers.json`` only states in its ``effect`` text, by Joker:
+#
+# * card conditions: ``suit``, ``ranks``, ``face`` (every rank with
+#   Pareidolia), ``enhancement`` and ``first``;
+# * ``when`` and ``count``, called with the :class:`ScoreContext`, and
+#   ``card_count``, called with the card alone; ``reads_hand`` as on
+#   :class:`Hook`;
+# * ``lineup``, called with the Joker lineup and the Joker itself when
+#   the pipeline is compiled; it counts like ``count``, and with
+#   ``each`` the hook is repeated that many times instead;
+# * ``state``, called with the Joker when the pipeline is compiled: more
+#   of these entries read from its counter and target (a suit, a card,
+#   hand types), or ``None`` when it does not fire at all;
+# * ``chance``, ``spread`` and ``is_bonus`` as on :class:`Hook`;
+# * amounts the data leaves out (``money``) or overrides.
+CONDITIONS: dict[str, dict] = {
+    # For each scoring card
+    "Greedy Joker": {"suit": Suit.DIAMONDS},
+    "Lusty Joker": {"suit": Suit.HEARTS},
+    "Wrathful Joker": {"suit": Suit.SPADES},
+    "Gluttonous Joker": {"suit": Suit.CLUBS},
+    "Fibonacci": {"ranks": (Rank.ACE, Rank.TWO, Rank.THREE, Rank.FIVE, Rank.EIGHT)},
+    "Scary Face": {"face": True},
+    "Even Steven": {"ranks": (Rank.TEN, Rank.EIGHT, Rank.SIX, Rank.FOUR, Rank.TWO)},
+    "Odd Todd": {"ranks": (Rank.ACE, Rank.NINE, Rank.SEVEN, Rank.FIVE, Rank.THREE)},
+    "Scholar": {"ranks": (Rank.ACE,)},
+    "Business Card": {"face": True, "chance": 0.5, "money": 2},
+    "Walkie Talkie": {"ranks": (Rank.TEN, Rank.FOUR)},
+    "Smiley Face": {"face": True},
+    "Golden Ticket": {"enhancement": Enhancement.GOLD, "money": 4},
+    "Rough Gem": {"suit": Suit.DIAMONDS, "money": 1},
+    "Bloodstone": {"suit": Suit.HEARTS, "chance": 0.5},
+    "Arrowhead": {"suit": Suit.SPADES},
+    "Onyx Agate": {"suit": Suit.CLUBS},
+    "Photograph": {"face": True, "first": True},
+    "Triboulet": {"ranks": (Rank.KING, Rank.QUEEN)},
+    "Hack": {"ranks": (Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE)},
+    "Sock and Buskin": {"face": True},
+    "Dusk": {"when": _final_hand},
+    "Hanging Chad": {"first": True},
+    "Ancient Joker": {"state": lambda joker: {"suit": SUITS[joker.target % 4]}},
+    "The Idol": {
+        "state": lambda joker: {
+            "ranks": (RANKS[joker.target & _RANK_MASK],),
+            "suit": SUITS[joker.target >> SUIT_SHIFT & 3],
+        }
+    },
+    # For each held card
+    "Baron": {"ranks": (Rank.KING,)},
+    "Shoot the Moon": {"ranks": (Rank.QUEEN,)},
+    "Reserved Parking": {"face": True, "chance": 0.5, "money": 1},
+    "Raised Fist": {"first": True, "mult": 2, "card_count": lambda card: card.chip_value},
+    # Once per hand
+    "Joker Stencil": {
+        "lineup": lambda jokers, joker: JOKER_SLOTS
+        - len(jokers)
+        + sum(j.name == "Joker Stencil" for j in jokers)
+        - 1
+    },
+    "Half Joker": {"when": lambda ctx: len(ctx.played) <= 3, "reads_hand": True},
+    "Banner": {"count": lambda ctx: ctx.player.discards},
+    "Mystic Summit": {"when": lambda ctx: ctx.player.discards == 0},
+    "Misprint": {"spread": 23},
+    "Steel Joker": {"count": lambda ctx: ctx.deck_count(Enhancement.STEEL)},
+    "Abstract Joker": {"lineup": lambda jokers, joker: len(jokers)},
+    "Blackboard": {
+        "when": lambda ctx: all(card.suit in _DARK for card in ctx.held),
+        "reads_hand": True,
+    },
+    "Blue Joker": {"count": lambda ctx: len(ctx.deck.cards)},
+    "Erosion": {"count": lambda ctx: max(0, 52 - len(ctx.full_deck))},
+    "Stone Joker": {"count": lambda ctx: ctx.deck_count(Enhancement.STONE)},
+    "Bull": {"count": lambda ctx: max(0, ctx.player.money)},
+    "Baseball Card": {
+        "lineup": lambda jokers, joker: sum(
+            (getattr(j, "rarity", "") or "").lower() == "uncommon" for j in jokers
+        ),
+        "each": True,
+    },
+    "Acrobat": {"when": _final_hand},
+    "Swashbuckler": {
+        "lineup": lambda jokers, joker: sum(
+            calculate_sell_value(j) for j in jokers if j is not joker
+        ),
+        "is_bonus": True,
+    },
+    "Flower Pot": {"when": lambda ctx: len({card.suit for card in ctx.scoring}) == 4},
+    "Seeing Double": {"when": _seeing_double},
+    "Driver's License": {
+        "when": lambda ctx: ctx.deck_count() - ctx.deck_count(Enhancement.NONE) >= 16
+    },
+    "Bootstraps": {"count": lambda ctx: max(0, ctx.player.money) // 5},
+    "Supernova": {
+        "mult": 1,
+        "count": lambda ctx: ctx.player.hands_played.get(ctx.hand_type.name, 0) + 1,
+    },
+    "Card Sharp": {
+        "state": lambda joker: (
+            {"hands": frozenset(h for i, h in enumerate(_HANDS) if joker.counter >> i & 1)}
+            if joker.counter
+            else None
+        )
+    },
+    "Loyalty Card": {
+        "state": lambda joker: {} if joker.counter and joker.counter % 6 == 0 else None
+    },
+    # Jokers that grow: the data gives the gain per step, ``counter`` the steps.
+    "Ceremonial Dagger": {"mult": 1, "lineup": _counter},
+    "Ride the Bus": {"lineup": _counter},
+    "Runner": {"lineup": _counter, "hands": None},
+    "Constellation": {"lineup": _counter},
+    "Green Joker": {"lineup": _counter},
+    "Red Card": {"lineup": _counter},
+    "Madness": {"lineup": _counter},
+    "Square Joker": {"lineup": _counter},
+    "Vampire": {"lineup": _counter},
+    "Hologram": {"lineup": _counter},
+    "Obelisk": {"lineup": _counter},
+    "Fortune Teller": {"lineup": _counter},
+    "Spare Trousers": {"lineup": _counter, "hands": None},
+    "Castle": {"lineup": _counter},
+    "Campfire": {"lineup": _counter},
+    "Glass Joker": {"lineup": _counter},
+    "Wee Joker": {"lineup": _counter},
+    "Hit the Road": {"lineup": _counter},
+    "Canio": {"lineup": _counter},
+    "Yorick": {"lineup": lambda jokers, joker: joker.counter // 23},
+    # At the end of the round
+    "Golden Joker": {"money": 4},
+    "Rocket": {"money": 1},
+    "Cloud 9": {"money": 1, "count": lambda ctx: ctx.deck_count(rank=Rank.NINE)},
+    "Satellite": {"money": 1, "count": lambda ctx: len(ctx.player.hand_bonuses)},
+    "Delayed Gratification": {
+        "money": 2,
+        "count": lambda ctx: ctx.player.discards,
+        "state": lambda joker: None if joker.counter else {},
+    },
+}
+
+# Jokers the engine applies outside hooks: when scoring picks its cards
+# (Splash), when compiling card conditions (Pareidolia, Smeared Joker),
+# chances (Oops! All 6s) and copies (Blueprint, Brainstorm), at blind and
+# round boundaries (Riff-Raff, To the Moon, Mr. Bones), in the shop
+# (Showman, Astronomer) and when sold (Invisible Joker).
+ENGINE_RULES = frozenset(
+    {
+        "Splash",
+        "Pareidolia",
+        "Smeared Joker",
+        "Oops! All 6s",
+        "Blueprint",
+        "Brainstorm",
+        "Riff-Raff",
+        "To the Moon",
+        "Mr. Bones",
+        "Showman",
+        "Astronomer",
+        "Invisible Joker",
+    }
+)
+
+NOT_MODELLED = frozenset(
+    {
+        # Rerolls and skipped blinds (and the tags they give).
+        "Flash Card",
+        "Chaos the Clown",
+        "Throwback",
+        "Diet Cola",
+        # Boss Blind abilities: blinds only have a score to reach.
+        "Matador",
+        "Luchador",
+        "Chicot",
+        # Lucky cards triggering, permanent chips on playing cards, sell
+        # values of consumables (shared between game clones) and Negative
+        # consumables.
+        "Lucky Cat",
+        "Hiker",
+        "Gift Card",
+        "Perkeo",
+    }
+)
+
+# Jokers that change the rules of the round rather than score: extra
+# ``hand_size``, ``hands`` and ``discards`` each round, how much ``debt``
+# money may go into, and the :class:`~balatro.core.poker.HandRules` that
+# decide which cards make a hand.  Amounts are numbers or functions of
+# the Joker.
+RULES: dict[str, dict] = {
+    "Juggler": {"hand_size": 1},
+    "Troubadour": {"hand_size": 2, "hands": -1},
+    "Merry Andy": {"hand_size": -1, "discards": 3},
+    "Turtle Bean": {"hand_size": lambda joker: max(0, 5 - joker.counter)},
+    "Drunkard": {"discards": 1},
+    "Credit Card": {"debt": 20},
+    "Four Fingers": {"four_fingers": True},
+    "Shortcut": {"shortcut": True},
+}
+
+
+class RuleChanges(NamedTuple):
+    """The :data:`RULES` of a Joker lineup, added up."""
+
+    hand_size: int = 0
+    hands: int = 0
+    discards: int = 0
+    debt: int = 0
+    hand_rules: HandRules = NO_RULES
+
+
+def compile_rules(jokers) -> RuleChanges:
+    """What the :data:`RULES` of ``jokers`` change; debuffed Jokers change nothing.
+
+    Amounts add up, except ``debt``: two Credit Cards still stop at -$20.
+    """
+
+    amounts = {"hand_size": 0, "hands": 0, "discards": 0, "debt": 0}
+    flags = {}
+    for joker in jokers:
+        spec = RULES.get(joker.name)
+        if spec is None or joker.is_debuffed:
+            continue
+        for key, value in spec.items():
+            if callable(value):
+                value = value(joker)
+            if key == "debt":
+                amounts[key] = max(amounts[key], value)
+            elif key in amounts:
+                amounts[key] += value
+            else:
+                flags[key] = value
+    if not (flags or any(amounts.values())):
+        return _NO_CHANGES
+    return RuleChanges(**amounts, hand_rules=HandRules(**flags) if flags else NO_RULES)
+
+
+_NO_CHANGES = RuleChanges()
+
+# Jokers that copy another Joker's hooks: the one to their right, or the
+# leftmost.
+_COPIES = {"Blueprint": 1, "Brainstorm": None}
+
+
+def _phase(joker) -> str | None:
+    if joker.effect_type == "+$" and joker.activation == "N/A":
+        return END_OF_ROUND
+    return ACTIVATIONS.get(joker.activation)
+
+
+# Card keys by (ranks, suits), shared by every compile.
+_KEYS: dict[tuple, frozenset[int]] = {}
+
+
+def _hands(hand: PokerHand | None) -> frozenset[PokerHand] | None:
+    if hand is None:
+        return None
+    return CONTAINED_IN.get(hand, frozenset({hand}))
+
+
+def _card_keys(spec: dict, faces: tuple, smeared: bool) -> frozenset[int] | None:
+    ranks = spec.get("ranks")
+    if spec.get("face"):
+        ranks = faces
+    suit = spec.get("suit")
+    suits = None if suit is None else (_SMEARED[suit] if smeared else (suit,))
+    if ranks is None and suits is None:
+        return None
+    key = (ranks, suits)
+    keys = _KEYS.get(key)
+    if keys is None:
+        keys = _KEYS[key] = card_keys(ranks or RANKS, suits or SUITS)
+    return keys
+
+
+def compile_joker(joker, jokers, faces: tuple = FACES, smeared: bool = False) -> list[Hook]:
+    """Hooks for ``joker`` in the lineup ``jokers``.
+
+    ``faces`` are the ranks that count as face cards and ``smeared``
+    whether suits of one colour count as the same suit.
+    """
+
+    name = joker.name
+    if name in NOT_MODELLED or name in ENGINE_RULES or name in RULES:
+        return []
+    spec = CONDITIONS.get(name, {})
+    state = spec.get("state")
+    if state is not None:
+        overrides = state(joker)
+        if overrides is None:
+            return []
+        spec = {**spec, **overrides}
+    phase = _phase(joker)
+    if phase is None:
+        return []
+    kind = joker.effect_type
+    chips = spec.get("chips", joker.chip_bonus if kind in ("+c", "++") else 0)
+    mult = spec.get("mult", joker.mult_bonus if kind in ("+m", "++") else 0)
+    factor = spec.get("factor", joker.mult_multiplier if kind == "Xm" else 1)
+    retrigger = joker.retrigger if kind == "..." else 0
+    count = spec.get("count") or spec.get("card_count")
+    repeat = 1
+    lineup = spec.get("lineup")
+    # Counted factors are given as the increment per unit (X0.2 per Steel
+    # card); Joker Stencil's X1 per empty slot is left out of the data.
+    if lineup is not None:
+        n = max(0, lineup(jokers, joker))
+        if spec.get("each"):
+            repeat = n
+        elif kind == "Xm":
+            factor = 1 + factor * n
+        else:
+            chips *= n
+            mult *= n
+    elif count is not None and kind == "Xm":
+        factor = 1 + factor
+    hook = Hook(
+        name,
+        phase,
+        chips=chips,
+        mult=mult,
+        factor=factor,
+        money=spec.get("money", 0) if kind == "+$" else 0,
+        retrigger=retrigger,
+        cards=_card_keys(spec, faces, smeared),
+        enhancement=spec.get("enhancement"),
+        hands=spec["hands"] if "hands" in spec else _hands(joker.trigger_hand),
+        first=spec.get("first", False),
+        chance=spec.get("chance", 1),
+        spread=spec.get("spread", 0),
+        when=spec.get("when"),
+        count=spec.get("count"),
+        card_count=spec.get("card_count"),
+        reads_hand=spec.get("reads_hand", False),
+        is_bonus=spec.get("is_bonus", False),
+    )
+    if not (
+        hook.chips
+        or hook.mult
+        or hook.factor != 1
+        or hook.money
+        or hook.retrigger
+        or hook.spread
+    ):
+        return []
+    return [hook] * repeat
+
+
+def compile_lineup(jokers) -> list[Hook]:
+    """Hooks of every Joker in ``jokers``, in lineup order.
+
+    Debuffed Jokers compile to nothing; Blueprint and Brainstorm compile
+    to the hooks of the Joker they copy, under their own name.
+    """
+
+    jokers = list(jokers)
+    names = {joker.name for joker in jokers}
+    faces = tuple(RANKS) if "Pareidolia" in names else FACES
+    smeared = "Smeared Joker" in names
+    hooks: list[Hook] = []
+    for index, joker in enumerate(jokers):
+        if joker.is_debuffed:
+            continue
+        target = _copied(jokers, index)
+        if target is None:
+            continue
+        name = joker.name
+        hooks.extend(
+            hook._replace(name=name, order=index)
+            for hook in compile_joker(target, jokers, faces, smeared)
+        )
+    return hooks
+
+
+def _copied(jokers: list, index: int):
+    """The Joker whose effect ``jokers[index]`` has, following copies."""
+
+    seen = set()
+    while jokers[index].name in _COPIES:
+        seen.add(index)
+        step = _COPIES[jokers[index].name]
+        index = 0 if step is None else index + step
+        if index >= len(jokers) or index in seen or jokers[index].is_debuffed:
+            return None
+    return jokers[index]
+
+# Game events that change Joker state, with what :func:`advance` is told:
+BLIND_SELECTED = "blind selected"  # boss: whether it is the Boss Blind
+HAND_PLAYED = "hand played"  # hand_type, played, scoring; before scoring
+HAND_SCORED = "hand scored"  # hand_type, played (rules may destroy some); after scoring
+DISCARDED = "discarded"  # cards
+CONSUMABLE_USED = "consumable used"  # card, added and destroyed cards
+PACK_OPENED = "pack opened"
+PACK_SKIPPED = "pack skipped"
+CARD_SOLD = "card sold"  # item
+BOSS_DEFEATED = "boss defeated"
+ROUND_ENDED = "round ended"  # after the blind is cleared and paid out
+
+
+def _eternal(joker) -> bool:
+    return any(s.sticker_type is StickerType.ETERNAL for s in joker.stickers)
+
+
+def _faces(game) -> tuple:
+    return tuple(RANKS) if any(j.name == "Pareidolia" for j in game.player.jokers) else FACES
+
+
+def _gain(joker, amount: int = 1) -> bool:
+    joker.counter += amount
+    return amount != 0
+
+
+def _reset(joker) -> bool:
+    changed = joker.counter != 0
+    joker.counter = 0
+    return changed
+
+
+def _gain_if_contains(hand: PokerHand):
+    hands = _hands(hand)
+    return lambda joker, game, facts: _gain(joker, facts["hand_type"] in hands)
+
+
+def _ride_the_bus(joker, game, facts) -> bool:
+    faces = _faces(game)
+    if any(card.rank in faces for card in facts["scoring"]):
+        return _reset(joker)
+    return _gain(joker)
+
+
+def _vampire(joker, game, facts) -> bool:
+    enhanced = [card for card in facts["scoring"] if card.enhancement is not Enhancement.NONE]
+    for card in enhanced:
+        card.enhancement = Enhancement.NONE
+    return _gain(joker, len(enhanced))
+
+
+def _obelisk(joker, game, facts) -> bool:
+    played = game.player.hands_played
+    most = max(played.values(), default=0)
+    if most and played.get(facts["hand_type"].name, 0) == most:
+        return _reset(joker)
+    return _gain(joker)
+
+
+def _card_sharp(joker, game, facts) -> bool:
+    bit = 1 << _HANDS.index(facts["hand_type"])
+    if joker.counter & bit:
+        return False
+    joker.counter |= bit
+    return True
+
+
+def _green_joker_discard(joker, game, facts) -> bool:
+    return joker.counter > 0 and _gain(joker, -1)
+
+
+def _new_suit(joker, game, facts) -> bool:
+    joker.target = game.rng.jokers.randrange(len(SUITS))
+    return True
+
+
+def _new_card(joker, game, facts) -> bool:
+    cards = ScoreContext(game).full_deck
+    if not cards:
+        return False
+    joker.target = game.rng.jokers.choice(cards).code & KEY_MASK
+    return True
+
+
+def _destroy(game, joker, victim) -> None:
+    game.player.jokers.remove(victim)
+    game.emit(Notice(joker.name, f"{joker.name} destroyed {victim.name}."))
+
+
+def _ceremonial_dagger(joker, game, facts) -> bool:
+    jokers = game.player.jokers
+    index = next(i for i, j in enumerate(jokers) if j is joker) + 1
+    if index >= len(jokers) or _eternal(jokers[index]):
+        return False
+    victim = jokers[index]
+    _destroy(game, joker, victim)
+    return _gain(joker, 2 * calculate_sell_value(victim))
+
+
+def _madness(joker, game, facts) -> bool:
+    if facts["boss"]:
+        return False
+    others = [j for j in game.player.jokers if j is not joker and not _eternal(j)]
+    if others:
+        _destroy(game, joker, game.rng.jokers.choice(others))
+    return _gain(joker)
+
+
+def _used(kind: str):
+    def rule(joker, game, facts) -> bool:
+        return _gain(joker, type(facts["card"]).__name__ == kind)
+
+    return rule
+
+
+def _first(joker) -> bool:
+    """Whether this is the first time this round; marks the round as seen."""
+
+    first = not joker.counter
+    joker.counter = 1
+    return first
+
+
+def _chance(game, odds: float) -> bool:
+    """Roll a ``odds`` chance, doubled by each Oops! All 6s."""
+
+    return game.rng.jokers.random() < odds * game.player.joker_pipeline.chance_scale
+
+
+def _pay(game, joker, amount: int) -> None:
+    if amount:
+        game.player.money += amount
+        game.emit(JokerPayout(joker.name, amount, game.player.money))
+
+
+def _create(game, kind: str) -> None:
+    """Add a random ``kind`` ("tarot" or "spectral") card to the consumables, if there is room."""
+
+    from ..cards.spectral_cards import SPECTRAL_CARDS
+    from ..cards.tarot_cards import TAROT_CARDS
+
+    if game.player.has_consumable_space():
+        catalog = TAROT_CARDS if kind == "tarot" else SPECTRAL_CARDS
+        card = catalog.choice(game.rng.jokers)
+        game.emit(ItemGained(card, game.player.add_consumable(card)))
+
+
+def _creates(kind: str, condition, odds: float = 1):
+    """A rule creating a ``kind`` card when ``condition(game, facts)`` holds."""
+
+    def rule(joker, game, facts) -> bool:
+        if condition(game, facts) and (odds >= 1 or _chance(game, odds)):
+            _create(game, kind)
+        return False
+
+    return rule
+
+
+def _level_up(game, joker, hand: PokerHand | None) -> None:
+    """Upgrade ``hand`` as its Planet card does."""
+
+    from ..cards.planet_cards import PLANET_CARDS
+
+    for planet in PLANET_CARDS.definitions:
+        if planet.poker_hand_type == getattr(hand, "value", None):
+            game.player.add_hand_bonus(hand, planet.chips_bonus, planet.mult_bonus)
+            game.emit(Notice(joker.name, f"{joker.name} upgraded {hand.value}."))
+            return
+
+
+def _add_card(game, joker, card: Card) -> None:
+    """Add a new playing card to the deck; it is drawn like any other."""
+
+    game.deck.return_cards([card])
+    game.emit(Notice(joker.name, f"{joker.name} added {card} to the deck."))
+
+
+def _burglar(joker, game, facts) -> bool:
+    game.player.hands += 3
+    game.player.discards = 0
+    return False
+
+
+def _turtle_bean(joker, game, facts) -> bool:
+    joker.counter += 1
+    if joker.counter >= 5:
+        game.player.jokers.remove(joker)
+        game.emit(Notice(joker.name, f"{joker.name} was eaten."))
+    return True
+
+
+def _new_hand(joker, game, facts) -> bool:
+    joker.target = game.rng.jokers.randrange(len(_HANDS))
+    return True
+
+
+def _new_rank(joker, game, facts) -> bool:
+    cards = ScoreContext(game).full_deck
+    if not cards:
+        return False
+    joker.target = game.rng.jokers.choice(cards).code & _RANK_MASK
+    return True
+
+
+def _faceless(joker, game, facts) -> bool:
+    faces = _faces(game)
+    if sum(card.rank in faces for card in facts["cards"]) >= 3:
+        _pay(game, joker, 5)
+    return False
+
+
+def _mail_in_rebate(joker, game, facts) -> bool:
+    rank = RANKS[joker.target & _RANK_MASK]
+    _pay(game, joker, 5 * sum(card.rank is rank for card in facts["cards"]))
+    return False
+
+
+def _trading_card(joker, game, facts) -> bool:
+    cards = facts["cards"]
+    pile = game.deck.discard_pile
+    if _first(joker) and len(cards) == 1 and cards[0] in pile:
+        pile.remove(cards[0])
+        game.deck.destroy(cards)
+        game.emit(Notice(joker.name, f"{joker.name} destroyed {cards[0]}."))
+        _pay(game, joker, 3)
+    return False
+
+
+def _burnt_joker(joker, game, facts) -> bool:
+    if _first(joker):
+        rules = game.player.joker_pipeline.rules.hand_rules
+        _level_up(game, joker, evaluate_hand_cached(facts["cards"], rules)[0])
+    return False
+
+
+def _to_do_list(joker, game, facts) -> bool:
+    if facts["hand_type"] is _HANDS[joker.target % len(_HANDS)]:
+        _pay(game, joker, 4)
+    return False
+
+
+def _space_joker(joker, game, facts) -> bool:
+    if _chance(game, 0.25):
+        _level_up(game, joker, facts["hand_type"])
+    return False
+
+
+def _midas_mask(joker, game, facts) -> bool:
+    faces = _faces(game)
+    for card in facts["scoring"]:
+        if card.rank in faces:
+            card.enhancement = Enhancement.GOLD
+    return False
+
+
+def _eight_ball(joker, game, facts) -> bool:
+    for card in facts["scoring"]:
+        if card.rank is Rank.EIGHT and _chance(game, 0.25):
+            _create(game, "tarot")
+    return False
+
+
+def _dna(joker, game, facts) -> bool:
+    played = facts["played"]
+    if _first(joker) and len(played) == 1:
+        copy = played[0].copy()
+        game.player.hand.append(copy)
+        game.emit(Notice(joker.name, f"{joker.name} added a copy of {copy} to the hand."))
+    return False
+
+
+def _sixth_sense(joker, game, facts) -> bool:
+    played = facts["played"]
+    if _first(joker) and len(played) == 1 and played[0].rank is Rank.SIX:
+        card = played.pop()
+        game.deck.destroy([card])
+        game.emit(Notice(joker.name, f"{joker.name} destroyed {card}."))
+        _create(game, "spectral")
+    return False
+
+
+def _marble_joker(joker, game, facts) -> bool:
+    rng = game.rng.jokers
+    _add_card(game, joker, Card(rng.choice(SUITS), rng.choice(RANKS), Enhancement.STONE))
+    return False
+
+
+def _certificate(joker, game, facts) -> bool:
+    # The hand is drawn after the blind is selected, so the card joins the
+    # deck rather than the hand.
+    rng = game.rng.jokers
+    seal = rng.choice([seal for seal in Seal if seal is not Seal.NONE])
+    _add_card(game, joker, Card(rng.choice(SUITS), rng.choice(RANKS), seal=seal))
+    return False
+
+
+def _reset_round(joker, game, facts) -> bool:
+    return _reset(joker)
+
+
+# How each Joker's ``counter`` and ``target`` change on each event, and
+# what it does to the game then.  A rule is called with the Joker, the
+# game and the event's facts and returns whether it changed anything the
+# Joker scores with.
+GROWTH: dict[str, dict[str, Callable[..., bool]]] = {
+    "Ride the Bus": {HAND_PLAYED: _ride_the_bus},
+    "Green Joker": {
+        HAND_PLAYED: lambda joker, game, facts: _gain(joker),
+        DISCARDED: _green_joker_discard,
+    },
+    "Runner": {HAND_PLAYED: _gain_if_contains(PokerHand.STRAIGHT)},
+    "Spare Trousers": {HAND_PLAYED: _gain_if_contains(PokerHand.TWO_PAIR)},
+    "Square Joker": {HAND_PLAYED: lambda joker, game, facts: _gain(joker, len(facts["played"]) == 4)},
+    "Wee Joker": {
+        HAND_PLAYED: lambda joker, game, facts: _gain(
+            joker, sum(card.rank is Rank.TWO for card in facts["scoring"])
+        )
+    },
+    "Loyalty Card": {HAND_PLAYED: lambda joker, game, facts: _gain(joker)},
+    "Vampire": {HAND_PLAYED: _vampire},
+    "Obelisk": {HAND_PLAYED: _obelisk},
+    "Card Sharp": {HAND_SCORED: _card_sharp, BLIND_SELECTED: lambda joker, game, facts: _reset(joker)},
+    "Hit the Road": {
+        DISCARDED: lambda joker, game, facts: _gain(
+            joker, sum(card.rank is Rank.JACK for card in facts["cards"])
+        ),
+        BLIND_SELECTED: lambda joker, game, facts: _reset(joker),
+    },
+    "Castle": {
+        DISCARDED: lambda joker, game, facts: _gain(
+            joker, sum(card.suit is SUITS[joker.target % 4] for card in facts["cards"])
+        ),
+        BLIND_SELECTED: _new_suit,
+    },
+    "Yorick": {DISCARDED: lambda joker, game, facts: _gain(joker, len(facts["cards"]))},
+    "Constellation": {CONSUMABLE_USED: _used("PlanetCard")},
+    "Fortune Teller": {CONSUMABLE_USED: _used("TarotCard")},
+    "Hologram": {CONSUMABLE_USED: lambda joker, game, facts: _gain(joker, len(facts["added"]))},
+    "Glass Joker": {
+        CONSUMABLE_USED: lambda joker, game, facts: _gain(
+            joker, sum(c.enhancement is Enhancement.GLASS for c in facts["destroyed"])
+        )
+    },
+    "Canio": {
+        CONSUMABLE_USED: lambda joker, game, facts: _gain(
+            joker, sum(c.rank in _faces(game) for c in facts["destroyed"])
+        )
+    },
+    "Red Card": {PACK_SKIPPED: lambda joker, game, facts: _gain(joker)},
+    "Campfire": {
+        CARD_SOLD: lambda joker, game, facts: _gain(joker),
+        BOSS_DEFEATED: lambda joker, game, facts: _reset(joker),
+    },
+    "Ancient Joker": {BLIND_SELECTED: _new_suit},
+    "The Idol": {BLIND_SELECTED: _new_card},
+    "Ceremonial Dagger": {BLIND_SELECTED: _ceremonial_dagger},
+    "Madness": {BLIND_SELECTED: _madness},
+    "Delayed Gratification": {
+        DISCARDED: lambda joker, game, facts: _gain(joker, not joker.counter),
+        BLIND_SELECTED: _reset_round,
+    },
+    # Money
+    "Faceless Joker": {DISCARDED: _faceless},
+    "Mail-In Rebate": {DISCARDED: _mail_in_rebate, BLIND_SELECTED: _new_rank},
+    "Trading Card": {DISCARDED: _trading_card, BLIND_SELECTED: _reset_round},
+    "To Do List": {HAND_PLAYED: _to_do_list, BLIND_SELECTED: _new_hand},
+    "Egg": {ROUND_ENDED: lambda joker, game, facts: _gain(joker, 3)},
+    # Hand levels and playing cards
+    "Space Joker": {HAND_PLAYED: _space_joker},
+    "Burnt Joker": {DISCARDED: _burnt_joker, BLIND_SELECTED: _reset_round},
+    "Midas Mask": {HAND_PLAYED: _midas_mask},
+    "DNA": {HAND_PLAYED: _dna, BLIND_SELECTED: _reset_round},
+    "Marble Joker": {BLIND_SELECTED: _marble_joker},
+    "Certificate": {BLIND_SELECTED: _certificate},
+    # Consumables
+    "8 Ball": {HAND_PLAYED: _eight_ball},
+    "Superposition": {
+        HAND_PLAYED: _creates(
+            "tarot",
+            lambda game, facts: facts["hand_type"] in CONTAINED_IN[PokerHand.STRAIGHT]
+            and any(card.rank is Rank.ACE for card in facts["scoring"]),
+        )
+    },
+    "Vagabond": {HAND_PLAYED: _creates("tarot", lambda game, facts: game.player.money <= 4)},
+    "Séance": {
+        HAND_PLAYED: _creates(
+            "spectral", lambda game, facts: facts["hand_type"] is PokerHand.STRAIGHT_FLUSH
+        )
+    },
+    "Sixth Sense": {HAND_SCORED: _sixth_sense, BLIND_SELECTED: _reset_round},
+    "Cartomancer": {BLIND_SELECTED: _creates("tarot", lambda game, facts: True)},
+    "Hallucination": {PACK_OPENED: _creates("tarot", lambda game, facts: True, 0.5)},
+    # Rule changes
+    "Burglar": {BLIND_SELECTED: _burglar},
+    "Turtle Bean": {ROUND_ENDED: _turtle_bean},
+    "Invisible Joker": {ROUND_ENDED: lambda joker, game, facts: _gain(joker)},
+}
+
+# Jokers whose rules change playing cards, which a game sharing its cards
+# with a clone must copy first.
+CHANGES_CARDS = frozenset({"Vampire", "Midas Mask"})
+
+
+def advance(game, event: str, **facts) -> None:
+    """Apply the :data:`GROWTH` rules of ``game``'s Jokers for ``event``.
+
+    Debuffed Jokers do not change; the lineup is recompiled when any Joker
+    did.
+    """
+
+    player = game.player
+    changed = False
+    for joker in list(player.jokers):
+        rule = GROWTH.get(joker.name, {}).get(event)
+        if rule is None or joker.is_debuffed or joker not in player.jokers:
+            continue
+        changed = rule(joker, game, facts) or changed
+    if changed:
+        player.invalidate_jokers()
+
+
+def hook_amounts(hook: Hook, card: Card | None, context: ScoreContext | None):
+    """``(chips, mult added, factor, money)`` of ``hook``, or ``None`` if it does not fire.
+
+    Checks every condition but ``cards``, ``hands`` and ``chance``, which
+    the pipeline's indexes and the caller's roll take care of.  Hooks
+    that read the game state never fire without a ``context``.
+    """
+
+    if hook.enhancement is not None and (card is None or card.enhancement is not hook.enhancement):
+        return None
+    when = hook.when
+    count = hook.count
+    if hook.card_count is not None:
+        n = hook.card_count(card)
+    elif when is None and count is None:
+        return hook.chips, hook.mult, hook.factor, hook.money
+    elif context is None:
+        return None
+    else:
+        context.card = card
+        if when is not None and not when(context):
+            return None
+        if count is None:
+            return hook.chips, hook.mult, hook.factor, hook.money
+        n = count(context)
+    if n <= 0:
+        return None
+    return hook.chips * n, hook.mult * n, 1 + (hook.factor - 1) * n, hook.money * n
+
+
+__all__ = [
+    "BLIND_SELECTED",
+    "BOSS_DEFEATED",
+    "CARD_SOLD",
+    "CHANGES_CARDS",
+    "CONDITIONS",
+    "CONSUMABLE_USED",
+    "DISCARDED",
+    "GROWTH",
+    "HAND_PLAYED",
+    "HAND_SCORED",
+    "PACK_OPENED",
+    "PACK_SKIPPED",
+    "ROUND_ENDED",
+    "RULES",
+    "RuleChanges",
+    "advance",
+    "END_OF_ROUND",
+    "ENGINE_RULES",
+    "HELD",
+    "Hook",
+    "INDEPENDENT",
+    "NOT_MODELLED",
+    "PHASES",
+    "SCORED",
+    "ScoreContext",
+    "compile_joker",
+    "compile_lineup",
+    "compile_rules",
+    "hook_amounts",
+]
@@ -0,0 +1,317 @@
+"""Compiled Joker scoring pipeline.
+
+Scoring used to walk every Joker on every hand, comparing names and
+recomputing values such as Swashbuckler's sell-value total.  A
+:class:`JokerPipeline` does that work once: the Joker lineup is compiled
+into :class:`~balatro.core.joker_effects.Hook` records
+(:mod:`balatro.core.joker_effects`) and indexed by phase and condition,
+so scoring a hand only visits hooks that can fire:
+
+* per-card hooks by card key (rank and suit), separately for scoring and
+  held cards, with the retriggers of each key summed up front;
+* once-per-hand hooks by the hand types they trigger on;
+* end-of-round hooks in a list of their own.
+
+:class:`JokerList` is the list type held by ``Player.jokers``.  It bumps a
+version number on every mutation so the player's pipeline is rebuilt only
+when Jokers are bought, sold, reordered or created.  Changes made to a
+Joker in place (debuffs, editions) must be signalled with
+``Player.invalidate_jokers``.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from .joker_effects import (
+    CARD_KEYS,
+    END_OF_ROUND,
+    HELD,
+    INDEPENDENT,
+    KEY_MASK,
+    SCORED,
+    Hook,
+    ScoreContext,
+    compile_lineup,
+    compile_rules,
+    hook_amounts,
+)
+from .poker import PokerHand
+from .score_trace import JOKER, JOKER_BONUS, ScoreTrace
+
+_NO_HOOKS: tuple[Hook, ...] = ()
+
+
+class JokerPipeline:
+    """Joker effects compiled into hooks indexed by phase and condition.
+
+    ``scored`` and ``held`` hold the per-card hooks for each card key
+    (``card.code & KEY_MASK``) and ``scored_retriggers`` and
+    ``held_retriggers`` the extra triggers each key always gets.  Hooks
+    that only fire on one card of a hand (``first``) or whose retriggers
+    depend on the game state are kept apart in ``scored_first``,
+    ``held_first`` and ``retrigger_hooks``.  ``ops_by_hand`` has the
+    once-per-hand hooks of each hand type, in Joker order.  ``rules``
+    are the lineup's :data:`~balatro.core.joker_effects.RULES` added up.
+    """
+
+    def __init__(self, jokers: Iterable) -> None:
+        jokers = list(jokers)
+        names = [joker.name for joker in jokers]
+        self.splash = "Splash" in names
+        self.chance_scale = 2 ** names.count("Oops! All 6s")
+        self.hooks = tuple(compile_lineup(jokers))
+        self.rules = compile_rules(jokers)
+
+        # Hooks by card key, only for the keys some hook matches.
+        scored: dict[int, list[Hook]] = {}
+        held: dict[int, list[Hook]] = {}
+        scored_retriggers = [0] * CARD_KEYS
+        held_retriggers = [0] * CARD_KEYS
+        scored_first: list[Hook] = []
+        held_first: list[Hook] = []
+        retrigger_hooks: list[Hook] = []
+        independent: list[Hook] = []
+        end_of_round: list[Hook] = []
+        for hook in self.hooks:
+            phase = hook.phase
+            if phase == INDEPENDENT:
+                independent.append(hook)
+                continue
+            if phase == END_OF_ROUND:
+                end_of_round.append(hook)
+                continue
+            is_held = phase == HELD
+            keys = range(CARD_KEYS) if hook.cards is None else hook.cards
+            if hook.first:
+                (held_first if is_held else scored_first).append(hook)
+            elif hook.retrigger and hook.when is None and hook.enhancement is None:
+                counts = held_retriggers if is_held else scored_retriggers
+                for key in keys:
+                    counts[key] += hook.retrigger
+            elif hook.retrigger:
+                retrigger_hooks.append(hook)
+            else:
+                table = held if is_held else scored
+                for key in keys:
+                    table.setdefault(key, []).append(hook)
+
+        self.scored = _by_key(scored)
+        self.held = _by_key(held)
+        self.scored_retriggers = tuple(scored_retriggers)
+        self.held_retriggers = tuple(held_retriggers)
+        self.scored_first = tuple(scored_first)
+        self.held_first = tuple(held_first)
+        self.retrigger_hooks = tuple(retrigger_hooks)
+        by_hand: dict[PokerHand, list[Hook]] = {hand: [] for hand in PokerHand}
+        for hook in independent:
+            for hand in PokerHand if hook.hands is None else hook.hands:
+                by_hand[hand].append(hook)
+        self.ops_by_hand = {hand: tuple(hooks) for hand, hooks in by_hand.items()}
+        self.end_of_round_hooks = tuple(end_of_round)
+        # Whether scoring has to look at individual cards beyond their own
+        # effects, at the held cards, whether any hook reads the game state
+        # and whether any reads the cards played or held.
+        self.per_card = any(h.phase in (SCORED, HELD) for h in self.hooks)
+        self.per_held = any(h.phase == HELD for h in self.hooks)
+        self.needs_context = any(h.when or h.count for h in self.hooks)
+        self.reads_hand = any(h.reads_hand for h in self.hooks)
+
+    def __repr__(self) -> str:
+        return (
+            f"JokerPipeline(hooks={len(self.hooks)}, splash={self.splash}, "
+            f"per_card={self.per_card})"
+        )
+
+    def triggers(self, cards, context: ScoreContext | None = None, held: bool = False) -> list[int]:
+        """How many times each of ``cards`` (the scoring or the held cards) is triggered."""
+
+        retriggers = self.held_retriggers if held else self.scored_retriggers
+        counts = [1 + retriggers[card.code & KEY_MASK] for card in cards]
+        phase = HELD if held else SCORED
+        for hook in self.retrigger_hooks:
+            if hook.phase != phase:
+                continue
+            if hook.when is not None and (context is None or not hook.when(context)):
+                continue
+            for i, card in enumerate(cards):
+                if (hook.cards is None or card.code & KEY_MASK in hook.cards) and (
+                    hook.enhancement is None or card.enhancement is hook.enhancement
+                ):
+                    counts[i] += hook.retrigger
+        for hook in self.held_first if held else self.scored_first:
+            if hook.retrigger:
+                i = self._lowest(hook, cards) if held else self._first(hook, cards)
+                if i is not None:
+                    counts[i] += hook.retrigger
+        return counts
+
+    def card_hooks(self, cards, held: bool = False) -> list[tuple[Hook, ...]]:
+        """The hooks (other than retriggers) that fire on each of ``cards``, in lineup order.
+
+        ``first`` scoring hooks fire on the first of ``cards`` they match,
+        held-card ones on the lowest-ranked card.
+        """
+
+        table = self.held if held else self.scored
+        hooks = [table[card.code & KEY_MASK] for card in cards]
+        for hook in self.held_first if held else self.scored_first:
+            if hook.retrigger:
+                continue
+            i = self._lowest(hook, cards) if held else self._first(hook, cards)
+            if i is not None:
+                hooks[i] = tuple(sorted(hooks[i] + (hook,), key=_lineup_order))
+        return hooks
+
+    @staticmethod
+    def _first(hook: Hook, cards) -> int | None:
+        for i, card in enumerate(cards):
+            if hook.cards is None or card.code & KEY_MASK in hook.cards:
+                return i
+        return None
+
+    @staticmethod
+    def _lowest(hook: Hook, cards) -> int | None:
+        matching = [
+            i for i, card in enumerate(cards) if hook.cards is None or card.code & KEY_MASK in hook.cards
+        ]
+        if not matching:
+            return None
+        return min(reversed(matching), key=lambda i: cards[i].rank_value)
+
+    def apply(
+        self,
+        hand_type: PokerHand,
+        chips: float,
+        mult: float,
+        trace: ScoreTrace | None = None,
+        context: ScoreContext | None = None,
+        roll=None,
+        payouts: list | None = None,
+    ) -> tuple[float, float]:
+        """Apply the once-per-hand Joker effects for ``hand_type``.
+
+        Effects that read the game state need ``context``; ``roll`` is a
+        ``random.random``-style callable for random effects, which never
+        trigger without one.  Money earned goes to ``payouts``.
+        """
+
+        scale = self.chance_scale
+        for hook in self.ops_by_hand[hand_type]:
+            chips, mult = fire(hook, chips, mult, None, context, roll, scale, trace, payouts)
+        return chips, mult
+
+    def end_of_round(self, context: ScoreContext) -> list[tuple[str, int]]:
+        """``(Joker name, amount)`` of each end-of-round payout."""
+
+        payouts = []
+        for hook in self.end_of_round_hooks:
+            amounts = hook_amounts(hook, None, context)
+            if amounts is not None and amounts[3]:
+                payouts.append((hook.name, int(amounts[3])))
+        return payouts
+
+
+def _lineup_order(hook: Hook) -> int:
+    return hook.order
+
+
+def _by_key(hooks: dict[int, list[Hook]]) -> tuple[tuple[Hook, ...], ...]:
+    table = [_NO_HOOKS] * CARD_KEYS
+    for key, matching in hooks.items():
+        table[key] = tuple(matching)
+    return tuple(table)
+
+
+def fire(
+    hook: Hook,
+    chips: float,
+    mult: float,
+    card,
+    context: ScoreContext | None,
+    roll,
+    chance_scale: float = 1,
+    trace: ScoreTrace | None = None,
+    payouts: list | None = None,
+) -> tuple[float, float]:
+    """Apply ``hook`` (on ``card``, for per-card hooks) to ``chips`` and ``mult``.
+
+    Money goes to ``payouts`` as ``(Joker name, amount)``.  Random hooks
+    roll with ``roll`` and never fire without it.
+    """
+
+    if hook.chance < 1 and (roll is None or roll() >= hook.chance * chance_scale):
+        return chips, mult
+    amounts = hook_amounts(hook, card, context)
+    if amounts is None:
+        return chips, mult
+    added_chips, added_mult, factor, money = amounts
+    if hook.spread and roll is not None:
+        added_mult += int(roll() * (hook.spread + 1))
+    if money and payouts is not None:
+        payouts.append((hook.name, int(money)))
+    if not (added_chips or added_mult or factor != 1):
+        return chips, mult
+    chips += added_chips
+    mult = (mult + added_mult) * factor
+    if trace is not None:
+        if hook.is_bonus:
+            trace.add(hook.name, JOKER_BONUS, 0, added_mult)
+        else:
+            trace.add(hook.name, JOKER, added_chips, added_mult, factor)
+    return chips, mult
+
+
+class JokerList(list):
+    """A list of Jokers that counts its own mutations in ``version``."""
+
+    version = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items):
+        result = super().__iadd__(items)
+        self._changed()
+        return result
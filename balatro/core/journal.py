@@ -0,0 +1,311 @@
+"""Append-only autosave journal with batched fsync and compaction.
+
+A :class:`Journal` keeps a game recoverable after the process is killed
+without rewriting a save file on every action.  It stores:
+
+* ``<base>.snapshot``: the game at some point, in the binary save format
+  of :mod:`balatro.core.binary_save`, tagged with a generation number;
+* ``<base>.<generation>.journal``: segments of the actions taken since
+  the snapshot of that generation, one :func:`encode_action` line each.
+
+Each action is appended to the current segment and flushed to the
+operating system, which costs a few microseconds and already survives
+the process being killed.  ``fsync`` (which makes the data survive a
+crash of the machine as well) is batched: a background thread syncs the
+segment every ``fsync_interval`` seconds.
+
+Every ``compact_every`` actions, at the next point where the game waits
+for a play or discard, the journal is compacted: the game is encoded on
+the calling thread, a new segment is started, and the background thread
+writes the snapshot atomically (temporary file, fsync, rename) and only
+then deletes the segments it replaces.  A crash at any point leaves a
+snapshot and the segments that follow it, so :meth:`Journal.recover`
+loads the snapshot and replays the tail.  Snapshots are only taken while
+playing a blind because the save format does not hold shop or pack
+contents.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import struct
+import threading
+from pathlib import Path
+from typing import IO
+
+from .action_log import decode_action, encode_action
+from .binary_save import dumps, loads
+from .game import Game, Phase
+
+FORMAT = "balatro-journal"
+FORMAT_VERSION = 1
+
+SNAPSHOT_MAGIC = b"BLJS"
+_SNAPSHOT = struct.Struct("<4sQ")
+
+# Stops the background thread.
+_STOP = object()
+
+
+def _segments(base: Path) -> dict[int, Path]:
+    """Existing journal segments of ``base`` by generation."""
+
+    found = {}
+    prefix = base.name + "."
+    for path in base.parent.glob(base.name + ".*.journal"):
+        generation = path.name[len(prefix) : -len(".journal")]
+        if generation.isdigit():
+            found[int(generation)] = path
+    return found
+
+
+def _valid_header(line: bytes) -> bool:
+    """Whether ``line`` is a complete journal segment header."""
+
+    if not line.endswith(b"\n"):
+        return False
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return False
+    return isinstance(header, dict) and header.get("format") == FORMAT
+
+
+def _write_durably(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so that a crash leaves the old or new file."""
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    try:
+        directory = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
+
+
+class Journal:
+    """Autosave journal for one game; create it with :meth:`start` or :meth:`recover`.
+
+    ``fsync_interval`` is in seconds; ``0`` syncs after every action and
+    ``None`` never syncs (data still reaches the OS on every action).
+    """
+
+    def __init__(
+        self,
+        base: str | os.PathLike,
+        game: Game,
+        generation: int,
+        fsync_interval: float | None = 1.0,
+        compact_every: int = 1000,
+    ) -> None:
+        self.base = Path(base)
+        self.game = game
+        self.generation = generation
+        self.fsync_interval = fsync_interval
+        self.compact_every = compact_every
+        # Actions in the segments since the last snapshot.
+        self.pending = 0
+        # Actions replayed by recover().
+        self.recovered = 0
+        self._file = self._open_segment(generation)
+        self._dirty = False
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread = None
+        if fsync_interval:
+            self._thread = threading.Thread(target=self._run, name="journal-sync", daemon=True)
+            self._thread.start()
+        game.journal = self
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.base.with_name(self.base.name + ".snapshot")
+
+    def _segment_path(self, generation: int) -> Path:
+        return self.base.with_name(f"{self.base.name}.{generation}.journal")
+
+    def _open_segment(self, generation: int) -> IO[str]:
+        f = open(self._segment_path(generation), "a", encoding="utf-8")
+        f.write(
+            json.dumps({"format": FORMAT, "version": FORMAT_VERSION, "generation": generation})
+            + "\n"
+        )
+        f.flush()
+        return f
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def start(cls, base: str | os.PathLike, game: Game, **options) -> "Journal":
+        """Start a new journal for ``game``, replacing any earlier one at ``base``.
+
+        The initial snapshot is written synchronously.
+        """
+
+        if game.phase is not Phase.PLAYING:
+            raise ValueError("An autosave journal can only start while playing a blind.")
+        base = Path(base)
+        for path in _segments(base).values():
+            path.unlink()
+        snapshot = base.with_name(base.name + ".snapshot")
+        _write_durably(snapshot, _SNAPSHOT.pack(SNAPSHOT_MAGIC, 0) + dumps(game))
+        return cls(base, game, 0, **options)
+
+    @classmethod
+    def recover(cls, base: str | os.PathLike, **options) -> "Journal | None":
+        """Rebuild the game saved at ``base`` and keep journaling it.
+
+        Returns ``None`` when there is nothing to recover.  The recovered
+        game is the journal's :attr:`game`; actions after the snapshot are
+        replayed headlessly and counted in :attr:`recovered`.
+
+        Replay stops at the first line cut short by the crash or segment
+        without a valid header: the actions after it depend on the ones
+        lost, so that line is truncated away and the later segments are
+        deleted, and the journal continues from a consistent prefix.
+        """
+
+        base = Path(base)
+        snapshot = base.with_name(base.name + ".snapshot")
+        try:
+            data = snapshot.read_bytes()
+        except FileNotFoundError:
+            return None
+        magic, generation = _SNAPSHOT.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{snapshot} is not a journal snapshot")
+        game = loads(data[_SNAPSHOT.size :])
+        game.show_breakdown = False
+
+        replayed = 0
+        segments = _segments(base)
+        last = generation
+        torn = False
+        for gen in sorted(g for g in segments if g >= generation):
+            path = segments[gen]
+            if torn:
+                path.unlink()
+                continue
+            with open(path, "rb") as f:
+                header = f.readline()
+                # Bytes of the segment that were replayed, header included.
+                good = f.tell() if _valid_header(header) else 0
+                if good:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break
+                        game.step(decode_action(line.decode("utf-8")))
+                        replayed += 1
+                        good += len(line)
+                size = f.seek(0, os.SEEK_END)
+            if not good:
+                torn = True
+                path.unlink()
+                continue
+            if good < size:
+                torn = True
+                os.truncate(path, good)
+            last = gen
+        game.show_breakdown = True
+
+        journal = cls(base, game, last + 1, **options)
+        journal.pending = replayed
+        journal.recovered = replayed
+        return journal
+
+    # ------------------------------------------------------------------
+    def record(self, action) -> None:
+        """Append ``action``; called by :meth:`Game.step` before applying it."""
+
+        if self.pending >= self.compact_every and self.game.phase is Phase.PLAYING:
+            self.compact()
+        f = self._file
+        f.write(encode_action(action) + "\n")
+        f.flush()
+        self.pending += 1
+        if self.fsync_interval == 0:
+            os.fsync(f.fileno())
+        else:
+            self._dirty = True
+
+    def compact(self) -> None:
+        """Snapshot the game now and start a new segment.
+
+        Only the encoding and opening the new segment happen on the calling
+        thread; with a background thread the snapshot is written there.
+        """
+
+        if self.game.phase is not Phase.PLAYING:
+            raise ValueError("The journal can only be compacted while playing a blind.")
+        data = _SNAPSHOT.pack(SNAPSHOT_MAGIC, self.generation + 1) + dumps(self.game)
+        old = self._file
+        self.generation += 1
+        self._file = self._open_segment(self.generation)
+        self.pending = 0
+        job = (old, data, self.generation)
+        if self._thread is None:
+            self._write_snapshot(*job)
+        else:
+            self._jobs.put(job)
+
+    def _write_snapshot(self, old: IO[str], data: bytes, generation: int) -> None:
+        os.fsync(old.fileno())
+        old.close()
+        _write_durably(self.snapshot_path, data)
+        for gen, path in _segments(self.base).items():
+            if gen < generation:
+                path.unlink(missing_ok=True)
+
+    def sync(self) -> None:
+        """Flush and fsync the current segment now."""
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+
+    def close(self) -> None:
+        """Finish pending snapshots, sync and close the journal."""
+
+        if self._thread is not None:
+            self._jobs.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+        if self.game.journal is self:
+            self.game.journal = None
+
+    def _run(self) -> None:
+        """Background thread: periodic fsync and snapshot writes."""
+
+        while True:
+            try:
+                job = self._jobs.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                job = None
+            if job is _STOP:
+                return
+            if job is not None:
+                self._write_snapshot(*job)
+            elif self._dirty:
+                self._dirty = False
+                # Read once: the main thread may switch segments meanwhile,
+                # but only this thread ever closes a segment it replaced.
+                f = self._file
+                try:
+                    os.fsync(f.fileno())
+                except (OSError, ValueError):
+                    pass
+
+
+__all__ = ["Journal", "FORMAT_VERSION"]
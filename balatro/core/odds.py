@@ -0,0 +1,179 @@
+"""Exact odds of completing hands on the next draw.
+
+All probabilities are hypergeometric over the draw pile and are computed
+from the deck's incremental rank and suit counts, never by walking the
+deck.  Counts are combined with truncated generating polynomials: the
+coefficient of ``t**k`` in ``prod(sum(C(K_i, x) * t**x))`` counts the ways
+to draw ``k`` cards with ``x`` cards of each group ``i``, so restricting
+the ``x`` allowed per group gives the exact number of draws that miss a
+hand.  Dividing by ``C(N, k)`` turns the count into a probability.
+"""
+
+from __future__ import annotations
+
+from math import comb
+from typing import NamedTuple
+
+from ..cards.cards import SUITS, Card, Suit
+
+# Rank code of the Ace, which also plays low in A-2-3-4-5 straights.
+_ACE = 12
+
+
+class DrawOdds(NamedTuple):
+    """Chances of holding each kind of hand after drawing ``draws`` cards."""
+
+    draws: int
+    flush: float
+    flush_by_suit: dict[Suit, float]
+    straight: float
+    of_a_kind: dict[int, float]
+
+
+def _mul(a: list[int], b: list[int], k: int) -> list[int]:
+    """Multiply two polynomials, dropping terms above ``t**k``."""
+
+    out = [0] * (k + 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b[: k + 1 - i]):
+                out[i + j] += x * y
+    return out
+
+
+def _ways(available: int, low: int, high: int, k: int) -> list[int]:
+    """Polynomial counting draws of ``low``..``high`` cards out of ``available``."""
+
+    high = min(high, available, k)
+    return [comb(available, x) if low <= x <= high else 0 for x in range(k + 1)]
+
+
+def _miss_probability(counts: list[int], limits: list[int], k: int, total: int) -> float:
+    """P(every group ``i`` gets fewer than ``limits[i]`` of the ``k`` drawn cards)."""
+
+    poly = [1] + [0] * k
+    for available, limit in zip(counts, limits):
+        if limit <= 0:
+            return 0.0
+        poly = _mul(poly, _ways(available, 0, limit - 1, k), k)
+    return poly[k] / comb(total, k)
+
+
+def at_least(population: int, successes: int, draws: int, need: int) -> float:
+    """Hypergeometric P(X >= ``need``) for ``draws`` cards from ``population``."""
+
+    if need <= 0:
+        return 1.0
+    draws = min(draws, population)
+    total = comb(population, draws)
+    hits = sum(
+        comb(successes, x) * comb(population - successes, draws - x)
+        for x in range(need, min(successes, draws) + 1)
+    )
+    return hits / total
+
+
+def _straight_probability(
+    rank_counts: list[int], held: list[int], k: int, total: int
+) -> float:
+    """P(the held cards plus ``k`` drawn cards contain five consecutive ranks)."""
+
+    ways = 0
+    for ace_present in (False, True):
+        if held[_ACE] and not ace_present:
+            continue
+        low = 0 if held[_ACE] or not ace_present else 1
+        high = 0 if not ace_present else rank_counts[_ACE]
+        ace = _ways(rank_counts[_ACE], low, high, k)
+        # runs[n] is the polynomial of draws whose current run of present
+        # ranks has length n; runs[5] means a straight has been made.
+        runs = [[0] * (k + 1) for _ in range(6)]
+        runs[1 if ace_present else 0] = ace
+        for code in range(_ACE + 1):
+            if code == _ACE:
+                present = [1] + [0] * k if ace_present else None
+                absent = None if ace_present else [1] + [0] * k
+            else:
+                lowest = 0 if held[code] else 1
+                present = _ways(rank_counts[code], lowest, k, k)
+                absent = None if held[code] else [1] + [0] * k
+            nxt = [[0] * (k + 1) for _ in range(6)]
+            for run, poly in enumerate(runs):
+                if not any(poly):
+                    continue
+                if run == 5:
+                    both = _ways(rank_counts[code], 0, k, k) if code != _ACE else [1] + [0] * k
+                    nxt[5] = [a + b for a, b in zip(nxt[5], _mul(poly, both, k))]
+                    continue
+                if present is not None:
+                    step = _mul(poly, present, k)
+                    target = min(run + 1, 5)
+                    nxt[target] = [a + b for a, b in zip(nxt[target], step)]
+                if absent is not None:
+                    nxt[0] = [a + b for a, b in zip(nxt[0], poly)]
+            runs = nxt
+        ways += runs[5][k]
+    return ways / comb(total, k)
+
+
+def _add_counts(cards, rank_counts: list[int], suit_counts: list[int]) -> None:
+    for card in cards:
+        rank_counts[card.code & 0b1111] += 1
+        suit_counts[card.suit_code] += 1
+
+
+def draw_odds(deck, held: list[Card], draws: int, discarded: list[Card] = ()) -> DrawOdds:
+    """Return the odds of each hand type after drawing ``draws`` cards.
+
+    ``held`` are the cards kept in hand; the drawn cards come from
+    ``deck``'s draw pile.  When it holds fewer than ``draws`` cards, all
+    of them are drawn and, as :meth:`BaseDeck.draw` does, the discard pile
+    (with ``discarded``, the cards about to join it) is shuffled back in
+    for the rest.  ``draws`` is capped at the cards of both piles.
+    """
+
+    rank_counts = deck.rank_counts
+    suit_counts = deck.suit_counts
+    total = sum(rank_counts)
+    held_ranks = [0] * len(rank_counts)
+    held_suits = [0] * len(suit_counts)
+    _add_counts(held, held_ranks, held_suits)
+
+    k = draws
+    drawn = 0
+    if draws > total:
+        # The whole draw pile is certain to be drawn: count it as held and
+        # draw the rest from the reshuffled discard pile.
+        held_ranks = [a + b for a, b in zip(held_ranks, rank_counts)]
+        held_suits = [a + b for a, b in zip(held_suits, suit_counts)]
+        rank_counts = [0] * len(rank_counts)
+        suit_counts = [0] * len(suit_counts)
+        _add_counts(deck.discard_pile, rank_counts, suit_counts)
+        _add_counts(discarded, rank_counts, suit_counts)
+        drawn = total
+        total = sum(rank_counts)
+        k = min(draws - drawn, total)
+
+    flush_limits = [5 - n for n in held_suits]
+    flush = 1.0 - _miss_probability(suit_counts, flush_limits, k, total)
+    flush_by_suit = {
+        suit: at_least(total, suit_counts[i], k, flush_limits[i])
+        for i, suit in enumerate(SUITS)
+    }
+    of_a_kind = {
+        n: 1.0 - _miss_probability(rank_counts, [n - h for h in held_ranks], k, total)
+        for n in range(2, 6)
+    }
+    straight = _straight_probability(rank_counts, held_ranks, k, total)
+    return DrawOdds(drawn + k, flush, flush_by_suit, straight, of_a_kind)
+
+
+def discard_odds(game, card_indices: list[int]) -> DrawOdds:
+    """Odds of the hand after discarding ``card_indices`` and drawing back up."""
+
+    hand = game.player.hand
+    discarded = set(card_indices)
+    held = [card for i, card in enumerate(hand) if i not in discarded]
+    thrown = [card for i, card in enumerate(hand) if i in discarded]
+    draws = max(0, game.player.hand_size - len(held))
+    return draw_odds(game.deck, held, draws, thrown)
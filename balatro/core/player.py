@@ -2,8 +2,9 @@ from __future__ import annotations
 
 """Player related state and behaviour for Balatro."""
 
-from ..cards.cards import Card
+from ..cards.cards import SUIT_SORT_ORDER, Card
 from ..core.poker import PokerHand
+from .joker_pipeline import JokerList, JokerPipeline
 from ..utils import calculate_sell_value
 
 
@@ -14,7 +15,8 @@ class Player:
         self.money = 4
         self.hands = 4
         self.discards = 3
-        self.hand_size = 8
+        # Hand size before Jokers (Juggler, Turtle Bean...), see hand_size.
+        self.base_hand_size = 8
         self.score = 0
         self.sort_by = "rank"
         self.earns_interest = True
@@ -22,12 +24,76 @@ class Player:
         self.deck = deck
         self.hand: list[Card] = []
         self.jokers = []
+        self._joker_pipeline: JokerPipeline | None = None
+        self._joker_pipeline_version = -1
         self.vouchers = []
         self.tarot_cards = []
         self.spectral_cards = []
         self.planet_cards = []
         self.consumable_slots = 2
         self.hand_bonuses: dict[str, dict[str, int]] = {}
+        # Times each hand type (by PokerHand name) was played this run.
+        self.hands_played: dict[str, int] = {}
+
+    def clone(self, deck, copy_card=None) -> "Player":
+        """Return an independent copy of the player using ``deck``.
+
+        Jokers are copied, consumables and vouchers (never changed once
+        owned) are shared.  ``copy_card`` maps each hand card to its copy;
+        without it the hand shares the Card objects.
+        """
+        player = object.__new__(Player)
+        player.__dict__.update(self.__dict__)
+        player.deck = deck
+        player.hand = self.hand[:] if copy_card is None else [copy_card(c) for c in self.hand]
+        jokers = JokerList(j.copy() for j in self._jokers)
+        player._jokers = jokers
+        # The compiled pipeline holds no Joker references, so it can be shared.
+        if self._joker_pipeline_version != self._jokers.version:
+            player._joker_pipeline = None
+        player._joker_pipeline_version = jokers.version
+        player.vouchers = self.vouchers[:]
+        player.tarot_cards = self.tarot_cards[:]
+        player.spectral_cards = self.spectral_cards[:]
+        player.planet_cards = self.planet_cards[:]
+        player.hand_bonuses = {name: dict(bonus) for name, bonus in self.hand_bonuses.items()}
+        player.hands_played = dict(self.hands_played)
+        return player
+
+    # ------------------------------------------------------------------
+    # Jokers
+    @property
+    def jokers(self) -> JokerList:
+        return self._jokers
+
+    @jokers.setter
+    def jokers(self, value) -> None:
+        self._jokers = value if isinstance(value, JokerList) else JokerList(value)
+        self._joker_pipeline = None
+
+    @property
+    def joker_pipeline(self) -> JokerPipeline:
+        """The compiled scoring pipeline for the current Joker lineup."""
+        if (
+            self._joker_pipeline is None
+            or self._joker_pipeline_version != self._jokers.version
+        ):
+            self._joker_pipeline = JokerPipeline(self._jokers)
+            self._joker_pipeline_version = self._jokers.version
+        return self._joker_pipeline
+
+    def invalidate_jokers(self) -> None:
+        """Force a pipeline rebuild after a Joker was changed in place."""
+        self._joker_pipeline = None
+
+    @property
+    def hand_size(self) -> int:
+        """Cards in a full hand, with what the Jokers add or take."""
+        return max(0, self.base_hand_size + self.joker_pipeline.rules.hand_size)
+
+    @hand_size.setter
+    def hand_size(self, value: int) -> None:
+        self.base_hand_size = value - self.joker_pipeline.rules.hand_size
 
     # ------------------------------------------------------------------
     # Card handling
@@ -35,22 +101,16 @@ class Player:
         self.sort_by = "suit" if self.sort_by == "rank" else "rank"
 
     def sort_hand(self) -> None:
-        rank_order = {
-            "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8,
-            "9": 9, "10": 10, "Ten": 10,
-            "Jack": 11, "Queen": 12, "King": 13, "Ace": 14,
-        }
-
-        def card_sort_key(card: Card):
-            if self.sort_by == "rank":
-                return (rank_order[card.rank.value], card.suit.value)
-            return (card.suit.value, rank_order[card.rank.value])
-
-        self.hand.sort(key=card_sort_key)
+        if self.sort_by == "rank":
+            self.hand.sort(key=lambda card: card.rank_value << 2 | SUIT_SORT_ORDER[card.suit_code])
+        else:
+            self.hand.sort(key=lambda card: SUIT_SORT_ORDER[card.suit_code] << 4 | card.rank_value)
 
     def draw_hand(self) -> None:
+        """Start a round: return the hand, reshuffle and draw a fresh hand."""
         if self.hand:
             self.deck.return_cards(self.hand)
+        self.deck.reshuffle()
         self.hand = self.deck.draw(self.hand_size)
         self.sort_hand()
 
@@ -80,95 +140,66 @@ class Player:
     def _total_consumables(self) -> int:
         return len(self.tarot_cards) + len(self.spectral_cards) + len(self.planet_cards)
 
-    def _has_consumable_space(self) -> bool:
+    def has_consumable_space(self) -> bool:
         return self._total_consumables() < self.consumable_slots
 
     def add_tarot_card(self, card) -> bool:
-        if self._has_consumable_space():
+        if self.has_consumable_space():
             self.tarot_cards.append(card)
             return True
-        print("No room for more consumables.")
         return False
 
     def add_spectral_card(self, card) -> bool:
-        if self._has_consumable_space():
+        if self.has_consumable_space():
             self.spectral_cards.append(card)
             return True
-        print("No room for more consumables.")
         return False
 
     def add_planet_card(self, card) -> bool:
-        if self._has_consumable_space():
+        if self.has_consumable_space():
             self.planet_cards.append(card)
             return True
-        print("No room for more consumables.")
         return False
 
+    def add_consumable(self, card) -> str | None:
+        """Store a Tarot, Spectral or Planet card in its inventory.
+
+        Returns the name of the inventory, or ``None`` when there is no room.
+        """
+        from ..cards.spectral_cards import SpectralCard
+        from ..cards.tarot_cards import TarotCard
+
+        if isinstance(card, TarotCard):
+            added, destination = self.add_tarot_card(card), "Tarot Cards"
+        elif isinstance(card, SpectralCard):
+            added, destination = self.add_spectral_card(card), "Spectral Cards"
+        else:
+            added, destination = self.add_planet_card(card), "Planet Cards"
+        return destination if added else None
+
     # ------------------------------------------------------------------
     # Selling helpers
-    def sell_joker(self, index: int) -> bool:
-        if 0 <= index < len(self.jokers):
-            joker = self.jokers.pop(index)
-            value = calculate_sell_value(joker)
-            self.money += value
-            print(f"Sold {joker.name} for ${value}.")
-            return True
-        print("Invalid Joker index.")
-        return False
+    def _sell(self, items: list, index: int) -> int | None:
+        """Sell ``items[index]``; return its value, or ``None`` if out of range."""
+        if not 0 <= index < len(items):
+            return None
+        value = calculate_sell_value(items.pop(index))
+        self.money += value
+        return value
 
-    def sell_tarot_card(self, index: int) -> bool:
-        if 0 <= index < len(self.tarot_cards):
-            card = self.tarot_cards.pop(index)
-            value = calculate_sell_value(card)
-            self.money += value
-            print(f"Sold {card.name} for ${value}.")
-            return True
-        print("Invalid Tarot card index.")
-        return False
+    def sell_joker(self, index: int) -> int | None:
+        return self._sell(self.jokers, index)
 
-    def sell_spectral_card(self, index: int) -> bool:
-        if 0 <= index < len(self.spectral_cards):
-            card = self.spectral_cards.pop(index)
-            value = calculate_sell_value(card)
-            self.money += value
-            print(f"Sold {card.name} for ${value}.")
-            return True
-        print("Invalid Spectral card index.")
-        return False
+    def sell_tarot_card(self, index: int) -> int | None:
+        return self._sell(self.tarot_cards, index)
 
-    def sell_planet_card(self, index: int) -> bool:
-        if 0 <= index < len(self.planet_cards):
-            card = self.planet_cards.pop(index)
-            value = calculate_sell_value(card)
-            self.money += value
-            print(f"Sold {card.name} for ${value}.")
-            return True
-        print("Invalid Planet card index.")
-        return False
+    def sell_spectral_card(self, index: int) -> int | None:
+        return self._sell(self.spectral_cards, index)
+
+    def sell_planet_card(self, index: int) -> int | None:
+        return self._sell(self.planet_cards, index)
 
     def add_hand_bonus(self, hand: PokerHand, chips: int = 0, mult: int = 0) -> None:
         bonus = self.hand_bonuses.setdefault(hand.name, {"chips": 0, "mult": 0})
         bonus["chips"] += chips
         bonus["mult"] += mult
-
-    def use_tarot_card(self, index: int, game) -> None:
-        if 0 <= index < len(self.tarot_cards):
-            tarot = self.tarot_cards.pop(index)
-            tarot.apply_effect(game)
-        else:
-            print("Invalid Tarot card index.")
-
-    def use_spectral_card(self, index: int, game) -> None:
-        if 0 <= index < len(self.spectral_cards):
-            spectral = self.spectral_cards.pop(index)
-            spectral.apply_effect(game)
-        else:
-            print("Invalid Spectral card index.")
-
-    def use_planet_card(self, index: int, game) -> None:
-        if 0 <= index < len(self.planet_cards):
-            planet = self.planet_cards.pop(index)
-            planet.apply_effect(game)
-            game.last_used_card = planet
-        else:
-            print("Invalid Planet card index.")
@@ -1,7 +1,9 @@
 """This module defines poker hand types and functions for evaluating poker hands."""
 
+from collections import OrderedDict
 from enum import Enum
-from collections import Counter
+from itertools import combinations_with_replacement
+from typing import NamedTuple
 from ..cards.cards import Card, Rank
 
 
@@ -20,89 +22,306 @@ class PokerHand(Enum):
     FIVE_OF_A_KIND = "Five of a Kind"
 
 
-# Helper function to get rank values for sorting and comparison
+# Rank values used for sorting and comparison (Two = 2 ... Ace = 14).
+RANK_VALUES: dict[Rank, int] = {r: i for i, r in enumerate(Rank, 2)}
+
+# Hand strength follows the declaration order of ``PokerHand``.
+HAND_ORDER: dict[PokerHand, int] = {hand: i for i, hand in enumerate(PokerHand)}
+
+
 def get_rank_value(rank: Rank) -> int:
     """Returns the numerical value of a card rank."""
 
-    # This mapping is simplified. In a real game, Ace can be high or low.
-    rank_order = {r: i for i, r in enumerate(Rank, 2)}
-    return rank_order[rank]
+    return RANK_VALUES[rank]
+
+
+def _classify_counts(counts: tuple[int, ...]) -> tuple[PokerHand, int]:
+    """Classify a descending rank-count signature.
+
+    Returns the hand type and the minimum number of copies a rank needs to
+    be part of that hand (``0`` marks High Card, which uses the top card).
+    """
+
+    if counts[0] == 5:
+        return PokerHand.FIVE_OF_A_KIND, 5
+    if counts[0] == 4:
+        return PokerHand.FOUR_OF_A_KIND, 4
+    if counts[:2] == (3, 2):
+        return PokerHand.FULL_HOUSE, 2
+    if counts[0] == 3:
+        return PokerHand.THREE_OF_A_KIND, 3
+    if counts[:2] == (2, 2):
+        return PokerHand.TWO_PAIR, 2
+    if counts[0] == 2:
+        return PokerHand.PAIR, 2
+    return PokerHand.HIGH_CARD, 0
+
+
+def _build_count_table() -> dict[tuple[int, ...], tuple[PokerHand, int]]:
+    """Precompute the classification of every rank-count signature of 1-5 cards."""
+
+    table = {}
+    for size in range(1, 6):
+        for parts in range(1, size + 1):
+            for counts in combinations_with_replacement(range(size, 0, -1), parts):
+                if sum(counts) == size:
+                    table[counts] = _classify_counts(counts)
+    return table
+
+
+class HandRules(NamedTuple):
+    """Jokers that change which cards make a hand."""
+
+    # Four Fingers: Flushes and Straights of four cards.
+    four_fingers: bool = False
+    # Shortcut: Straights with gaps of one rank.
+    shortcut: bool = False
+
+
+NO_RULES = HandRules()
+
+
+def _build_straight_masks(size: int = 5, gap: int = 1) -> frozenset[int]:
+    """Precompute the rank bitmask of every straight of ``size`` ranks.
+
+    Consecutive ranks of a straight are at most ``gap`` apart, and the Ace
+    also counts as the rank below Two.
+    """
+
+    masks = set()
+    chains = [[low] for low in range(1, 15)]
+    while chains:
+        chain = chains.pop()
+        if len(chain) == size:
+            masks.add(sum(1 << (14 if v == 1 else v) for v in chain))
+            continue
+        chains.extend(chain + [v] for v in range(chain[-1] + 1, min(chain[-1] + gap, 14) + 1))
+    return frozenset(masks)
+
+
+_COUNT_TABLE = _build_count_table()
+_STRAIGHT_MASKS = _build_straight_masks()
+
+
+def flush_size(rules: HandRules = NO_RULES) -> int:
+    """How many cards make a Flush or a Straight under ``rules``."""
+
+    return 4 if rules.four_fingers else 5
+
+
+# Straights under each set of rules.
+_STRAIGHTS = {
+    rules: _build_straight_masks(flush_size(rules), 2 if rules.shortcut else 1)
+    for rules in (HandRules(f, s) for f in (False, True) for s in (False, True))
+}
+
+
+def _straight(mask: int, rules: HandRules) -> int:
+    """The ranks of ``mask`` that form a Straight under ``rules`` (``0`` for none)."""
+
+    masks = _STRAIGHTS[rules]
+    if not rules.four_fingers:
+        return mask if mask in masks else 0
+    used = 0
+    for straight in masks:
+        if mask & straight == straight:
+            used |= straight
+    return used
+
+
+def classify(
+    values: list[int], is_flush: bool = False, rules: HandRules = NO_RULES
+) -> tuple[PokerHand, int]:
+    """Classify rank values (2-14) of 1-5 played cards.
+
+    ``is_flush`` should be ``True`` only when :func:`flush_size` cards
+    share a suit.  Returns the hand type and a bitmask (``1 << value``) of
+    the ranks whose cards are used by the hand, which makes the result
+    independent of the order the cards were played in.  A Flush uses every
+    card, and a Straight Flush the ranks of its Straight: callers add the
+    cards of the Flush's suit.
+    """
+
+    counts: dict[int, int] = {}
+    mask = 0
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+        mask |= 1 << value
+
+    hand, need = _COUNT_TABLE[tuple(sorted(counts.values(), reverse=True))]
+
+    if len(values) == 5 or (len(values) == 4 and rules.four_fingers):
+        if rules is NO_RULES:
+            straight = mask if mask in _STRAIGHT_MASKS else 0
+        else:
+            straight = _straight(mask, rules)
+        if straight and is_flush:
+            return PokerHand.STRAIGHT_FLUSH, straight
+        if is_flush and HAND_ORDER[hand] < HAND_ORDER[PokerHand.FLUSH]:
+            return PokerHand.FLUSH, mask
+        if straight:
+            return PokerHand.STRAIGHT, straight
+
+    if not need:
+        return hand, 1 << (mask.bit_length() - 1)
+    used = 0
+    for value, count in counts.items():
+        if count >= need:
+            used |= 1 << value
+    return hand, used
+
+
+def flush_suit(cards: list[Card], rules: HandRules = NO_RULES) -> int | None:
+    """The suit code shared by :func:`flush_size` of ``cards``, if any."""
+
+    size = 4 if rules.four_fingers else 5
+    if len(cards) < size:
+        return None
+    suit = cards[0].suit_code
+    if all(c.suit_code == suit for c in cards):
+        return suit
+    if size == len(cards):
+        return None
+    counts: dict[int, int] = {}
+    for c in cards:
+        counts[c.suit_code] = counts.get(c.suit_code, 0) + 1
+    suit, count = max(counts.items(), key=lambda item: item[1])
+    return suit if count >= size else None
+
+
+def used_cards(
+    cards: list[Card], values: list[int], hand: PokerHand, used: int, suit: int | None
+) -> list[Card]:
+    """The ``cards`` a :func:`classify` result uses, in play order.
+
+    ``suit`` is the :func:`flush_suit` of ``cards``.
+    """
+
+    if suit is None or hand not in (PokerHand.FLUSH, PokerHand.STRAIGHT_FLUSH):
+        return [c for c, v in zip(cards, values) if used >> v & 1]
+    if hand is PokerHand.FLUSH:
+        used = 0
+    return [c for c, v in zip(cards, values) if c.suit_code == suit or used >> v & 1]
 
 
-def evaluate_hand(cards: list[Card]) -> tuple[PokerHand | None, list[Card]]:
+def evaluate_hand(
+    cards: list[Card], rules: HandRules = NO_RULES
+) -> tuple[PokerHand | None, list[Card]]:
     """Evaluate cards and return the best hand type and cards used.
 
     Returning the specific cards that form the hand allows callers to only
     score those cards, matching Balatro's rule that only hand cards are
-    counted unless modified by an effect.
+    counted unless modified by an effect.  Used cards are returned in the
+    order they were played.  Straights and Flushes require five cards, or
+    four with Four Fingers (``rules``).
     """
 
     if not cards:
         return None, []
 
-    ranks = [c.rank for c in cards]
-    suits = [c.suit for c in cards]
-    rank_counts = Counter(ranks)
-    suit_counts = Counter(suits)
-
-    # --- Check for hands ---
-    is_flush = len(suit_counts) == 1
-
-    # Check for straight
-    unique_rank_values = sorted([get_rank_value(r) for r in set(ranks)])
-    is_straight = (
-        len(unique_rank_values) == 5
-        and (unique_rank_values[-1] - unique_rank_values[0] == 4)
-    )
-    # Ace-low straight (A, 2, 3, 4, 5)
-    if not is_straight and set(unique_rank_values) == {14, 2, 3, 4, 5}:
-        is_straight = True
-
-    # Check for kinds
-    counts = sorted(rank_counts.values(), reverse=True)
-    is_five_of_a_kind = counts[0] == 5
-    is_four_of_a_kind = counts[0] == 4
-    is_full_house = counts == [3, 2]
-    is_three_of_a_kind = counts[0] == 3
-    is_two_pair = list(rank_counts.values()).count(2) == 2
-    is_pair = counts[0] == 2
-
-    # --- Determine the hand based on checks and extract used cards ---
-    if is_straight and is_flush:
-        return PokerHand.STRAIGHT_FLUSH, cards
-    if is_five_of_a_kind:
-        rank = rank_counts.most_common(1)[0][0]
-        used = [c for c in cards if c.rank == rank][:5]
-        return PokerHand.FIVE_OF_A_KIND, used
-    if is_four_of_a_kind:
-        rank = rank_counts.most_common(1)[0][0]
-        used = [c for c in cards if c.rank == rank][:4]
-        return PokerHand.FOUR_OF_A_KIND, used
-    if is_full_house:
-        three_rank = [r for r, c in rank_counts.items() if c == 3][0]
-        pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
-        used = [c for c in cards if c.rank == three_rank][:3]
-        used += [c for c in cards if c.rank == pair_rank][:2]
-        return PokerHand.FULL_HOUSE, used
-    if is_flush:
-        return PokerHand.FLUSH, cards
-    if is_straight:
-        return PokerHand.STRAIGHT, cards
-    if is_three_of_a_kind:
-        rank = [r for r, c in rank_counts.items() if c == 3][0]
-        used = [c for c in cards if c.rank == rank][:3]
-        return PokerHand.THREE_OF_A_KIND, used
-    if is_two_pair:
-        pair_ranks = [r for r, c in rank_counts.items() if c == 2][:2]
-        used: list[Card] = []
-        for r in pair_ranks:
-            used.extend([c for c in cards if c.rank == r][:2])
-        return PokerHand.TWO_PAIR, used
-    if is_pair:
-        rank = rank_counts.most_common(1)[0][0]
-        used = [c for c in cards if c.rank == rank][:2]
-        return PokerHand.PAIR, used
-
-    highest = max(cards, key=lambda c: get_rank_value(c.rank))
-    return PokerHand.HIGH_CARD, [highest]
+    values = [c.rank_value for c in cards]
+    suit = flush_suit(cards, rules) if len(cards) >= 4 else None
+    hand, used = classify(values, suit is not None, rules)
+    if suit is None:
+        return hand, [c for c, v in zip(cards, values) if used >> v & 1]
+    return hand, used_cards(cards, values, hand, used, suit)
+
+
+class HandCache:
+    """Bounded LRU cache in front of :func:`classify`.
+
+    Entries are keyed by a canonical signature of the played cards: their
+    sorted rank values plus whether they form a five-card single-suit hand.
+    The key is therefore independent of play order and of which suits are
+    involved.  Each entry stores the hand type and the bitmask of used
+    ranks, which identifies the positions of the used cards in any ordering
+    of the same signature.
+
+    Entries are classified under :attr:`rules`; setting them to different
+    rules (Four Fingers or Shortcut joining or leaving the lineup) calls
+    :meth:`invalidate`, so stale classifications are not served.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._rules = NO_RULES
+        self._entries: OrderedDict[tuple[tuple[int, ...], bool], tuple[PokerHand, int]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"HandCache(size={len(self._entries)}/{self.maxsize}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    @property
+    def rules(self) -> HandRules:
+        """The rules cached entries were classified under."""
+
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: HandRules) -> None:
+        if rules != self._rules:
+            self._rules = rules
+            self.invalidate()
+
+    def classify(self, values: list[int], is_flush: bool = False) -> tuple[PokerHand, int]:
+        """Cached equivalent of :func:`classify` under :attr:`rules`."""
+
+        key = (tuple(sorted(values)), is_flush)
+        entries = self._entries
+        result = entries.get(key)
+        if result is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return result
+        self.misses += 1
+        result = classify(values, is_flush, self._rules)
+        entries[key] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return result
+
+    def evaluate(self, cards: list[Card]) -> tuple[PokerHand | None, list[Card]]:
+        """Cached equivalent of :func:`evaluate_hand` under :attr:`rules`."""
+
+        if not cards:
+            return None, []
+        values = [c.rank_value for c in cards]
+        suit = flush_suit(cards, self._rules) if len(cards) >= 4 else None
+        hand, used = self.classify(values, suit is not None)
+        if suit is None:
+            return hand, [c for c, v in zip(cards, values) if used >> v & 1]
+        return hand, used_cards(cards, values, hand, used, suit)
+
+    def invalidate(self) -> None:
+        """Drop every cached classification, keeping the hit/miss counters."""
+
+        self._entries.clear()
+
+    def clear(self) -> None:
+        """Drop every cached classification and reset the counters."""
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared cache used by the game, hints and bots.
+hand_cache = HandCache()
+
+
+def evaluate_hand_cached(
+    cards: list[Card], rules: HandRules = NO_RULES
+) -> tuple[PokerHand | None, list[Card]]:
+    """Evaluate ``cards`` under ``rules`` through the shared :data:`hand_cache`."""
 
+    hand_cache.rules = rules
+    return hand_cache.evaluate(cards)
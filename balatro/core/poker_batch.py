@@ -0,0 +1,125 @@
+"""Vectorized batch evaluation of poker hands over NumPy arrays.
+
+Hands are integer encoded: each row of ``ranks`` and ``suits`` holds up
+to five cards, using the declaration order of :class:`~balatro.cards.cards.Rank`
+(``0`` = Two ... ``12`` = Ace) and :class:`~balatro.cards.cards.Suit`.
+A boolean ``mask`` marks which of the five slots hold a card, so shorter
+hands can be packed into the same array.
+
+This module requires NumPy, which the interactive game does not need, so
+it is not imported by :mod:`balatro.core`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..cards.cards import Card
+from .poker import PokerHand, _STRAIGHT_MASKS
+
+# ``PokerHand`` ordinals, matching ``list(PokerHand).index(hand)``.
+HAND_ORDINALS: dict[PokerHand, int] = {hand: i for i, hand in enumerate(PokerHand)}
+NO_HAND = -1
+
+_RANK_BITS = 1 << np.arange(13, dtype=np.int64)
+# Straight bitmasks re-based from rank values (2-14) to rank codes (0-12).
+_STRAIGHT_CODES = np.array(sorted(m >> 2 for m in _STRAIGHT_MASKS), dtype=np.int64)
+
+# Minimum copies of a rank needed for a card to be used, indexed by ordinal.
+# Straights and flushes use every card; High Card is handled separately.
+_NEED = np.array(
+    [
+        {
+            PokerHand.HIGH_CARD: 0,
+            PokerHand.PAIR: 2,
+            PokerHand.TWO_PAIR: 2,
+            PokerHand.THREE_OF_A_KIND: 3,
+            PokerHand.STRAIGHT: 1,
+            PokerHand.FLUSH: 1,
+            PokerHand.FULL_HOUSE: 2,
+            PokerHand.FOUR_OF_A_KIND: 4,
+            PokerHand.STRAIGHT_FLUSH: 1,
+            PokerHand.FIVE_OF_A_KIND: 5,
+        }[hand]
+        for hand in PokerHand
+    ],
+    dtype=np.int64,
+)
+
+
+def encode_hands(hands: list[list[Card]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Encode lists of up to five cards as ``(ranks, suits, mask)`` arrays."""
+
+    n = len(hands)
+    ranks = np.zeros((n, 5), dtype=np.int8)
+    suits = np.zeros((n, 5), dtype=np.int8)
+    mask = np.zeros((n, 5), dtype=bool)
+    for i, cards in enumerate(hands):
+        for j, card in enumerate(cards):
+            ranks[i, j] = card.rank_value - 2
+            suits[i, j] = card.suit_code
+            mask[i, j] = True
+    return ranks, suits, mask
+
+
+def evaluate_hands(
+    ranks: np.ndarray, suits: np.ndarray, mask: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate a batch of hands.
+
+    Args:
+        ranks: ``(N, 5)`` integer array of rank codes.
+        suits: ``(N, 5)`` integer array of suit codes.
+        mask: Optional ``(N, 5)`` boolean array of occupied slots. Defaults
+            to every slot being occupied.
+
+    Returns:
+        A ``(N,)`` array of ``PokerHand`` ordinals (``-1`` for empty hands)
+        and a ``(N, 5)`` boolean mask of the cards used by each hand, with
+        the same semantics as :func:`balatro.core.poker.evaluate_hand`.
+    """
+
+    ranks = np.asarray(ranks, dtype=np.int64)
+    suits = np.asarray(suits, dtype=np.int64)
+    if mask is None:
+        mask = np.ones(ranks.shape, dtype=bool)
+    else:
+        mask = np.asarray(mask, dtype=bool)
+
+    onehot = (ranks[:, :, None] == np.arange(13)) & mask[:, :, None]
+    counts = onehot.sum(axis=1)
+    size = mask.sum(axis=1)
+    max_count = counts.max(axis=1)
+    pairs = (counts == 2).sum(axis=1)
+    rank_bits = (counts > 0) @ _RANK_BITS
+
+    five_cards = size == 5
+    is_straight = five_cards & np.isin(rank_bits, _STRAIGHT_CODES)
+    is_flush = five_cards & (suits == suits[:, :1]).all(axis=1)
+
+    # Assign in ascending strength so stronger hands overwrite weaker ones.
+    hands = np.zeros(len(ranks), dtype=np.int8)
+    hands[max_count == 2] = HAND_ORDINALS[PokerHand.PAIR]
+    hands[pairs == 2] = HAND_ORDINALS[PokerHand.TWO_PAIR]
+    hands[max_count == 3] = HAND_ORDINALS[PokerHand.THREE_OF_A_KIND]
+    hands[is_straight] = HAND_ORDINALS[PokerHand.STRAIGHT]
+    hands[is_flush] = HAND_ORDINALS[PokerHand.FLUSH]
+    hands[(max_count == 3) & (pairs == 1)] = HAND_ORDINALS[PokerHand.FULL_HOUSE]
+    hands[max_count == 4] = HAND_ORDINALS[PokerHand.FOUR_OF_A_KIND]
+    hands[is_straight & is_flush] = HAND_ORDINALS[PokerHand.STRAIGHT_FLUSH]
+    hands[max_count == 5] = HAND_ORDINALS[PokerHand.FIVE_OF_A_KIND]
+
+    own_count = np.take_along_axis(counts, ranks.clip(0, 12), axis=1)
+    used = mask & (own_count >= _NEED[hands][:, None])
+
+    # High Card uses the first card of the highest rank.
+    top = 12 - np.argmax(counts[:, ::-1] > 0, axis=1)
+    is_top = mask & (ranks == top[:, None])
+    first_top = is_top & (np.cumsum(is_top, axis=1) == 1)
+    high = hands == HAND_ORDINALS[PokerHand.HIGH_CARD]
+    used[high] = first_top[high]
+
+    empty = size == 0
+    hands[empty] = NO_HAND
+    used[empty] = False
+    return hands, used
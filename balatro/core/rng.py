@@ -0,0 +1,146 @@
+"""Seeded random number streams owned by a game.
+
+Every source of randomness in a game draws from its own named
+:class:`RngStream`, so a run is fully determined by its seed and one kind
+of randomness never perturbs another: buying an extra shop item does not
+change the order of the deck.  Sub-stream seeds are derived from the game
+seed with BLAKE2b, which is stable across processes and Python versions
+(unlike ``hash``), so identical seeds give identical games on any worker.
+
+Each stream is a SplitMix64 generator wrapped in :class:`random.Random`, so
+it offers the full ``random`` API (``choice``, ``shuffle``, ``sample`` ...)
+while its whole state is a single integer that is cheap to save and copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+
+_MASK64 = (1 << 64) - 1
+
+# Named sub-streams of a game, in the order they are stored.
+STREAMS = ("deck", "shop", "packs", "lucky", "consumables", "jokers")
+
+
+def derive_seed(seed: int | str, name: str) -> int:
+    """Derive a stable 64-bit sub-seed for the stream ``name``."""
+
+    digest = hashlib.blake2b(f"{seed}:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RngStream(random.Random):
+    """SplitMix64 generator exposing the :class:`random.Random` interface."""
+
+    def __init__(self, seed: int | str | None = None) -> None:
+        self._state = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version: int = 2) -> None:
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif not isinstance(a, int):
+            a = derive_seed(a, "")
+        self._state = a & _MASK64
+        self.gauss_next = None
+
+    def _next(self) -> int:
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next() >> 11) * 2.0**-53
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next() >> (64 - k) if k > 0 else 0
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next() << shift
+        return bits & ((1 << k) - 1)
+
+    def shuffle(self, x: list) -> None:
+        """Shuffle ``x`` in place (Fisher-Yates with the generator inlined)."""
+
+        state = self._state
+        for i in range(len(x) - 1, 0, -1):
+            state = z = (state + 0x9E3779B97F4A7C15) & _MASK64
+            z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+            z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+            j = ((z ^ (z >> 31)) * (i + 1)) >> 64
+            x[i], x[j] = x[j], x[i]
+        self._state = state
+
+    def copy(self) -> "RngStream":
+        """Return a stream that continues independently from this state."""
+
+        clone = RngStream.__new__(RngStream)
+        clone._state = self._state
+        clone.gauss_next = None
+        return clone
+
+    def getstate(self) -> int:
+        return self._state
+
+    def setstate(self, state: int) -> None:
+        self._state = state & _MASK64
+        self.gauss_next = None
+
+    def __reduce__(self):
+        return self.__class__, (), self.getstate()
+
+    def __repr__(self) -> str:
+        return f"RngStream(state={self._state:#018x})"
+
+
+class GameRng:
+    """The independent random streams of one game, derived from ``seed``.
+
+    Streams are available as attributes named after :data:`STREAMS`, for
+    example ``game.rng.deck.shuffle(cards)``.  When ``seed`` is ``None`` a
+    random one is chosen and kept so the game can still be reproduced.
+    """
+
+    def __init__(self, seed: int | str | None = None) -> None:
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+        for name in STREAMS:
+            setattr(self, name, RngStream(derive_seed(seed, name)))
+
+    def __repr__(self) -> str:
+        return f"GameRng(seed={self.seed!r})"
+
+    def clone(self) -> "GameRng":
+        """Return a copy whose streams continue independently from here."""
+
+        rng = GameRng.__new__(GameRng)
+        rng.seed = self.seed
+        for name in STREAMS:
+            setattr(rng, name, getattr(self, name).copy())
+        return rng
+
+    def stream(self, name: str) -> RngStream:
+        """Return the stream called ``name``."""
+
+        if name not in STREAMS:
+            raise KeyError(f"Unknown random stream: {name}")
+        return getattr(self, name)
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "streams": {name: getattr(self, name).getstate() for name in STREAMS},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameRng":
+        rng = cls(data["seed"])
+        for name, state in data.get("streams", {}).items():
+            if name in STREAMS:
+                getattr(rng, name).setstate(state)
+        return rng
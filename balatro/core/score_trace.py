@@ -0,0 +1,81 @@
+"""Structured record of how a hand's score was built.
+
+Scoring only records events when a :class:`ScoreTrace` is passed in, so
+headless runs pay nothing for breakdown text.  Each event stores its
+source (hand name, :class:`~balatro.cards.cards.Card` or Joker name), the
+chips it added and its mult change as ``mult = (mult + added) * factor``.
+:meth:`ScoreTrace.render` turns the events into the familiar breakdown
+lines as a separate step.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+# Event labels.  Card effect events use the effect's own label
+# (for example "Glass bonus") from ``balatro.core.scoring``.
+BASE_HAND = "Base hand"
+PLANET_BONUS = "Planet bonus"
+CARD_VALUE = "card value"
+JOKER = "Joker"
+JOKER_BONUS = "from other Jokers"
+RETRIGGER = "retriggered"
+
+
+class TraceEvent(NamedTuple):
+    """A single scoring step."""
+
+    source: object
+    label: str
+    chips: float
+    mult: float
+    factor: float = 1
+
+
+class ScoreTrace:
+    """Collects :class:`TraceEvent` records during scoring."""
+
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add(self, source, label: str, chips: float = 0, mult: float = 0, factor: float = 1) -> None:
+        self.events.append(TraceEvent(source, label, chips, mult, factor))
+
+    def render(self) -> list[str]:
+        """Render the recorded events as breakdown lines."""
+
+        lines: list[str] = []
+        chips: float = 0
+        mult: float = 0
+        for source, label, added_chips, added_mult, factor in self.events:
+            if label == BASE_HAND:
+                chips, mult = added_chips, added_mult
+                lines.append(f"{BASE_HAND} ({source}): {chips} chips, {mult} mult")
+                continue
+            old_chips, old_mult = chips, mult
+            chips = chips + added_chips
+            mult = (mult + added_mult) * factor
+            if label == PLANET_BONUS:
+                lines.append(f"{PLANET_BONUS}: +{added_chips} chips, +{added_mult} mult")
+            elif label == CARD_VALUE:
+                lines.append(f"{source} adds +{added_chips} chips ({CARD_VALUE})")
+            elif label == JOKER:
+                if chips != old_chips:
+                    lines.append(f"{source} changes chips {old_chips} -> {chips}")
+                if mult != old_mult:
+                    lines.append(f"{source} changes mult {old_mult} -> {mult}")
+            elif label == JOKER_BONUS:
+                lines.append(f"{source} adds +{added_mult} mult {JOKER_BONUS}")
+            elif label == RETRIGGER:
+                lines.append(f"{source} is {RETRIGGER}")
+            elif added_chips:
+                lines.append(f"{source} {label}: +{added_chips} chips")
+            elif factor != 1:
+                lines.append(f"{source} {label}: x{factor} mult")
+            else:
+                lines.append(f"{source} {label}: +{added_mult} mult")
+        lines.append(f"Final: {chips} chips x {mult} mult = {chips * mult}")
+        return lines
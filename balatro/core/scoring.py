@@ -1,10 +1,19 @@
 """This module handles the scoring logic for poker hands in Balatro."""
 
-from .poker import PokerHand
-from ..cards.jokers import Joker
-from ..cards.cards import Card, Enhancement, Edition, Seal, Rank
-from ..utils import calculate_sell_value
-import random  # Import random for Lucky Card
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, NamedTuple
+
+from .poker import PokerHand, evaluate_hand_cached
+from ..cards.cards import Card, Enhancement, Edition, Seal
+from .joker_effects import ScoreContext, hook_amounts
+from .joker_pipeline import JokerPipeline, fire
+from .score_trace import BASE_HAND, CARD_VALUE, PLANET_BONUS, RETRIGGER, ScoreTrace
+from ..events import GoldPayout, JokerPayout
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from ..cards.jokers import Joker
 
 # Base chips and multiplier for each hand type
 # Values taken from Balatro wiki
@@ -21,101 +30,341 @@ HAND_SCORES = {
     PokerHand.FIVE_OF_A_KIND: {"chips": 120, "mult": 12},  # Assuming a generic five of a kind
 }
 
-def calculate_score(
-    hand_type: PokerHand, cards: list[Card], jokers: list[Joker], game
-) -> tuple[float, float, float, list[str]]:
-    """Calculate score and provide chip/mult breakdown."""
 
+# Fixed per-card effects as (label, chips, mult added, mult factor), applied
+# as ``mult = (mult + added) * factor``.
+ENHANCEMENT_EFFECTS = {
+    Enhancement.GLASS: ("Glass bonus", 0, 2, 1),
+    Enhancement.STEEL: ("Steel bonus", 0, 0, 1.5),
+    Enhancement.MULT: ("Mult bonus", 0, 4, 1),
+    Enhancement.CHIP: ("Chip bonus", 10, 0, 1),
+}
+EDITION_EFFECTS = {
+    Edition.FOIL: ("Foil edition", 50, 0, 1),
+    Edition.HOLOGRAPHIC: ("Holographic edition", 0, 10, 1),
+    Edition.POLYCHROME: ("Polychrome edition", 0, 0, 1.5),
+}
+LUCKY_EFFECT = ("Lucky bonus", 0, 20, 1)
+LUCKY_CHANCE = 0.25
+# Money from Gold cards and Gold Seals, paid per trigger.
+GOLD_PAYOUT = 3
+CARD_PAYOUTS = frozenset({"Gold Card", "Gold Seal card"})
+
+
+def card_contribution(card: Card) -> tuple[int, tuple[tuple[float, float], ...]]:
+    """Return the chips a card always adds and its ordered mult steps.
+
+    Each mult step is ``(added, factor)`` and applies as
+    ``mult = (mult + added) * factor``.  Lucky and Gold effects are not
+    included since they are random or do not affect the score.
+    """
+
+    chips = card.chip_value
+    steps = []
+    for effect in (
+        ENHANCEMENT_EFFECTS.get(card.enhancement),
+        EDITION_EFFECTS.get(card.edition),
+    ):
+        if effect:
+            chips += effect[1]
+            if effect[2] or effect[3] != 1:
+                steps.append((effect[2], effect[3]))
+    return chips, tuple(steps)
+
+
+def score_hand(
+    hand_type: PokerHand,
+    cards: list[Card],
+    jokers: list[Joker] | JokerPipeline,
+    hand_bonuses: dict[str, dict[str, int]],
+    trace: ScoreTrace | None = None,
+    roll=None,
+    held: list[Card] | tuple = (),
+    context: ScoreContext | None = None,
+) -> tuple[float, float, list[tuple[str, int]]]:
+    """Compute chips and mult for a hand without touching game state.
+
+    ``jokers`` may be a list of Jokers or an already compiled
+    :class:`~balatro.core.joker_pipeline.JokerPipeline`.  ``cards`` are the
+    scoring cards and ``held`` the cards left in hand.  ``roll`` is a
+    ``random.random``-style callable used for Lucky cards and random Joker
+    effects; when ``None`` they never trigger.  Joker effects that read the
+    game state need ``context``.  Scoring steps are recorded on ``trace``
+    when one is given.  Returns ``(chips, mult, payouts)`` where
+    ``payouts`` lists each ``(source, amount)`` of money earned.
+    """
+
+    if not isinstance(jokers, JokerPipeline):
+        jokers = JokerPipeline(jokers)
     base_score = HAND_SCORES.get(hand_type, {"chips": 0, "mult": 0})
     chips = base_score["chips"]
     mult = base_score["mult"]
-    messages: list[str] = [f"Base hand ({hand_type.value}): {chips} chips, {mult} mult"]
+    payouts: list[tuple[str, int]] = []
+    if trace is not None:
+        trace.add(hand_type.value, BASE_HAND, chips, mult)
 
-    bonus = game.player.hand_bonuses.get(hand_type.name, {"chips": 0, "mult": 0})
-    if bonus["chips"] or bonus["mult"]:
+    bonus = hand_bonuses.get(hand_type.name)
+    if bonus and (bonus["chips"] or bonus["mult"]):
         chips += bonus["chips"]
         mult += bonus["mult"]
-        messages.append(
-            f"Planet bonus: +{bonus['chips']} chips, +{bonus['mult']} mult"
-        )
-
-    rank_chip_values = {
-        Rank.TWO: 2,
-        Rank.THREE: 3,
-        Rank.FOUR: 4,
-        Rank.FIVE: 5,
-        Rank.SIX: 6,
-        Rank.SEVEN: 7,
-        Rank.EIGHT: 8,
-        Rank.NINE: 9,
-        Rank.TEN: 10,
-        Rank.JACK: 10,
-        Rank.QUEEN: 10,
-        Rank.KING: 10,
-        Rank.ACE: 11,
-    }
-
-    for card in cards:
-        rank_value = rank_chip_values[card.rank]
-        chips += rank_value
-        messages.append(f"{card} adds +{rank_value} chips (card value)")
-
-        if card.enhancement == Enhancement.GLASS:
-            mult += 2
-            messages.append(f"{card} Glass bonus: +2 mult")
-        elif card.enhancement == Enhancement.STEEL:
-            mult *= 1.5
-            messages.append(f"{card} Steel bonus: x1.5 mult")
-        elif card.enhancement == Enhancement.GOLD:
-            game.money += 3
-            game.round_earnings += 3
-            print(f"Gold Card played: +$3. Current money: ${game.money}")
-        elif card.enhancement == Enhancement.LUCKY:
-            if random.random() < 0.25:
-                mult += 20
-                messages.append(f"{card} Lucky bonus: +20 mult")
-        elif card.enhancement == Enhancement.MULT:
-            mult += 4
-            messages.append(f"{card} Mult bonus: +4 mult")
-        elif card.enhancement == Enhancement.CHIP:
-            chips += 10
-            messages.append(f"{card} Chip bonus: +10 chips")
-
-        if card.edition == Edition.FOIL:
-            chips += 50
-            messages.append(f"{card} Foil edition: +50 chips")
-        elif card.edition == Edition.HOLOGRAPHIC:
-            mult += 10
-            messages.append(f"{card} Holographic edition: +10 mult")
-        elif card.edition == Edition.POLYCHROME:
-            mult *= 1.5
-            messages.append(f"{card} Polychrome edition: x1.5 mult")
-
-        if card.seal == Seal.GOLD:
-            game.money += 3
-            game.round_earnings += 3
-            print(f"Gold Seal card played: +$3. Current money: ${game.money}")
-
-    for joker in jokers:
-        if joker.name == "Swashbuckler":
-            extra = sum(calculate_sell_value(j) for j in jokers if j is not joker)
-            if extra:
-                mult += extra
-                messages.append(f"{joker.name} adds +{extra} mult from other Jokers")
-        if not joker.applies_to(hand_type):
-            continue
-        new_chips = joker.apply_chips(chips)
-        if new_chips != chips:
-            messages.append(f"{joker.name} changes chips {chips} -> {new_chips}")
-        chips = new_chips
-        new_mult = joker.apply_mult(mult)
-        if new_mult != mult:
-            messages.append(f"{joker.name} changes mult {mult} -> {new_mult}")
-        mult = new_mult
-        if joker.retrigger:
-            mult *= 1 + joker.retrigger
-            messages.append(f"{joker.name} retriggers: x{1 + joker.retrigger} mult")
-
-    final_score = chips * mult
-    messages.append(f"Final: {chips} chips x {mult} mult = {final_score}")
-    return final_score, chips, mult, messages
+        if trace is not None:
+            trace.add(hand_type.value, PLANET_BONUS, bonus["chips"], bonus["mult"])
+
+    if context is not None:
+        context.hand_type = hand_type
+        context.scoring = cards
+        context.held = held
+    scale = jokers.chance_scale
+    lucky_chance = LUCKY_CHANCE * scale
+    per_card = jokers.per_card
+    if per_card:
+        triggers = jokers.triggers(cards, context)
+        hooks = jokers.card_hooks(cards)
+    for i, card in enumerate(cards):
+        for trigger in range(triggers[i] if per_card else 1):
+            if trigger and trace is not None:
+                trace.add(card, RETRIGGER)
+            chips += card.chip_value
+            if trace is not None:
+                trace.add(card, CARD_VALUE, card.chip_value)
+
+            enhancement = card.enhancement
+            if enhancement is Enhancement.LUCKY:
+                effect = LUCKY_EFFECT if roll is not None and roll() < lucky_chance else None
+            elif enhancement is Enhancement.GOLD:
+                payouts.append(("Gold Card", GOLD_PAYOUT))
+                effect = None
+            else:
+                effect = ENHANCEMENT_EFFECTS.get(enhancement)
+            if effect is not None:
+                chips += effect[1]
+                mult = (mult + effect[2]) * effect[3]
+                if trace is not None:
+                    trace.add(card, *effect)
+
+            effect = EDITION_EFFECTS.get(card.edition)
+            if effect is not None:
+                chips += effect[1]
+                mult = (mult + effect[2]) * effect[3]
+                if trace is not None:
+                    trace.add(card, *effect)
+
+            if card.seal is Seal.GOLD:
+                payouts.append(("Gold Seal card", GOLD_PAYOUT))
+
+            if per_card:
+                for hook in hooks[i]:
+                    chips, mult = fire(hook, chips, mult, card, context, roll, scale, trace, payouts)
+
+    if per_card and held:
+        triggers = jokers.triggers(held, context, held=True)
+        hooks = jokers.card_hooks(held, held=True)
+        for i, card in enumerate(held):
+            if not hooks[i]:
+                continue
+            for trigger in range(triggers[i]):
+                if trigger and trace is not None:
+                    trace.add(card, RETRIGGER)
+                for hook in hooks[i]:
+                    chips, mult = fire(hook, chips, mult, card, context, roll, scale, trace, payouts)
+
+    chips, mult = jokers.apply(hand_type, chips, mult, trace, context, roll, payouts)
+    return chips, mult, payouts
+
+
+def calculate_score(
+    hand_type: PokerHand,
+    cards: list[Card],
+    jokers: list[Joker] | JokerPipeline,
+    game,
+    trace: ScoreTrace | None = None,
+    played: list[Card] | tuple = (),
+) -> tuple[float, float, float]:
+    """Calculate the score of a hand and apply its payouts to ``game``.
+
+    ``cards`` are the scoring cards of the ``played`` cards, which have
+    already left ``game.player.hand``; the cards still in hand are the
+    held cards.  Pass a :class:`~balatro.core.score_trace.ScoreTrace` to
+    record the chip/mult breakdown; render it with
+    :meth:`ScoreTrace.render`.
+    """
+
+    if jokers is game.player.jokers:
+        jokers = game.player.joker_pipeline
+    elif not isinstance(jokers, JokerPipeline):
+        jokers = JokerPipeline(jokers)
+    context = ScoreContext(game, played or cards) if jokers.needs_context else None
+    chips, mult, payouts = score_hand(
+        hand_type,
+        cards,
+        jokers,
+        game.player.hand_bonuses,
+        trace,
+        game.rng.lucky.random,
+        game.player.hand,
+        context,
+    )
+    for source, amount in payouts:
+        game.money += amount
+        game.round_earnings += amount
+        if source in CARD_PAYOUTS:
+            game.emit(GoldPayout(source, amount, game.money))
+        else:
+            game.emit(JokerPayout(source, amount, game.money))
+
+    return chips * mult, chips, mult
+
+
+class ScoreDistribution(NamedTuple):
+    """Exact distribution of a hand's score.
+
+    ``values`` are the distinct possible scores in ascending order and
+    ``probabilities`` their matching probabilities, which sum to 1.
+    """
+
+    values: tuple[float, ...]
+    probabilities: tuple[float, ...]
+
+    @property
+    def expected_value(self) -> float:
+        return sum(v * p for v, p in zip(self.values, self.probabilities))
+
+    def probability_at_least(self, requirement: float) -> float:
+        """Return P(score >= ``requirement``)."""
+
+        return sum(self.probabilities[bisect_left(self.values, requirement):])
+
+
+def score_distribution(
+    hand_type: PokerHand,
+    cards: list[Card],
+    jokers: list[Joker] | JokerPipeline,
+    hand_bonuses: dict[str, dict[str, int]],
+    held: list[Card] | tuple = (),
+    context: ScoreContext | None = None,
+) -> ScoreDistribution:
+    """Compute the exact score distribution of a hand.
+
+    Scores the hand like :func:`score_hand`, but instead of rolling each
+    Lucky card or random Joker effect it carries a distribution of
+    ``(chips, mult)`` outcomes through every scoring step: each roll splits
+    every outcome into a triggered and an untriggered branch (Misprint into
+    one branch per mult it can add), and equal outcomes are merged, so
+    ``k`` Lucky cards cost at most ``2 ** k`` (usually ``k + 1``) outcomes
+    rather than repeated sampling.
+    """
+
+    if not isinstance(jokers, JokerPipeline):
+        jokers = JokerPipeline(jokers)
+    base_score = HAND_SCORES.get(hand_type, {"chips": 0, "mult": 0})
+    chips = base_score["chips"]
+    mult = base_score["mult"]
+    bonus = hand_bonuses.get(hand_type.name)
+    if bonus:
+        chips += bonus["chips"]
+        mult += bonus["mult"]
+
+    if context is not None:
+        context.hand_type = hand_type
+        context.scoring = cards
+        context.held = held
+    scale = jokers.chance_scale
+    lucky = (0, LUCKY_EFFECT[2], 1, min(1.0, LUCKY_CHANCE * scale), 0)
+    per_card = jokers.per_card
+    if per_card:
+        triggers = jokers.triggers(cards, context)
+        hooks = jokers.card_hooks(cards)
+    outcomes: dict[tuple[float, float], float] = {(chips, mult): 1.0}
+    for i, card in enumerate(cards):
+        card_chips, steps = card_contribution(card)
+        for _ in range(triggers[i] if per_card else 1):
+            outcomes = _step(outcomes, card_chips, 0, 1)
+            if card.enhancement is Enhancement.LUCKY:
+                outcomes = _step(outcomes, *lucky)
+            for added, factor in steps:
+                outcomes = _step(outcomes, 0, added, factor)
+            if per_card:
+                for hook in hooks[i]:
+                    outcomes = _step_hook(outcomes, hook, card, context, scale)
+
+    if per_card and held:
+        triggers = jokers.triggers(held, context, held=True)
+        hooks = jokers.card_hooks(held, held=True)
+        for i, card in enumerate(held):
+            for _ in range(triggers[i]):
+                for hook in hooks[i]:
+                    outcomes = _step_hook(outcomes, hook, card, context, scale)
+
+    for hook in jokers.ops_by_hand[hand_type]:
+        outcomes = _step_hook(outcomes, hook, None, context, scale)
+
+    scores: dict[float, float] = {}
+    for (final_chips, final_mult), p in outcomes.items():
+        score = final_chips * final_mult
+        scores[score] = scores.get(score, 0.0) + p
+    values = tuple(sorted(scores))
+    return ScoreDistribution(values, tuple(scores[v] for v in values))
+
+
+def _step(
+    outcomes: dict[tuple[float, float], float],
+    chips: float,
+    added: float,
+    factor: float,
+    chance: float = 1,
+    spread: int = 0,
+) -> dict[tuple[float, float], float]:
+    """Apply one scoring step to every outcome.
+
+    The step triggers with probability ``chance``, adding ``0..spread``
+    more mult uniformly at random.
+    """
+
+    if chance >= 1 and not spread:
+        if not (chips or added or factor != 1):
+            return outcomes
+        stepped: dict[tuple[float, float], float] = {}
+        for (value_chips, value_mult), p in outcomes.items():
+            key = (value_chips + chips, (value_mult + added) * factor)
+            stepped[key] = stepped.get(key, 0.0) + p
+        return stepped
+    hit = min(1.0, chance) / (spread + 1)
+    stepped = {}
+    for (value_chips, value_mult), p in outcomes.items():
+        if chance < 1:
+            key = (value_chips, value_mult)
+            stepped[key] = stepped.get(key, 0.0) + p * (1 - chance)
+        for extra in range(spread + 1):
+            key = (value_chips + chips, (value_mult + added + extra) * factor)
+            stepped[key] = stepped.get(key, 0.0) + p * hit
+    return stepped
+
+
+def _step_hook(outcomes, hook, card, context, scale):
+    amounts = hook_amounts(hook, card, context)
+    if amounts is None:
+        return outcomes
+    chips, added, factor, _ = amounts
+    chance = hook.chance if hook.chance >= 1 else hook.chance * scale
+    return _step(outcomes, chips, added, factor, chance, hook.spread)
+
+
+def play_distribution(game, cards: list[Card]) -> ScoreDistribution | None:
+    """Return the score distribution of playing ``cards`` in ``game``.
+
+    The scoring cards are chosen exactly as :meth:`Game.play_hand` does,
+    including Splash, and the rest of the hand is held.  Returns ``None`` when ``cards`` form no hand.
+    """
+
+    player = game.player
+    pipeline = player.joker_pipeline
+    hand_type, hand_cards = evaluate_hand_cached(cards, pipeline.rules.hand_rules)
+    if hand_type is None:
+        return None
+    scoring_cards = cards if pipeline.splash else hand_cards
+    in_play = {id(card) for card in cards}
+    held = [card for card in player.hand if id(card) not in in_play]
+    context = ScoreContext(game, cards) if pipeline.needs_context else None
+    return score_distribution(
+        hand_type, scoring_cards, pipeline, player.hand_bonuses, held, context
+    )
@@ -0,0 +1,299 @@
+"""Vectorized, gym-style environment stepping many games in lockstep.
+
+:class:`VectorEnv` owns ``K`` independent :class:`~balatro.core.game.Game`
+instances and steps them all with one batch of integer actions, returning
+stacked NumPy observations, rewards and done flags.  Finished games are
+reset automatically, so the batch never has holes.
+
+Actions are single integers per game:
+
+* ``PLAY + mask`` plays the hand cards whose bits are set in ``mask``
+  (bit ``i`` is hand slot ``i``, 1 to 5 cards);
+* ``DISCARD + mask`` discards them the same way;
+* ``BUY + i`` buys shop item ``i`` and ``LEAVE`` leaves the shop;
+* ``PICK + i`` takes option ``i`` of an open booster pack and ``SKIP``
+  skips it.
+
+Actions that do not fit the game's phase are ignored (reward ``0``);
+:meth:`VectorEnv.action_masks` lists the valid ones.  Target choices are
+never needed by this action space; if one comes up it is cancelled, which
+keeps the card.
+
+This module requires NumPy, which the interactive game does not need, so
+it is not imported by :mod:`balatro`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .cards.jokers import JOKERS, Joker
+from .cards.planet_cards import PLANET_CARDS, PlanetCard
+from .cards.spectral_cards import SPECTRAL_CARDS, SpectralCard
+from .cards.tarot_cards import TAROT_CARDS, TarotCard
+from .core.actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+)
+from .core.game import Game, Phase
+from .core.poker import PokerHand
+from .core.rng import derive_seed
+from .events import GameOver, HandPlayed
+from .shop.shop import BoosterPack
+from .shop.vouchers import VOUCHERS, Voucher
+
+HAND_SLOTS = 8
+JOKER_SLOTS = 8
+SHOP_SLOTS = 8
+PACK_SLOTS = 3
+
+PLAY = 0
+DISCARD = PLAY + (1 << HAND_SLOTS)
+BUY = DISCARD + (1 << HAND_SLOTS)
+LEAVE = BUY + SHOP_SLOTS
+PICK = LEAVE + 1
+SKIP = PICK + PACK_SLOTS
+N_ACTIONS = SKIP + 1
+
+PHASES = list(Phase)
+_PHASE_IDS = {phase: i for i, phase in enumerate(PHASES)}
+_HAND_IDS = {hand.name: i for i, hand in enumerate(PokerHand)}
+
+# Item kinds in the ``shop`` and ``pack`` observations.
+KINDS = (Joker, TarotCard, PlanetCard, SpectralCard, Voucher, BoosterPack)
+_CATALOG_IDS = {
+    Joker: JOKERS.ids,
+    TarotCard: TAROT_CARDS.ids,
+    PlanetCard: PLANET_CARDS.ids,
+    SpectralCard: SPECTRAL_CARDS.ids,
+    Voucher: VOUCHERS.ids,
+}
+_PACK_IDS = {"joker": 0, "tarot": 1, "planet": 2, "spectral": 3}
+
+# Hand slots selected by each subset mask, and which masks are legal
+# (1 to 5 cards) for a hand of ``n`` cards.
+_MASK_SLOTS = [tuple(i for i in range(HAND_SLOTS) if m >> i & 1) for m in range(1 << HAND_SLOTS)]
+_SIZES = np.array([len(slots) for slots in _MASK_SLOTS])
+_SUBSETS = np.array(
+    [
+        (_SIZES >= 1) & (_SIZES <= 5) & (np.arange(1 << HAND_SLOTS) < (1 << n))
+        for n in range(HAND_SLOTS + 1)
+    ]
+)
+
+
+def _item_code(item) -> tuple[int, int]:
+    """``(kind, catalog id)`` of a shop or pack item."""
+
+    for kind, cls in enumerate(KINDS):
+        if isinstance(item, cls):
+            if cls is BoosterPack:
+                return kind, _PACK_IDS[item.pack_type]
+            return kind, _CATALOG_IDS[cls].get(item.name, -1)
+    return -1, -1
+
+
+class VectorEnv:
+    """``num_envs`` games stepped in lockstep with integer actions.
+
+    Observations are a dict of arrays with a leading ``num_envs`` axis:
+
+    ``hand``
+        ``Card.code`` of each hand slot, ``-1`` when empty.
+    ``jokers``
+        catalog id of each Joker (order of ``jokers.json``), ``-1`` when empty.
+    ``hand_levels``
+        planet ``(chips, mult)`` bonus per poker hand, in ``PokerHand`` order.
+    ``shop`` / ``pack``
+        ``(kind, catalog id, cost)`` per slot, kinds indexing :data:`KINDS`.
+    ``money``, ``hands``, ``discards``, ``score``, ``blind_requirement``,
+    ``ante``, ``blind`` and ``phase`` (index into :data:`PHASES`).
+
+    The arrays are reused: each call overwrites the previous observation,
+    so copy them if they must outlive the next step.
+
+    Rewards are the score of played hands as a fraction of the current
+    blind's requirement.  A game is done when it is lost or when ante
+    ``max_ante`` is cleared; it is then reset with the next seed of its
+    slot, and ``info`` reports how it ended.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        deck_type: str = "Base",
+        seed: int | str = 0,
+        max_ante: int = 8,
+    ) -> None:
+        self.num_envs = num_envs
+        self.deck_type = deck_type
+        self.seed = seed
+        self.max_ante = max_ante
+        self.episodes = [0] * num_envs
+        self.games: list[Game] = []
+        k = num_envs
+        self.obs = {
+            "hand": np.full((k, HAND_SLOTS), -1, dtype=np.int16),
+            "jokers": np.full((k, JOKER_SLOTS), -1, dtype=np.int16),
+            "hand_levels": np.zeros((k, len(PokerHand), 2), dtype=np.int32),
+            "shop": np.full((k, SHOP_SLOTS, 3), -1, dtype=np.int16),
+            "pack": np.full((k, PACK_SLOTS, 3), -1, dtype=np.int16),
+            "money": np.zeros(k, dtype=np.int32),
+            "hands": np.zeros(k, dtype=np.int8),
+            "discards": np.zeros(k, dtype=np.int8),
+            "score": np.zeros(k, dtype=np.float64),
+            "blind_requirement": np.zeros(k, dtype=np.int64),
+            "ante": np.zeros(k, dtype=np.int16),
+            "blind": np.zeros(k, dtype=np.int8),
+            "phase": np.zeros(k, dtype=np.int8),
+        }
+        self._rewards = np.zeros(k, dtype=np.float64)
+        self._dones = np.zeros(k, dtype=bool)
+        self._won = np.zeros(k, dtype=bool)
+        self._final_ante = np.zeros(k, dtype=np.int16)
+
+    # ------------------------------------------------------------------
+    def _new_game(self, i: int) -> Game:
+        game = Game(self.deck_type, derive_seed(self.seed, f"env:{i}:{self.episodes[i]}"))
+        self.episodes[i] += 1
+        game.show_breakdown = False
+        game.draw_hand()
+        return game
+
+    def reset(self) -> dict[str, np.ndarray]:
+        """Start a fresh game in every slot and return the observations."""
+
+        self.episodes = [0] * self.num_envs
+        self.games = [self._new_game(i) for i in range(self.num_envs)]
+        for i, game in enumerate(self.games):
+            self._observe(i, game)
+        return self.obs
+
+    def _observe(self, i: int, game: Game) -> None:
+        obs = self.obs
+        player = game.player
+
+        row = obs["hand"][i]
+        row.fill(-1)
+        for j, card in enumerate(player.hand[:HAND_SLOTS]):
+            row[j] = card.code
+        row = obs["jokers"][i]
+        row.fill(-1)
+        ids = _CATALOG_IDS[Joker]
+        for j, joker in enumerate(player.jokers[:JOKER_SLOTS]):
+            row[j] = ids.get(joker.name, -1)
+        levels = obs["hand_levels"][i]
+        levels.fill(0)
+        for name, bonus in player.hand_bonuses.items():
+            levels[_HAND_IDS[name]] = bonus["chips"], bonus["mult"]
+
+        shop = obs["shop"][i]
+        shop.fill(-1)
+        if game.phase is Phase.SHOP:
+            for j, item in enumerate(game.shop.items[:SHOP_SLOTS]):
+                shop[j] = (*_item_code(item), item.cost)
+        pack = obs["pack"][i]
+        pack.fill(-1)
+        if game.phase is Phase.PACK:
+            for j, option in enumerate(game.pack.options[:PACK_SLOTS]):
+                pack[j] = (*_item_code(option), getattr(option, "cost", 0))
+
+        blind = game.blind_manager
+        obs["money"][i] = player.money
+        obs["hands"][i] = player.hands
+        obs["discards"][i] = player.discards
+        obs["score"][i] = player.score
+        obs["blind_requirement"][i] = blind.current.score_required
+        obs["ante"][i] = game.ante
+        obs["blind"][i] = blind.index
+        obs["phase"][i] = _PHASE_IDS[game.phase]
+
+    @staticmethod
+    def decode(action: int):
+        """The engine action for integer ``action``."""
+
+        if action < DISCARD:
+            return PlayCards(_MASK_SLOTS[action - PLAY])
+        if action < BUY:
+            return DiscardCards(_MASK_SLOTS[action - DISCARD])
+        if action < LEAVE:
+            return BuyItem(action - BUY)
+        if action == LEAVE:
+            return LeaveShop()
+        if action < SKIP:
+            return OpenPackChoice(action - PICK)
+        return OpenPackChoice(None)
+
+    def step(self, actions) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, dict]:
+        """Apply one action per game.
+
+        Returns ``(observations, rewards, dones, info)``; ``info`` holds the
+        ``won`` flag and ``final_ante`` of the games that just finished.
+        """
+
+        actions = np.asarray(actions)
+        rewards, dones = self._rewards, self._dones
+        rewards.fill(0.0)
+        dones.fill(False)
+        self._won.fill(False)
+        self._final_ante.fill(0)
+        decode = self.decode
+        for i, game in enumerate(self.games):
+            required = game.blind_manager.current.score_required
+            reward = 0.0
+            lost = False
+            for event in game.step(decode(int(actions[i]))):
+                if type(event) is HandPlayed:
+                    reward += event.score / required
+                elif type(event) is GameOver:
+                    lost = True
+            if game.phase is Phase.TARGETING:
+                game.step(ChooseTargets(()))
+            rewards[i] = reward
+            if lost or game.ante > self.max_ante:
+                dones[i] = True
+                self._won[i] = not lost
+                self._final_ante[i] = min(game.ante, self.max_ante)
+                game = self.games[i] = self._new_game(i)
+            self._observe(i, game)
+        return self.obs, rewards, dones, {"won": self._won, "final_ante": self._final_ante}
+
+    def action_masks(self) -> np.ndarray:
+        """Boolean ``(num_envs, N_ACTIONS)`` array of the actions each game accepts."""
+
+        masks = np.zeros((self.num_envs, N_ACTIONS), dtype=bool)
+        for i, game in enumerate(self.games):
+            row = masks[i]
+            if game.phase is Phase.PLAYING:
+                subsets = _SUBSETS[min(len(game.player.hand), HAND_SLOTS)]
+                row[PLAY:DISCARD] = subsets
+                if game.player.discards > 0:
+                    row[DISCARD:BUY] = subsets
+            elif game.phase is Phase.SHOP:
+                money = game.money
+                for j, item in enumerate(game.shop.items[:SHOP_SLOTS]):
+                    row[BUY + j] = item.cost <= money
+                row[LEAVE] = True
+            elif game.phase is Phase.PACK:
+                row[PICK : PICK + min(len(game.pack.options), PACK_SLOTS)] = True
+                row[SKIP] = True
+        return masks
+
+
+__all__ = [
+    "VectorEnv",
+    "N_ACTIONS",
+    "PLAY",
+    "DISCARD",
+    "BUY",
+    "LEAVE",
+    "PICK",
+    "SKIP",
+    "HAND_SLOTS",
+    "KINDS",
+    "PHASES",
+]
@@ -0,0 +1,256 @@
+"""Typed events emitted by the game engine.
+
+The engine never prints.  Every observable outcome is an event delivered
+to ``Game.listeners`` and returned from ``Game.step``.  Each event carries
+typed fields for programmatic consumers plus a ``message`` property with
+the text the command-line interface shows.  Messages are only formatted
+when read, so headless runs pay nothing for them.
+
+This module sits at the package root, importing nothing from the engine,
+so card, shop and core modules can all emit events.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from .cards.cards import Card
+    from .core.poker import PokerHand
+    from .core.score_trace import ScoreTrace
+
+
+class Notice(NamedTuple):
+    """Free-form description of an effect, e.g. a Tarot card resolving."""
+
+    source: str
+    text: str
+
+    @property
+    def message(self) -> str:
+        return self.text
+
+
+class ActionRejected(NamedTuple):
+    """An action was invalid in the current state; nothing changed."""
+
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return self.reason
+
+
+class HandPlayed(NamedTuple):
+    hand_type: PokerHand | None
+    cards: list[Card]
+    score: float
+    hands_left: int
+    trace: ScoreTrace | None = None
+
+    @property
+    def message(self) -> str:
+        lines = self.trace.render() if self.trace is not None else []
+        if self.hand_type is not None:
+            lines.append(f"Hand played: {self.hand_type.value} for {self.score} points!")
+        else:
+            lines.append("No valid poker hand was played.")
+        lines.append(f"Played {len(self.cards)} cards. {self.hands_left} hands remaining.")
+        return "\n".join(lines)
+
+
+class CardsDiscarded(NamedTuple):
+    cards: list[Card]
+    discards_left: int
+
+    @property
+    def message(self) -> str:
+        return f"Discarded {len(self.cards)} cards. {self.discards_left} discards remaining."
+
+
+class GoldPayout(NamedTuple):
+    source: str
+    amount: int
+    money: int
+
+    @property
+    def message(self) -> str:
+        return f"{self.source} played: +${self.amount}. Current money: ${self.money}"
+
+
+class JokerPayout(NamedTuple):
+    joker: str
+    amount: int
+    money: int
+
+    @property
+    def message(self) -> str:
+        return f"{self.joker}: +${self.amount}. Current money: ${self.money}"
+
+
+class RoundWinnings(NamedTuple):
+    base: int
+    earnings: int
+    leftover: int
+    interest: int
+    total: int
+
+    @property
+    def message(self) -> str:
+        return (
+            f"End of round winnings: base ${self.base} + joker/gold ${self.earnings} "
+            f"+ leftover hands ${self.leftover} + interest ${self.interest} = ${self.total}"
+        )
+
+
+class BlindCleared(NamedTuple):
+    blind: str
+    total: int
+
+    @property
+    def message(self) -> str:
+        return f"\n--- {self.blind} Cleared! You gained ${self.total}! ---"
+
+
+class GameOver(NamedTuple):
+    blind: str
+
+    @property
+    def message(self) -> str:
+        return f"\n--- Failed to clear {self.blind}! Game Over! ---"
+
+
+class AnteAdvanced(NamedTuple):
+    ante: int
+
+    @property
+    def message(self) -> str:
+        return "\n--- All Blinds in Ante Cleared! Advancing to next Ante! ---"
+
+
+class BlindStarted(NamedTuple):
+    blind: str
+    score_required: int
+
+    @property
+    def message(self) -> str:
+        return f"\n--- Advancing to {self.blind} (Score required: {self.score_required}) ---"
+
+
+class ShopOpened(NamedTuple):
+    items: list
+
+    @property
+    def message(self) -> str:
+        return ""
+
+
+class ItemPurchased(NamedTuple):
+    """``destination`` names the inventory the item went to, if any."""
+
+    item: object
+    destination: str | None = None
+
+    @property
+    def message(self) -> str:
+        if self.destination:
+            return f"Purchased {self.item.name}! Added to your {self.destination}."
+        return f"Purchased {self.item.name}!"
+
+
+class ItemGained(NamedTuple):
+    item: object
+    destination: str
+
+    @property
+    def message(self) -> str:
+        return f"Added {self.item.name} to your {self.destination}."
+
+
+class ItemSold(NamedTuple):
+    item: object
+    value: int
+
+    @property
+    def message(self) -> str:
+        return f"Sold {self.item.name} for ${self.value}."
+
+
+class NoRoom(NamedTuple):
+    """A consumable could not be stored because every slot is full."""
+
+    item: object
+
+    @property
+    def message(self) -> str:
+        return "No room for more consumables."
+
+
+class StickerAdded(NamedTuple):
+    joker: object
+    sticker: str
+
+    @property
+    def message(self) -> str:
+        article = "an" if self.sticker[0] in "AEIOU" else "a"
+        return f"  {self.joker.name} gained {article} {self.sticker} Sticker!"
+
+
+class VoucherActivated(NamedTuple):
+    voucher: object
+
+    @property
+    def message(self) -> str:
+        return f"{self.voucher.name} activated: {self.voucher.description}"
+
+
+class PackOpened(NamedTuple):
+    """A booster pack is waiting for the player to pick one of ``options``."""
+
+    name: str
+    options: list
+    cards: list[Card]
+
+    @property
+    def message(self) -> str:
+        lines = [f"--- {self.name} Contents ---"]
+        for i, opt in enumerate(self.options):
+            lines.append(f"[{i}] {opt.name} - {getattr(opt, 'description', '')}")
+        if self.cards:
+            lines.append("--- 9 Card Hand ---")
+            lines.extend(f"[{i}] {c}" for i, c in enumerate(self.cards))
+            lines.append("-------------------")
+        lines.append("---------------------------")
+        return "\n".join(lines)
+
+
+class TargetsRequested(NamedTuple):
+    """A consumable is waiting for up to ``card.targets`` of ``candidates``."""
+
+    card: object
+    candidates: list[Card]
+
+    @property
+    def message(self) -> str:
+        lines = ["--- Available Cards for Application ---"]
+        lines.extend(f"[{i}] {c}" for i, c in enumerate(self.candidates))
+        lines.append("---------------------------")
+        return "\n".join(lines)
+
+
+class JokerDebuffed(NamedTuple):
+    joker: object
+
+    @property
+    def message(self) -> str:
+        return f"{self.joker.name} has become debuffed due to Perishable Sticker!"
+
+
+class RentalCharged(NamedTuple):
+    joker: object
+    amount: int
+    money: int
+
+    @property
+    def message(self) -> str:
+        return f"Rental fee for {self.joker.name}: -${self.amount}. Current money: ${self.money}"
@@ -0,0 +1,285 @@
+"""SQLite store of simulated runs and the queries run over it.
+
+:class:`RunHistory` keeps one row per run (deck, policy, seeds, final
+state), one per cleared blind and the run's Joker and voucher lineups,
+with indexes on deck, seed and ante reached.  Runs are buffered and
+written ``batch_size`` at a time in one transaction, so recording costs
+the simulator almost nothing.
+
+Record with ``python main.py simulate --history runs.db`` and query with
+``python main.py history runs.db`` (see ``--help``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from .simulate import GameResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    deck TEXT NOT NULL,
+    policy TEXT NOT NULL,
+    base_seed TEXT NOT NULL,
+    game_index INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    ante INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    blinds_cleared INTEGER NOT NULL,
+    rounds INTEGER NOT NULL,
+    money INTEGER NOT NULL,
+    actions INTEGER NOT NULL,
+    truncated INTEGER NOT NULL,
+    hands TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_deck ON runs (deck, ante);
+CREATE INDEX IF NOT EXISTS runs_seed ON runs (seed);
+CREATE INDEX IF NOT EXISTS runs_ante ON runs (ante);
+
+CREATE TABLE IF NOT EXISTS blinds (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    number INTEGER NOT NULL,
+    ante INTEGER NOT NULL,
+    blind TEXT NOT NULL,
+    score REAL NOT NULL,
+    money INTEGER NOT NULL,
+    jokers TEXT NOT NULL,
+    PRIMARY KEY (run_id, number)
+);
+CREATE INDEX IF NOT EXISTS blinds_ante ON blinds (ante);
+
+CREATE TABLE IF NOT EXISTS run_jokers (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS run_jokers_name ON run_jokers (name);
+
+CREATE TABLE IF NOT EXISTS run_vouchers (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS run_vouchers_run ON run_vouchers (run_id);
+"""
+
+# Queries of the ``history`` subcommand: title and SQL, filtered by deck
+# through the ``:deck`` parameter (NULL for every deck).
+QUERIES = {
+    "decks": (
+        "Best and mean ante per deck",
+        """
+        SELECT deck, COUNT(*) AS runs, MAX(ante) AS best_ante,
+               ROUND(AVG(ante), 2) AS mean_ante, ROUND(AVG(won), 3) AS win_rate
+        FROM runs WHERE :deck IS NULL OR deck = :deck
+        GROUP BY deck ORDER BY best_ante DESC, mean_ante DESC
+        """,
+    ),
+    "jokers": (
+        "Jokers held at the end of winning runs",
+        """
+        SELECT j.name, COUNT(*) AS runs
+        FROM run_jokers AS j JOIN runs AS r ON r.id = j.run_id
+        WHERE r.won AND (:deck IS NULL OR r.deck = :deck)
+        GROUP BY j.name ORDER BY runs DESC, j.name LIMIT :limit
+        """,
+    ),
+    "antes": (
+        "Score and money when clearing blinds, by ante",
+        """
+        SELECT b.ante, COUNT(*) AS blinds, ROUND(AVG(b.score)) AS mean_score,
+               MAX(b.score) AS best_score, ROUND(AVG(b.money), 1) AS mean_money
+        FROM blinds AS b JOIN runs AS r ON r.id = b.run_id
+        WHERE :deck IS NULL OR r.deck = :deck
+        GROUP BY b.ante ORDER BY b.ante
+        """,
+    ),
+    "reached": (
+        "Runs by ante reached",
+        """
+        SELECT ante, COUNT(*) AS runs, SUM(won) AS won
+        FROM runs WHERE :deck IS NULL OR deck = :deck
+        GROUP BY ante ORDER BY ante
+        """,
+    ),
+}
+
+
+def _seed_key(seed: int) -> int:
+    """Game seeds are unsigned 64-bit; SQLite stores them as signed."""
+
+    return seed - (1 << 64) if seed >= 1 << 63 else seed
+
+
+class RunHistory:
+    """Run history in the SQLite database at ``path``.
+
+    Use as a context manager, or call :meth:`close`, so the last batch is
+    written.  With ``read_only`` the database must already exist: it is
+    opened for queries only, so a mistyped path raises
+    :class:`sqlite3.OperationalError` instead of creating an empty database.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, read_only: bool = False) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: list[tuple[GameResult, str, str, str]] = []
+        if read_only:
+            uri = Path(path).absolute().as_uri() + "?mode=ro"
+            self.connection = sqlite3.connect(uri, uri=True)
+            return
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(
+        self, result: GameResult, deck: str, policy: str, base_seed: int | str = 0
+    ) -> None:
+        """Queue ``result``; it is written with the next full batch."""
+
+        self._pending.append((result, deck, policy, str(base_seed)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(
+        self, results: Iterable[GameResult], deck: str, policy: str, base_seed: int | str = 0
+    ) -> None:
+        for result in results:
+            self.add(result, deck, policy, base_seed)
+
+    def flush(self) -> None:
+        """Write every queued run in one transaction."""
+
+        if not self._pending:
+            return
+        blinds = []
+        jokers = []
+        vouchers = []
+        with self.connection as db:
+            for result, deck, policy, base_seed in self._pending:
+                run_id = db.execute(
+                    "INSERT INTO runs (deck, policy, base_seed, game_index, seed, ante, won,"
+                    " blinds_cleared, rounds, money, actions, truncated, hands)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        deck,
+                        policy,
+                        base_seed,
+                        result.index,
+                        _seed_key(result.seed),
+                        result.ante,
+                        result.won,
+                        result.blinds_cleared,
+                        result.rounds,
+                        result.final_money,
+                        result.actions,
+                        result.truncated,
+                        json.dumps(result.hands),
+                    ),
+                ).lastrowid
+                blinds.extend(
+                    (run_id, number, b.ante, b.blind, b.score, b.money, ",".join(b.jokers))
+                    for number, b in enumerate(result.blinds)
+                )
+                jokers.extend((run_id, i, name) for i, name in enumerate(result.jokers))
+                vouchers.extend((run_id, name) for name in result.vouchers)
+            db.executemany("INSERT INTO blinds VALUES (?, ?, ?, ?, ?, ?, ?)", blinds)
+            db.executemany("INSERT INTO run_jokers VALUES (?, ?, ?)", jokers)
+            db.executemany("INSERT INTO run_vouchers VALUES (?, ?)", vouchers)
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.connection.close()
+
+    def query(self, name: str, deck: str | None = None, limit: int = 15) -> tuple[list, list]:
+        """Run one of :data:`QUERIES`; return its column names and rows."""
+
+        self.flush()
+        cursor = self.connection.execute(QUERIES[name][1], {"deck": deck, "limit": limit})
+        return [column[0] for column in cursor.description], cursor.fetchall()
+
+    def runs_for_seed(self, seed: int) -> tuple[list, list]:
+        """Every recorded run of the game with seed ``seed``."""
+
+        self.flush()
+        cursor = self.connection.execute(
+            "SELECT id, deck, policy, base_seed, game_index, ante, won, blinds_cleared, money"
+            " FROM runs WHERE seed = ? ORDER BY id",
+            (_seed_key(seed),),
+        )
+        return [column[0] for column in cursor.description], cursor.fetchall()
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def _print_table(columns: list, rows: list) -> None:
+    cells = [[str(c) for c in columns]] + [["" if v is None else str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    for row in cells:
+        print("  " + "  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("database", help="Run history written with simulate --history.")
+    parser.add_argument(
+        "--query",
+        choices=list(QUERIES),
+        action="append",
+        help="Query to run (repeatable; default: all).",
+    )
+    parser.add_argument("--deck", help="Only count runs with this deck.")
+    parser.add_argument("--seed", type=int, help="List the runs of the game with this seed.")
+    parser.add_argument("--limit", type=int, default=15, help="Rows of the jokers query.")
+
+
+def run(args: argparse.Namespace) -> None:
+    """Print the queries named in parsed arguments."""
+
+    try:
+        history = RunHistory(args.database, read_only=True)
+        count = len(history)
+    except sqlite3.Error as e:
+        raise SystemExit(f"Cannot read run history {args.database}: {e}")
+    with history:
+        print(f"--- {count} runs in {args.database} ---")
+        if args.seed is not None:
+            columns, rows = history.runs_for_seed(args.seed)
+            print(f"Runs with seed {args.seed}:")
+            if rows:
+                _print_table(columns, rows)
+            else:
+                print("  (no runs)")
+            return
+        for name in args.query or QUERIES:
+            title = QUERIES[name][0]
+            columns, rows = history.query(name, args.deck, args.limit)
+            print(f"{title}:")
+            if rows:
+                _print_table(columns, rows)
+            else:
+                print("  (no runs)")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Query the history of simulated runs.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
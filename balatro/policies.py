@@ -0,0 +1,141 @@
+"""Bot policies that play the headless engine.
+
+A policy is any callable ``policy(game, rng) -> action`` returning one of
+the actions in :mod:`balatro.core.actions` for the game's current phase.
+``rng`` is a per-game :class:`~balatro.core.rng.RngStream` owned by the
+caller, so a policy that needs randomness stays reproducible without
+touching the game's own streams.  Policies are looked up by name with
+:func:`resolve_policy`, which also accepts ``"module:function"`` paths so
+simulations can plug in bots defined elsewhere.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Callable
+
+from .cards.jokers import Joker
+from .core.actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    UseConsumable,
+)
+from .core.advisor import PlayAdvisor
+from .core.best_play import best_plays_for
+from .core.game import Game, Phase
+from .core.poker import PokerHand
+
+Policy = Callable[[Game, object], object]
+
+# Jokers the bots keep at most; the engine itself does not cap them.
+MAX_JOKERS = 5
+
+
+def greedy_policy(game: Game, rng) -> object:
+    """Play the best-scoring hand, use Planets and buy affordable Jokers.
+
+    Weak best plays (High Card or Pair) are discarded around while
+    discards last, keeping the cards that form the play.
+    """
+
+    player = game.player
+    if game.phase is Phase.PLAYING:
+        if player.planet_cards:
+            return UseConsumable("planet", 0)
+        plays = best_plays_for(game, 1)
+        if not plays:
+            return PlayCards(())
+        best = plays[0]
+        weak = best.hand_type in (PokerHand.HIGH_CARD, PokerHand.PAIR)
+        if weak and player.discards and player.hands > 1:
+            keep = set(best.indices)
+            rest = [i for i in range(len(player.hand)) if i not in keep]
+            return DiscardCards(tuple(rest[:5]))
+        return PlayCards(best.indices)
+    if game.phase is Phase.SHOP:
+        if len(player.jokers) < MAX_JOKERS:
+            for i, item in enumerate(game.shop.items):
+                if isinstance(item, Joker) and item.cost <= game.money:
+                    return BuyItem(i)
+        return LeaveShop()
+    if game.phase is Phase.PACK:
+        for i, option in enumerate(game.pack.options):
+            if isinstance(option, Joker) and len(player.jokers) < MAX_JOKERS:
+                return OpenPackChoice(i)
+        return OpenPackChoice(None)
+    return ChooseTargets(())
+
+
+def random_policy(game: Game, rng) -> object:
+    """Choose uniformly among simple legal actions."""
+
+    player = game.player
+    if game.phase is Phase.PLAYING:
+        if not player.hand:
+            return PlayCards(())
+        size = rng.randint(1, min(5, len(player.hand)))
+        cards = tuple(rng.sample(range(len(player.hand)), size))
+        if player.discards and rng.random() < 0.5:
+            return DiscardCards(cards)
+        return PlayCards(cards)
+    if game.phase is Phase.SHOP:
+        affordable = [i for i, item in enumerate(game.shop.items) if item.cost <= game.money]
+        if affordable and rng.random() < 0.5:
+            return BuyItem(rng.choice(affordable), rng.random() < 0.5)
+        return LeaveShop()
+    if game.phase is Phase.PACK:
+        return OpenPackChoice(rng.randrange(len(game.pack.options)))
+    candidates = game.pending.candidates
+    picks = min(len(candidates), game.pending.card.targets)
+    return ChooseTargets(tuple(rng.sample(range(len(candidates)), picks)))
+
+
+class SearchPolicy:
+    """Greedy policy whose plays and discards come from a :class:`PlayAdvisor`.
+
+    The advisor runs a fixed number of ``iterations`` per decision with the
+    caller's ``rng``, so simulations stay reproducible, and keeps its tree
+    from one decision to the next within a blind.
+    """
+
+    def __init__(self, iterations: int = 200, plays: int = 4) -> None:
+        self.advisor = PlayAdvisor(iterations=iterations, plays=plays)
+
+    def __call__(self, game: Game, rng) -> object:
+        if game.phase is Phase.PLAYING and not game.player.planet_cards:
+            advice = self.advisor.advise(game, rng)
+            if advice is not None:
+                return advice.action
+        return greedy_policy(game, rng)
+
+
+POLICIES: dict[str, Policy] = {
+    "greedy": greedy_policy,
+    "random": random_policy,
+    "search": SearchPolicy(),
+}
+
+
+def resolve_policy(name: str) -> Policy:
+    """Return the policy registered as ``name`` or found at ``module:function``."""
+
+    if name in POLICIES:
+        return POLICIES[name]
+    module, sep, attr = name.partition(":")
+    if not sep:
+        raise ValueError(f"Unknown policy: {name}")
+    return getattr(import_module(module), attr)
+
+
+__all__ = [
+    "Policy",
+    "POLICIES",
+    "SearchPolicy",
+    "greedy_policy",
+    "random_policy",
+    "resolve_policy",
+]
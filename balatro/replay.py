@@ -0,0 +1,77 @@
+"""Fast-forward a recorded game and optionally take over from any step.
+
+Record a session with ``python main.py --record game.log``, then replay
+it with ``python main.py replay game.log``: the log's actions are applied
+headlessly at full engine speed and the replay reports how many actions
+per second it ran.  ``--stop N`` stops after ``N`` actions and hands the
+game to the interactive CLI, which is how a crash from a long session is
+reproduced without playing it again by hand.  If an action raises, the
+replay names it before the traceback.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from .core.action_log import ActionLog, encode_action
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("log", help="Action log written with --record.")
+    parser.add_argument(
+        "--stop",
+        type=int,
+        default=None,
+        help="Stop after this many actions and continue in the interactive CLI.",
+    )
+    parser.add_argument(
+        "--record", help="When continuing interactively, keep recording to this log."
+    )
+
+
+def run(args: argparse.Namespace):
+    """Replay the log named in parsed arguments; return the game."""
+
+    log = ActionLog.load(args.log)
+    actions = log.actions[: args.stop]
+    game = log.new_game()
+    step = game.step
+    start = time.perf_counter()
+    for i, action in enumerate(actions):
+        try:
+            step(action)
+        except Exception:
+            print(f"Action {i} ({encode_action(action)}) raised:")
+            raise
+    seconds = time.perf_counter() - start
+
+    rate = len(actions) / seconds if seconds else 0.0
+    print(
+        f"Replayed {len(actions)} of {len(log)} actions (seed {log.seed}, {log.deck_type} Deck)"
+        f" in {seconds * 1000:.1f} ms: {rate:,.0f} actions/s"
+    )
+    print(
+        f"Ante {game.ante}, {game.blind_manager.current.name}, {game.phase.value},"
+        f" ${game.money}, score {game.player.score}"
+    )
+    if args.stop is None:
+        return game
+
+    from .cli import BalatroCLI
+
+    game.show_breakdown = True
+    if args.record:
+        ActionLog(log.seed, log.deck_type, list(actions)).attach(game)
+    save_format = getattr(args, "format", "json")
+    return BalatroCLI(game=game, record=args.record, save_format=save_format).run()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded Balatro game.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
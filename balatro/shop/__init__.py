@@ -4,10 +4,21 @@ The package exports lightweight components that are safe to import
 without triggering expensive or circular dependencies.  The `Shop`
 class itself performs imports from the cards package, so it is
 *not* re-exported here to avoid circular imports during module
-initialisation.
+initialisation.  `Voucher` is imported on first access, since its
+module loads the item catalog.
 """
 
-from .vouchers import Voucher
+from importlib import import_module
+
 from .stickers import Sticker, StickerType
 
+
+def __getattr__(name: str):
+    if name != "Voucher":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = import_module(".vouchers", __name__).Voucher
+    globals()[name] = value
+    return value
+
+
 __all__ = ["Voucher", "Sticker", "StickerType"]
@@ -0,0 +1,132 @@
+"""Constant-time weighted sampling for shop and booster pack draws.
+
+:class:`AliasTable` is Walker's alias method (built with Vose's
+algorithm): after an O(n) setup, each draw from a fixed discrete
+distribution costs one random number and one comparison.
+
+:class:`RarityPools` groups items by rarity and draws them with a
+per-item weight for each rarity, as :data:`~balatro.shop.shop.RARITY_WEIGHTS`
+describes: an alias table over the rarities (weighted by weight times
+pool size) picks the pool, then an item is taken uniformly from it.
+Sampling without replacement and excluding items (Jokers the player
+already owns) is done by rejection, which yields exactly the sequential
+draw in proportion to the remaining weights; when almost everything is
+excluded it falls back to one linear pass over what is left.
+"""
+
+from __future__ import annotations
+
+from typing import Collection, Generic, Iterable, Mapping, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Rejected draws in a row before falling back to a linear pass.
+MAX_REJECTIONS = 32
+
+
+class AliasTable:
+    """Draws index ``i`` with probability ``weights[i] / sum(weights)``."""
+
+    __slots__ = ("size", "prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        size = len(weights)
+        total = float(sum(weights))
+        if not size or total <= 0:
+            raise ValueError("An alias table needs a positive total weight.")
+        scaled = [w * size / total for w in weights]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+        # Whatever is left is 1 up to rounding.
+        self.size = size
+        self.prob = prob
+        self.alias = alias
+
+    def draw(self, rng) -> int:
+        """One index, from a single ``rng.random()`` call."""
+
+        x = rng.random() * self.size
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+
+class RarityPools(Generic[T]):
+    """``items`` by their ``rarity`` attribute, weighted per item by ``weights``.
+
+    Rarities missing from ``weights`` (or items without one) weigh 1.
+    Items are told apart by ``name`` for exclusion and for sampling
+    without replacement.
+    """
+
+    def __init__(self, items: Iterable[T], weights: Mapping[str, float]) -> None:
+        pools: dict[str, list[T]] = {}
+        for item in items:
+            pools.setdefault((getattr(item, "rarity", "") or "").lower(), []).append(item)
+        self.weights = {rarity: weights.get(rarity, 1) for rarity in pools}
+        self.rarities = [rarity for rarity in pools if self.weights[rarity] > 0]
+        self.pools = [tuple(pools[rarity]) for rarity in self.rarities]
+        self.table = AliasTable([self.weights[r] * len(p) for r, p in zip(self.rarities, self.pools)])
+
+    def probabilities(self) -> dict[str, float]:
+        """Chance of a draw having each rarity."""
+
+        masses = [self.weights[r] * len(p) for r, p in zip(self.rarities, self.pools)]
+        total = sum(masses)
+        return {rarity: mass / total for rarity, mass in zip(self.rarities, masses)}
+
+    def draw(self, rng) -> T:
+        """One item, with replacement."""
+
+        pool = self.pools[self.table.draw(rng)]
+        return pool[int(rng.random() * len(pool))]
+
+    def sample(self, rng, k: int, exclude: Collection[str] = ()) -> list[T]:
+        """Up to ``k`` distinct items whose names are not in ``exclude``.
+
+        Fewer than ``k`` come back only when fewer are left.
+        """
+
+        taken = set(exclude)
+        chosen: list[T] = []
+        rejected = 0
+        while len(chosen) < k:
+            item = self.draw(rng)
+            if item.name in taken:
+                rejected += 1
+                if rejected >= MAX_REJECTIONS:
+                    return chosen + self._sample_linear(rng, k - len(chosen), taken)
+                continue
+            rejected = 0
+            taken.add(item.name)
+            chosen.append(item)
+        return chosen
+
+    def _sample_linear(self, rng, k: int, taken: set[str]) -> list[T]:
+        left = [
+            (item, self.weights[rarity])
+            for rarity, pool in zip(self.rarities, self.pools)
+            for item in pool
+            if item.name not in taken
+        ]
+        chosen = []
+        while left and len(chosen) < k:
+            x = rng.random() * sum(weight for _, weight in left)
+            for i, (item, weight) in enumerate(left):
+                x -= weight
+                if x < 0:
+                    break
+            chosen.append(left.pop(i)[0])
+        return chosen
+
+
+__all__ = ["AliasTable", "RarityPools"]
@@ -1,14 +1,14 @@
 """This module defines the Shop class where players can purchase various items."""
 
-import random
-
-from ..cards.jokers import Joker, load_jokers
+from ..cards.catalog import clone
+from ..cards.jokers import Joker, offered_jokers
+from .sampling import RarityPools
 from .stickers import Sticker, StickerType
-from .vouchers import Voucher, load_vouchers
-from ..cards.tarot_cards import TarotCard, load_tarot_cards
-from ..cards.spectral_cards import SpectralCard, load_spectral_cards
-from ..cards.planet_cards import PlanetCard, load_planet_cards
-from ..utils import get_user_input
+from .vouchers import VOUCHERS, Voucher
+from ..cards.tarot_cards import TAROT_CARDS, TarotCard
+from ..cards.spectral_cards import SPECTRAL_CARDS, SpectralCard
+from ..cards.planet_cards import PLANET_CARDS, PlanetCard
+from ..events import ActionRejected, ItemGained, ItemPurchased, NoRoom, StickerAdded
 
 BASE_COSTS = {
     "Joker (Common)": 5,
@@ -30,17 +30,35 @@ RARITY_WEIGHTS = {
 }
 
 
-def weighted_sample(items, k):
-    temp_items = list(items)
-    weights = [RARITY_WEIGHTS.get(getattr(it, "rarity", "").lower(), 1) for it in temp_items]
-    selected = []
-    for _ in range(min(k, len(temp_items))):
-        choice = random.choices(temp_items, weights=weights, k=1)[0]
-        idx = temp_items.index(choice)
-        selected.append(choice)
-        temp_items.pop(idx)
-        weights.pop(idx)
-    return selected
+def copy_item(item, copy_card=None):
+    """Copy a shop or pack item so the copy can be bought and changed freely."""
+    if isinstance(item, Joker):
+        return item.copy()
+    if isinstance(item, BoosterPack):
+        return item.clone(copy_card)
+    clone = object.__new__(type(item))
+    clone.__dict__.update(item.__dict__)
+    return clone
+
+
+_joker_pools: RarityPools | None = None
+
+
+def joker_pools() -> RarityPools:
+    """The offered Jokers by rarity, weighted by :data:`RARITY_WEIGHTS`."""
+    global _joker_pools
+    if _joker_pools is None:
+        _joker_pools = RarityPools(offered_jokers(), RARITY_WEIGHTS)
+    return _joker_pools
+
+
+def owned_jokers(game) -> set[str]:
+    """Names of the Jokers shops and packs should not offer again.
+
+    With Showman owned Jokers may be offered again.
+    """
+    names = {joker.name for joker in game.player.jokers}
+    return set() if "Showman" in names else names
 
 
 class BoosterPack:
@@ -53,107 +71,76 @@ class BoosterPack:
         self.description = f"Choose a {pack_type} card"
         self.cost = BASE_COSTS["Booster Pack (Normal)"]
 
+    def clone(self, copy_card=None) -> "BoosterPack":
+        pack = object.__new__(BoosterPack)
+        pack.__dict__.update(self.__dict__)
+        if hasattr(self, "options"):
+            pack.options = [copy_item(opt) for opt in self.options]
+            pack.cards = self.cards[:] if copy_card is None else [copy_card(c) for c in self.cards]
+        return pack
+
     def open_pack(self, game):
-        """Generate cards based on pack type and let the player pick one."""
+        """Generate the pack's options and wait for the player to pick one."""
+        rng = game.rng.packs
         available_cards = []
         if self.pack_type == "joker":
-            options = weighted_sample(load_jokers(), 3)
+            options = [clone(j) for j in joker_pools().sample(rng, 3, owned_jokers(game))]
         elif self.pack_type == "tarot":
-            options = random.sample(load_tarot_cards(), 3)
+            options = TAROT_CARDS.sample(rng, 3)
             deck_cards = game.player.deck.cards
             available_cards = (
-                random.sample(deck_cards, min(9, len(deck_cards))) if deck_cards else []
+                rng.sample(deck_cards, min(9, len(deck_cards))) if deck_cards else []
             )
         elif self.pack_type == "spectral":
-            options = random.sample(load_spectral_cards(), 3)
+            options = SPECTRAL_CARDS.sample(rng, 3)
             deck_cards = game.player.deck.cards
             available_cards = (
-                random.sample(deck_cards, min(9, len(deck_cards))) if deck_cards else []
+                rng.sample(deck_cards, min(9, len(deck_cards))) if deck_cards else []
             )
         else:  # planet
-            options = random.sample(load_planet_cards(), 3)
-
-        print(f"--- {self.name} Contents ---")
-        for i, opt in enumerate(options):
-            desc = getattr(opt, "description", "")
-            print(f"[{i}] {opt.name} - {desc}")
-        if available_cards:
-            print("--- 9 Card Hand ---")
-            for i, c in enumerate(available_cards):
-                print(f"[{i}] {c}")
-            print("-------------------")
-        print("---------------------------")
-        choice = get_user_input("Choose an item by index or press Enter to skip: ").strip()
-        if choice == "":
-            return
-        try:
-            idx = int(choice)
-            card = options[idx]
-            if isinstance(card, Joker):
-                game.player.jokers.append(card)
-                print(f"Added {card.name} to your Jokers.")
-            elif isinstance(card, PlanetCard):
-                apply_now = (
-                    get_user_input("Apply this card now? (y/n): ")
-                    .strip()
-                    .lower()
-                    == "y"
-                )
-                if apply_now:
-                    card.apply_effect(game)
-                    game.last_used_card = card
-                else:
-                    if game.player.add_planet_card(card):
-                        print(f"Added {card.name} to your Planet Cards.")
-                    else:
-                        card.apply_effect(game)
-                        game.last_used_card = card
-            elif isinstance(card, TarotCard) or isinstance(card, SpectralCard):
-                if card.targets > 0 and available_cards:
-                    while True:
-                        print("--- 9 Card Hand ---")
-                        for i, c in enumerate(available_cards):
-                            print(f"[{i}] {c}")
-                        print("-------------------")
-                        target = get_user_input(
-                            "Select target indices separated by space or press Enter to keep card: "
-                        ).strip()
-                        if not target:
-                            break
-                        try:
-                            indices = [int(x) for x in target.split()][: card.targets]
-                            chosen = [
-                                available_cards[i]
-                                for i in indices
-                                if 0 <= i < len(available_cards)
-                            ]
-                            if len(chosen) != len(indices):
-                                raise ValueError
-                            card.apply_effect(game, chosen)
-                            return
-                        except ValueError:
-                            print("Invalid card selection.")
-                apply_now = False
-                if card.targets == 0:
-                    choice_apply = get_user_input(
-                        "Apply this card now? (y/n): "
-                    ).strip().lower()
-                    apply_now = choice_apply == "y"
-                if apply_now and card.targets == 0:
-                    card.apply_effect(game, [])
-                else:
-                    if isinstance(card, TarotCard):
-                        if game.player.add_tarot_card(card):
-                            print(f"Added {card.name} to your Tarot Cards.")
-                        elif card.targets == 0:
-                            card.apply_effect(game, [])
-                    else:
-                        if game.player.add_spectral_card(card):
-                            print(f"Added {card.name} to your Spectral Cards.")
-                        elif card.targets == 0:
-                            card.apply_effect(game, [])
-        except (ValueError, IndexError):
-            print("Invalid selection.")
+            options = PLANET_CARDS.sample(rng, 3)
+
+        self.options = options
+        self.cards = available_cards
+        game.open_pack(self)
+
+    def choose(self, game, index: int, use: bool = False) -> None:
+        """Take option ``index``; ``use`` applies a consumable right away.
+
+        Targeted Tarot and Spectral cards used from the pack ask for
+        targets among the pack's cards.
+        """
+        card = self.options[index]
+        if isinstance(card, Joker):
+            game.player.jokers.append(card)
+            game.emit(ItemGained(card, "Jokers"))
+        elif getattr(card, "targets", 0) > 0:
+            if use and self.cards:
+                game.request_targets(card, self.cards)
+            else:
+                gain_consumable(game, card)
+        elif use:
+            game.apply_consumable(card)
+        else:
+            gain_consumable(game, card, apply_if_full=True)
+
+
+def gain_consumable(game, card, apply_if_full: bool = False) -> bool:
+    """Store ``card`` in the player's inventory.
+
+    When every slot is full the card is applied instead if
+    ``apply_if_full`` is set, otherwise it is lost.  Returns whether the
+    card was stored.
+    """
+    destination = game.player.add_consumable(card)
+    if destination:
+        game.emit(ItemGained(card, destination))
+        return True
+    if apply_if_full:
+        game.apply_consumable(card)
+    else:
+        game.emit(NoRoom(card))
+    return False
 
 
 class Shop:
@@ -162,9 +149,14 @@ class Shop:
     def __init__(self):
         self.items: list = []
 
+    def clone(self, copy_card=None) -> "Shop":
+        shop = Shop()
+        shop.items = [copy_item(item, copy_card) for item in self.items]
+        return shop
+
     def generate_items(self, game):
         self.items = []
-        available_vouchers = load_vouchers()
+        rng = game.rng.shop
 
         booster_types = [
             ("Joker Pack", "joker"),
@@ -173,139 +165,84 @@ class Shop:
             ("Spectral Pack", "spectral"),
         ]
         for _ in range(2):
-            name, pack_type = random.choice(booster_types)
+            name, pack_type = rng.choice(booster_types)
             self.items.append(BoosterPack(name=name, pack_type=pack_type))
 
-        if not game.voucher_purchased and available_vouchers:
-            voucher = random.choice(available_vouchers)
+        if not game.voucher_purchased and len(VOUCHERS):
+            voucher = VOUCHERS.choice(rng)
             voucher.cost = BASE_COSTS["Voucher"]
             self.items.append(voucher)
 
+        # Jokers already owned or stocked are not offered again.
+        offered = owned_jokers(game)
         for _ in range(2):
-            choice = random.choice(["joker", "tarot", "planet"])
+            choice = rng.choice(["joker", "tarot", "planet"])
             if choice == "joker":
-                item = weighted_sample(load_jokers(), 1)[0]
+                picks = joker_pools().sample(rng, 1, offered)
+                if not picks:
+                    continue
+                item = clone(picks[0])
+                offered.add(item.name)
             elif choice == "tarot":
-                item = random.choice(load_tarot_cards())
+                item = TAROT_CARDS.choice(rng)
                 item.cost = BASE_COSTS["Tarot Card"]
             else:
-                item = random.choice(load_planet_cards())
+                item = PLANET_CARDS.choice(rng)
             self.items.append(item)
 
-    def display_items(self, money: int, player):
-        from ..utils import calculate_sell_value
-
-        print(f"--- Shop Items (Money: ${money}) ---")
-        for i, item in enumerate(self.items):
-            desc = getattr(item, "description", "")
-            print(f"[{i}] {item.name} - Cost: ${item.cost} - {desc}")
-        if player.jokers:
-            print("--- Sell Jokers ---")
-            for i, j in enumerate(player.jokers):
-                print(f"[j{i}] {j.name} - Sell for ${calculate_sell_value(j)}")
-        if player.tarot_cards:
-            print("--- Sell Tarot Cards ---")
-            for i, t in enumerate(player.tarot_cards):
-                print(f"[t{i}] {t.name} - Sell for ${calculate_sell_value(t)}")
-        if player.spectral_cards:
-            print("--- Sell Spectral Cards ---")
-            for i, s in enumerate(player.spectral_cards):
-                print(f"[s{i}] {s.name} - Sell for ${calculate_sell_value(s)}")
-        if player.planet_cards:
-            print("--- Sell Planet Cards ---")
-            for i, p in enumerate(player.planet_cards):
-                print(f"[p{i}] {p.name} - Sell for ${calculate_sell_value(p)}")
-        print("[L] Leave shop")
-        print("------------------")
-
-    def purchase_item(self, item_index: int, game) -> bool:
-        if 0 <= item_index < len(self.items):
-            item = self.items[item_index]
-            if game.money >= item.cost:
-                game.money -= item.cost
-                if isinstance(item, Joker):
-                    if game.ante >= 4 and random.random() < 0.3:
-                        item.stickers.append(Sticker(StickerType.ETERNAL))
-                        print(f"  {item.name} gained an Eternal Sticker!")
-                    elif game.ante >= 7 and random.random() < 0.3:
-                        item.stickers.append(Sticker(StickerType.PERISHABLE))
-                        print(f"  {item.name} gained a Perishable Sticker!")
-                    elif game.ante >= 8 and random.random() < 0.3:
-                        item.stickers.append(Sticker(StickerType.RENTAL))
-                        print(f"  {item.name} gained a Rental Sticker!")
-                    game.player.jokers.append(item)
-                    print(f"Purchased {item.name}! Added to your Jokers.")
-                elif isinstance(item, Voucher):
-                    game.player.vouchers.append(item)
-                    game.voucher_purchased = True
-                    item.apply_effect(game)
-                    print(f"Purchased {item.name}! Effect applied.")
-                elif isinstance(item, TarotCard):
-                    if item.targets > 0:
-                        if game.player.add_tarot_card(item):
-                            print(f"Purchased {item.name}! Added to your Tarot Cards.")
-                        else:
-                            print("No room for more consumables.")
-                            game.money += item.cost
-                            return False
-                    else:
-                        apply_now = (
-                            get_user_input("Apply this card now? (y/n): ")
-                            .strip()
-                            .lower()
-                            == "y"
-                        )
-                        if apply_now:
-                            item.apply_effect(game, [])
-                        else:
-                            if not game.player.add_tarot_card(item):
-                                item.apply_effect(game, [])
-                            else:
-                                print(f"Purchased {item.name}! Added to your Tarot Cards.")
-                elif isinstance(item, SpectralCard):
-                    if item.targets > 0:
-                        if game.player.add_spectral_card(item):
-                            print(f"Purchased {item.name}! Added to your Spectral Cards.")
-                        else:
-                            print("No room for more consumables.")
-                            game.money += item.cost
-                            return False
-                    else:
-                        apply_now = (
-                            get_user_input("Apply this card now? (y/n): ")
-                            .strip()
-                            .lower()
-                            == "y"
-                        )
-                        if apply_now:
-                            item.apply_effect(game, [])
-                        else:
-                            if not game.player.add_spectral_card(item):
-                                print(f"Purchased {item.name}, but no room to store it.")
-                            else:
-                                print(f"Purchased {item.name}! Added to your Spectral Cards.")
-                elif isinstance(item, PlanetCard):
-                    apply_now = (
-                        get_user_input("Apply this card now? (y/n): ")
-                        .strip()
-                        .lower()
-                        == "y"
-                    )
-                    if apply_now:
-                        item.apply_effect(game)
-                        game.last_used_card = item
-                    else:
-                        if not game.player.add_planet_card(item):
-                            item.apply_effect(game)
-                            game.last_used_card = item
-                        else:
-                            print(f"Purchased {item.name}! Added to your Planet Cards.")
-                elif isinstance(item, BoosterPack):
-                    item.open_pack(game)
-                self.items.pop(item_index)
-                return True
-            else:
-                print("Not enough money to purchase this item.")
+        # Astronomer: Planet cards and Celestial Packs are free.
+        if any(j.name == "Astronomer" and not j.is_debuffed for j in game.player.jokers):
+            for item in self.items:
+                if isinstance(item, PlanetCard) or getattr(item, "pack_type", "") == "planet":
+                    item.cost = 0
+
+    def purchase_item(self, item_index: int, game, use: bool = False) -> bool:
+        """Buy item ``item_index``; ``use`` applies a consumable at once.
+
+        Buying a booster pack opens it.  Targeted consumables are always
+        stored, and refunded when there is no room for them.
+        """
+        if not 0 <= item_index < len(self.items):
+            game.emit(ActionRejected("Invalid item index."))
+            return False
+        item = self.items[item_index]
+        # Credit Card lets money go into debt.
+        if game.money - item.cost < -game.player.joker_pipeline.rules.debt:
+            game.emit(ActionRejected("Not enough money to purchase this item."))
+            return False
+
+        if getattr(item, "targets", 0) > 0 and not game.player.has_consumable_space():
+            game.emit(NoRoom(item))
+            return False
+        game.money -= item.cost
+        self.items.pop(item_index)
+        if isinstance(item, Joker):
+            if game.ante >= 4 and game.rng.shop.random() < 0.3:
+                item.stickers.append(Sticker(StickerType.ETERNAL))
+                game.emit(StickerAdded(item, "Eternal"))
+            elif game.ante >= 7 and game.rng.shop.random() < 0.3:
+                item.stickers.append(Sticker(StickerType.PERISHABLE))
+                game.emit(StickerAdded(item, "Perishable"))
+            elif game.ante >= 8 and game.rng.shop.random() < 0.3:
+                item.stickers.append(Sticker(StickerType.RENTAL))
+                game.emit(StickerAdded(item, "Rental"))
+            game.player.jokers.append(item)
+            game.emit(ItemPurchased(item, "Jokers"))
+        elif isinstance(item, Voucher):
+            game.player.vouchers.append(item)
+            game.voucher_purchased = True
+            game.emit(ItemPurchased(item))
+            item.apply_effect(game)
+        elif isinstance(item, BoosterPack):
+            item.open_pack(game)
+        elif use and getattr(item, "targets", 0) == 0:
+            game.emit(ItemPurchased(item))
+            game.apply_consumable(item)
         else:
-            print("Invalid item index.")
-        return False
+            destination = game.player.add_consumable(item)
+            if destination:
+                game.emit(ItemPurchased(item, destination))
+            else:
+                game.emit(ItemPurchased(item))
+                game.apply_consumable(item)
+        return True
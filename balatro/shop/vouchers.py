@@ -5,6 +5,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from ..cards.catalog import Catalog
+from ..events import VoucherActivated
+
 
 class Voucher:
     """Simple representation of a shop voucher."""
@@ -30,7 +33,7 @@ class Voucher:
         func = effects.get(self.name)
         if func:
             func(game)
-        print(f"{self.name} activated: {self.description}")
+        game.emit(VoucherActivated(self))
 
     def to_dict(self) -> dict:
         return {
@@ -48,8 +51,8 @@ class Voucher:
 DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
-def load_vouchers() -> list[Voucher]:
-    """Load voucher definitions from the JSON data file."""
+def _parse_vouchers() -> list[Voucher]:
+    """Parse the voucher definitions in ``data/vouchers.json``."""
 
     with open(DATA_DIR / "vouchers.json", encoding="utf-8") as f:
         raw = json.load(f)
@@ -66,6 +69,15 @@ def load_vouchers() -> list[Voucher]:
     return vouchers
 
 
+VOUCHERS: Catalog[Voucher] = Catalog("vouchers", _parse_vouchers, DATA_DIR / "vouchers.json")
+
+
+def load_vouchers() -> list[Voucher]:
+    """Fresh copies of every voucher, in data file order."""
+
+    return VOUCHERS.instances()
+
+
 def voucher_from_dict(data: dict) -> Voucher:
     """Recreate a :class:`Voucher` instance from serialized data."""
 
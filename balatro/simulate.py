@@ -0,0 +1,297 @@
+"""Monte Carlo simulation of complete runs with a bot policy.
+
+:func:`simulate` plays ``n`` full games on the headless engine, sharded
+over a process pool, and yields a :class:`GameResult` per game as soon as
+it is available.  Each game's seed is derived from the base seed and the
+game's index alone, and results are yielded in index order, so a given
+base seed produces the same results whatever the number of workers.
+:func:`summarize` aggregates results into a :class:`SimulationSummary`.
+
+Run from the command line with ``python main.py simulate`` (see
+``--help``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import Counter
+from multiprocessing import Pool
+from typing import Iterable, Iterator, NamedTuple
+
+from .cards.jokers import JOKERS
+from .cards.planet_cards import PLANET_CARDS
+from .cards.spectral_cards import SPECTRAL_CARDS
+from .cards.tarot_cards import TAROT_CARDS
+from .core.game import Game
+from .core.rng import RngStream, derive_seed
+from .events import BlindCleared, HandPlayed
+from .policies import POLICIES, resolve_policy
+from .shop.vouchers import VOUCHERS
+
+# Safety net against policies that stop making progress.
+MAX_ACTIONS = 20_000
+
+# Blind requirements do not grow with the ante, so a run counts as won
+# once it clears this ante instead of playing on forever.
+WINNING_ANTE = 8
+
+
+class BlindRecord(NamedTuple):
+    """A cleared blind: its ante and name, the score that cleared it, the
+    player's money afterwards and the Jokers held, by name."""
+
+    ante: int
+    blind: str
+    score: float
+    money: int
+    jokers: tuple[str, ...]
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game.
+
+    ``money`` is the player's money after each cleared blind and
+    ``hands`` counts played poker hands by name.  ``won`` games cleared
+    the last ante of the simulation; ``truncated`` ones were stopped after
+    :data:`MAX_ACTIONS` actions.  ``jokers`` and ``vouchers`` are the
+    final lineup by name, ``blinds`` has one record per cleared blind and
+    ``final_money`` and ``rounds`` describe the game when it stopped.
+    """
+
+    index: int
+    seed: int
+    ante: int
+    won: bool
+    blinds_cleared: int
+    money: list[int]
+    hands: dict[str, int]
+    actions: int
+    truncated: bool
+    jokers: tuple[str, ...] = ()
+    vouchers: tuple[str, ...] = ()
+    blinds: tuple[BlindRecord, ...] = ()
+    final_money: int = 0
+    rounds: int = 0
+
+
+class SimulationSummary(NamedTuple):
+    games: int
+    seconds: float
+    mean_ante: float
+    win_rate: float
+    ante_counts: dict[int, int]
+    money_curve: list[float]
+    hand_frequencies: dict[str, float]
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def game_seed(base_seed: int | str, index: int) -> int:
+    """Seed of game ``index`` of a simulation."""
+
+    return derive_seed(base_seed, f"game:{index}")
+
+
+def play_game(
+    index: int,
+    base_seed: int | str = 0,
+    deck_type: str = "Base",
+    policy: str = "greedy",
+    max_ante: int = WINNING_ANTE,
+) -> GameResult:
+    """Play game ``index`` until it is lost or ante ``max_ante`` is cleared."""
+
+    seed = game_seed(base_seed, index)
+    act = resolve_policy(policy)
+    game = Game(deck_type=deck_type, seed=seed)
+    rng = RngStream(derive_seed(seed, "policy"))
+    money: list[int] = []
+    hands: Counter = Counter()
+    blinds: list[BlindRecord] = []
+
+    def record(event) -> None:
+        if isinstance(event, HandPlayed):
+            if event.hand_type is not None:
+                hands[event.hand_type.value] += 1
+        elif isinstance(event, BlindCleared):
+            money.append(game.money)
+            player = game.player
+            jokers = tuple(joker.name for joker in player.jokers)
+            blinds.append(BlindRecord(game.ante, event.blind, player.score, game.money, jokers))
+
+    game.listeners.append(record)
+    game.draw_hand()
+    actions = 0
+    while not game.game_over and game.ante <= max_ante and actions < MAX_ACTIONS:
+        game.step(act(game, rng))
+        actions += 1
+    won = game.ante > max_ante
+    ante = min(game.ante, max_ante)
+    truncated = not (won or game.game_over)
+    player = game.player
+    return GameResult(
+        index,
+        seed,
+        ante,
+        won,
+        len(money),
+        money,
+        dict(hands),
+        actions,
+        truncated,
+        tuple(joker.name for joker in player.jokers),
+        tuple(voucher.name for voucher in player.vouchers),
+        tuple(blinds),
+        game.money,
+        game.round,
+    )
+
+
+def _play(args: tuple) -> GameResult:
+    return play_game(*args)
+
+
+def _preload() -> None:
+    """Load the card catalogs and the shop's Joker pools into this process.
+
+    Both are cached per process, so this is a no-op when they are already
+    loaded.  :func:`simulate` calls it before starting the pool, so with
+    ``fork`` the workers inherit them; as the pool's initializer it loads
+    them in workers that start fresh instead, before their first game.
+    """
+
+    from .shop.shop import joker_pools
+
+    for catalog in (JOKERS, TAROT_CARDS, PLANET_CARDS, SPECTRAL_CARDS, VOUCHERS):
+        catalog.definitions
+    joker_pools()
+
+
+def simulate(
+    n: int,
+    deck_type: str = "Base",
+    policy: str = "greedy",
+    base_seed: int | str = 0,
+    workers: int | None = None,
+    max_ante: int = WINNING_ANTE,
+    chunksize: int = 8,
+) -> Iterator[GameResult]:
+    """Play ``n`` games and yield their results in index order.
+
+    ``policy`` is a name understood by
+    :func:`~balatro.policies.resolve_policy`; it is resolved inside each
+    worker so it does not need to be picklable.  ``workers=1`` plays in
+    the calling process.
+    """
+
+    jobs = [(i, base_seed, deck_type, policy, max_ante) for i in range(n)]
+    _preload()
+    if workers == 1:
+        yield from map(_play, jobs)
+        return
+    with Pool(workers, initializer=_preload) as pool:
+        yield from pool.imap(_play, jobs, chunksize)
+
+
+def summarize(results: Iterable[GameResult], seconds: float = 0.0) -> SimulationSummary:
+    results = list(results)
+    games = len(results)
+    ante_counts = Counter(r.ante for r in results)
+    hands: Counter = Counter()
+    totals: list[int] = []
+    reached: list[int] = []
+    for r in results:
+        hands.update(r.hands)
+        for blind, money in enumerate(r.money):
+            if blind == len(totals):
+                totals.append(0)
+                reached.append(0)
+            totals[blind] += money
+            reached[blind] += 1
+    played = sum(hands.values())
+    return SimulationSummary(
+        games,
+        seconds,
+        sum(r.ante for r in results) / games if games else 0.0,
+        sum(r.won for r in results) / games if games else 0.0,
+        dict(sorted(ante_counts.items())),
+        [total / count for total, count in zip(totals, reached)],
+        {hand: count / played for hand, count in hands.most_common()},
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-n", "--games", type=int, default=1000, help="Number of games to play.")
+    parser.add_argument("--deck", default="Base", help="Deck type (Base, Red, Green, Yellow).")
+    parser.add_argument(
+        "--policy",
+        default="greedy",
+        help=f"Bot policy: {', '.join(POLICIES)} or module:function.",
+    )
+    parser.add_argument("--seed", default="0", help="Base seed of the simulation.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPUs).")
+    parser.add_argument(
+        "--max-ante", type=int, default=WINNING_ANTE, help="Stop a run once this ante is cleared."
+    )
+    parser.add_argument("--jsonl", help="Also write every game's result to this JSON Lines file.")
+    parser.add_argument(
+        "--history", help="Also add every game to this SQLite run history (see 'history')."
+    )
+
+
+def run(args: argparse.Namespace) -> SimulationSummary:
+    """Run a simulation from parsed arguments and print its summary."""
+
+    seed = int(args.seed) if args.seed.lstrip("-").isdigit() else args.seed
+    out = open(args.jsonl, "w", encoding="utf-8") if args.jsonl else None
+    history = None
+    if getattr(args, "history", None):
+        from .history import RunHistory
+
+        history = RunHistory(args.history)
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in simulate(
+            args.games, args.deck, args.policy, seed, args.workers, args.max_ante
+        ):
+            results.append(result)
+            if out:
+                out.write(json.dumps(result._asdict()) + "\n")
+            if history is not None:
+                history.add(result, args.deck, args.policy, seed)
+    finally:
+        if out:
+            out.close()
+        if history is not None:
+            history.close()
+    summary = summarize(results, time.perf_counter() - start)
+
+    print(f"--- {summary.games} games, {args.deck} Deck, {args.policy} policy, seed {seed} ---")
+    print(f"Mean ante reached: {summary.mean_ante:.2f} (won {summary.win_rate:.1%})")
+    for ante, count in summary.ante_counts.items():
+        print(f"  Ante {ante}: {count} ({count / summary.games:.1%})")
+    print("Mean money after each cleared blind:")
+    print("  " + " ".join(f"${m:.0f}" for m in summary.money_curve))
+    print("Hand types played:")
+    for hand, share in summary.hand_frequencies.items():
+        print(f"  {hand}: {share:.1%}")
+    truncated = sum(r.truncated for r in results)
+    if truncated:
+        print(f"{truncated} games stopped after {MAX_ACTIONS} actions.")
+    print(f"{summary.games_per_second:.1f} games/s")
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate Balatro runs with a bot policy.")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
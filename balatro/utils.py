@@ -28,7 +28,7 @@ def calculate_sell_value(item) -> int:
     if base is None:
         cost = getattr(item, "cost", 0)
         base = math.floor(cost / 2)
-    base = max(1, int(base))
+    base = max(1, int(base)) + getattr(item, "extra_value", 0)
     edition = getattr(item, "edition", Edition.NONE)
     bonus_map = {
         Edition.FOIL: 2,
@@ -0,0 +1,100 @@
+"""Benchmark and brute-force check for :mod:`balatro.core.best_play`.
+
+Lineups cover Splash, Jokers acting on held cards, Four Fingers and
+Shortcut, and Jokers reading the game state through a :class:`ScoreContext` (with a game that has
+used some discards, money and cards).
+
+Run from the repository root::
+
+    python benchmarks/bench_best_play.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Card, Edition, Enhancement, Rank, Suit  # noqa: E402
+from balatro.cards.jokers import load_jokers  # noqa: E402
+from balatro.core.best_play import find_best_plays  # noqa: E402
+from balatro.core.game import Game  # noqa: E402
+from balatro.core.joker_effects import ScoreContext  # noqa: E402
+from balatro.core.joker_pipeline import JokerPipeline  # noqa: E402
+from balatro.core.poker import evaluate_hand  # noqa: E402
+from balatro.core.scoring import score_hand  # noqa: E402
+
+
+def brute_force_best(hand, jokers, bonuses, context=None) -> float:
+    splash = any(j.name == "Splash" for j in jokers)
+    rules = JokerPipeline(jokers).rules.hand_rules
+    best = 0.0
+    for size in range(1, 6):
+        for combo in combinations(hand, size):
+            hand_type, used = evaluate_hand(list(combo), rules)
+            scored = list(combo) if splash else used
+            held = [card for card in hand if card not in combo]
+            if context is not None:
+                context.played = list(combo)
+            chips, mult, _ = score_hand(
+                hand_type, scored, jokers, bonuses, held=held, context=context
+            )
+            best = max(best, chips * mult)
+    return best
+
+
+def main() -> None:
+    rng = random.Random(0)
+    catalog = load_jokers()
+    splash = [j for j in catalog if j.name == "Splash"]
+    by_name = {j.name: j for j in catalog}
+    held = [by_name[name] for name in ("Baron", "Raised Fist", "Hack", "Jolly Joker", "Mime")]
+    deck = [
+        Card(s, r, rng.choice(list(Enhancement)), rng.choice(list(Edition)))
+        for s in Suit
+        for r in Rank
+    ]
+    bonuses = {"PAIR": {"chips": 30, "mult": 3}}
+    hands = [rng.sample(deck, 8) for _ in range(2000)]
+
+    game = Game(seed=0)
+    game.player.discards = 2
+    game.player.money = 23
+    game.deck.draw(20)
+    context = ScoreContext(game)
+
+    def lineup(*names):
+        return [by_name[name] for name in names]
+
+    lineups = (
+        ("no Splash", catalog[:5], None),
+        ("Splash", catalog[:5] + splash, None),
+        ("held-card Jokers", held, None),
+        ("Baron", lineup("Baron"), None),
+        ("Baron and Mime", lineup("Baron", "Mime"), None),
+        ("Four Fingers", lineup("Four Fingers", "Crafty Joker", "Crazy Joker"), None),
+        ("Shortcut", lineup("Shortcut", "Crazy Joker"), None),
+        ("Banner (context)", lineup("Banner"), context),
+        ("Blue Joker (context)", lineup("Blue Joker"), context),
+        ("Bull, Bootstraps (context)", lineup("Bull", "Bootstraps", "Flower Pot"), context),
+        ("Half Joker (context)", lineup("Half Joker"), context),
+    )
+    for label, jokers, ctx in lineups:
+        for hand in hands[:100]:
+            best = find_best_plays(hand, jokers, bonuses, top=1, context=ctx)[0]
+            expected = brute_force_best(hand, jokers, bonuses, ctx)
+            assert abs(best.score - expected) < 1e-9, f"{label}: {best.score} != {expected}"
+
+        start = time.perf_counter()
+        for hand in hands:
+            find_best_plays(hand, jokers, bonuses, context=ctx)
+        per_call = (time.perf_counter() - start) / len(hands)
+        print(f"{label}: {per_call * 1e6:.0f} us per 8-card hand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Memory and speed numbers for the slotted, integer-encoded ``Card``.
+
+``LegacyCard`` mirrors the previous plain-object layout (five Enum
+attributes in an instance ``__dict__``) so both can be measured side by
+side for a 52-card and a 1,000-card deck.
+
+Run from the repository root::
+
+    python benchmarks/bench_cards.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import (  # noqa: E402
+    SUIT_SORT_ORDER,
+    Card,
+    Edition,
+    Enhancement,
+    Rank,
+    Seal,
+    Suit,
+)
+
+
+class LegacyCard:
+    def __init__(self, suit, rank, enhancement=Enhancement.NONE, edition=Edition.NONE, seal=Seal.NONE):
+        self.suit = suit
+        self.rank = rank
+        self.enhancement = enhancement
+        self.edition = edition
+        self.seal = seal
+
+
+LEGACY_RANK_ORDER = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8,
+    "9": 9, "10": 10, "Jack": 11, "Queen": 12, "King": 13, "Ace": 14,
+}
+
+
+def build(cls, size: int) -> list:
+    rng = random.Random(size)
+    return [cls(rng.choice(list(Suit)), rng.choice(list(Rank))) for _ in range(size)]
+
+
+def memory(cls, size: int) -> int:
+    tracemalloc.start()
+    deck = build(cls, size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deck
+    return current
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    for size in (52, 1000):
+        repeat = 20_000 // size * 10
+        legacy = build(LegacyCard, size)
+        slotted = build(Card, size)
+
+        legacy_sort = timed(
+            lambda: sorted(
+                legacy, key=lambda c: (LEGACY_RANK_ORDER[c.rank.value], c.suit.value)
+            ),
+            repeat,
+        )
+        slotted_sort = timed(
+            lambda: sorted(slotted, key=lambda c: c.rank_value << 2 | SUIT_SORT_ORDER[c.suit_code]),
+            repeat,
+        )
+        print(
+            f"{size:>5} cards: memory {memory(LegacyCard, size):>8,} B -> "
+            f"{memory(Card, size):>8,} B; sort {legacy_sort * 1e6:7.1f} us -> "
+            f"{slotted_sort * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
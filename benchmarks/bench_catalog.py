@@ -0,0 +1,82 @@
+"""Shop and booster pack generation throughput, and catalog isolation.
+
+Stocks the shop and opens one booster pack of every kind over and over,
+which is where the Joker, Tarot, Planet, Spectral and voucher catalogs
+are read during a run, and reports shop generations per second.  Then
+checks that items handed out by the catalogs are independent: adding
+stickers, editions or changing costs on them never shows up in later
+shops or in :func:`load_jokers`.
+
+Run from the repository root::
+
+    python benchmarks/bench_catalog.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Edition  # noqa: E402
+from balatro.cards.jokers import Joker, load_jokers  # noqa: E402
+from balatro.core.game import Game  # noqa: E402
+from balatro.shop.shop import BoosterPack  # noqa: E402
+from balatro.shop.stickers import Sticker, StickerType  # noqa: E402
+
+PACKS = [
+    BoosterPack(name, kind)
+    for name, kind in (
+        ("Joker Pack", "joker"),
+        ("Arcana Pack", "tarot"),
+        ("Celestial Pack", "planet"),
+        ("Spectral Pack", "spectral"),
+    )
+]
+
+
+def generate(game: Game) -> None:
+    game.shop.generate_items(game)
+    for pack in PACKS:
+        pack.open_pack(game)
+        game.pack = None
+
+
+def check_isolation() -> None:
+    game = Game(seed=1)
+    game.draw_hand()
+    for _ in range(200):
+        generate(game)
+        for item in game.shop.items + [o for p in PACKS for o in p.options]:
+            item.cost = 999
+            if isinstance(item, Joker):
+                item.stickers.append(Sticker(StickerType.ETERNAL))
+                item.edition = Edition.NEGATIVE
+    generate(game)
+    for item in game.shop.items + [o for p in PACKS for o in p.options]:
+        assert item.cost != 999, f"{item.name} kept a cost set on an earlier copy"
+        if isinstance(item, Joker):
+            assert not item.stickers, f"{item.name} kept stickers from an earlier copy"
+            assert getattr(item, "edition", Edition.NONE) is Edition.NONE
+    assert not any(j.stickers or j.cost == 999 for j in load_jokers())
+
+
+def main() -> None:
+    check_isolation()
+    print("isolation checks passed")
+
+    game = Game(seed=0)
+    game.draw_hand()
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 2.0:
+        generate(game)
+        count += 1
+    seconds = time.perf_counter() - start
+    print(f"shop + 4 packs: {count / seconds:,.0f} generations/s")
+
+
+if __name__ == "__main__":
+    main()
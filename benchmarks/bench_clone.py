@@ -0,0 +1,93 @@
+"""Throughput of :meth:`Game.clone`.
+
+Reports clones per second of a mid-game state in both modes against the
+old ``to_dict``/``from_dict`` round trip.  That clones are independent of
+the original is checked by ``tests/test_clone.py``.
+
+Run from the repository root::
+
+    python benchmarks/bench_clone.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.tarot_cards import load_tarot_cards  # noqa: E402
+from balatro.core.actions import (  # noqa: E402
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    UseConsumable,
+)
+from balatro.core.best_play import best_plays_for  # noqa: E402
+from balatro.core.game import Game, Phase  # noqa: E402
+
+
+def act(game: Game, rng: random.Random):
+    player = game.player
+    if game.phase is Phase.PLAYING:
+        roll = rng.random()
+        if roll < 0.2 and player.tarot_cards:
+            return UseConsumable("tarot", 0, tuple(range(min(2, len(player.hand)))))
+        if roll < 0.3 and player.spectral_cards:
+            return UseConsumable("spectral", 0)
+        if roll < 0.5 and player.discards:
+            return DiscardCards(tuple(rng.sample(range(len(player.hand)), 2)))
+        return PlayCards(best_plays_for(game, 1)[0].indices)
+    if game.phase is Phase.SHOP:
+        if game.shop.items and rng.random() < 0.7:
+            return BuyItem(rng.randrange(len(game.shop.items)), rng.random() < 0.5)
+        return LeaveShop()
+    if game.phase is Phase.PACK:
+        return OpenPackChoice(rng.randrange(len(game.pack.options)), True)
+    return ChooseTargets((0,))
+
+
+def advance(game: Game, rng: random.Random, steps: int) -> None:
+    for _ in range(steps):
+        if game.game_over:
+            return
+        game.step(act(game, rng))
+
+
+def start(seed: int) -> Game:
+    game = Game(seed=seed)
+    game.money = 200
+    game.player.consumable_slots = 6
+    game.player.tarot_cards.extend(load_tarot_cards()[:4])
+    game.draw_hand()
+    return game
+
+
+def rate(fn, game: Game, seconds: float = 1.5) -> float:
+    count = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < seconds:
+        for _ in range(100):
+            fn(game)
+        count += 100
+    return count / (time.perf_counter() - start_time)
+
+
+def main() -> None:
+    game = start(7)
+    advance(game, random.Random(7), 12)
+    for label, fn in (
+        ("to_dict/from_dict", lambda g: Game.from_dict(g.to_dict())),
+        ("clone()", lambda g: g.clone()),
+        ("clone(share_cards=True)", lambda g: g.clone(share_cards=True)),
+    ):
+        print(f"{label:24} {rate(fn, game):10,.0f} clones/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Per-action deck cost with the draw/discard pile model.
+
+Simulates rounds of discard/redraw and play/redraw on decks of 52 to
+10,000 cards.  ``LegacyDeck`` mirrors the previous behaviour of shuffling
+the whole deck on every returned card batch; ``BaseDeck`` now returns
+cards to a discard pile, moves them back only at round boundaries or when
+the draw pile is empty, and draws random cards instead of shuffling.
+Also checks that no card is lost or duplicated across the three zones
+and that the incremental composition counts match a full recount.
+
+Run from the repository root::
+
+    python benchmarks/bench_deck.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Card, Enhancement, Rank, Suit  # noqa: E402
+from balatro.core.deck import BaseDeck  # noqa: E402
+from balatro.core.rng import RngStream  # noqa: E402
+
+
+class LegacyDeck(BaseDeck):
+    def draw(self, num_cards=1):
+        if num_cards > len(self.cards):
+            drawn = self.cards[:]
+            self.cards = []
+            return drawn
+        return [self.cards.pop() for _ in range(num_cards)]
+
+    def return_cards(self, cards):
+        if not cards:
+            return
+        self.cards.extend(cards)
+        self.shuffle()
+
+    def reshuffle(self):
+        pass
+
+
+def make_deck(cls, size: int) -> BaseDeck:
+    deck = cls(RngStream(size))
+    rng = random.Random(size)
+    deck.cards = [Card(rng.choice(list(Suit)), rng.choice(list(Rank))) for _ in range(size)]
+    deck.shuffle()
+    return deck
+
+
+def play_rounds(deck: BaseDeck, rounds: int) -> int:
+    """Play ``rounds`` rounds of 3 discards and 4 hands; return actions."""
+
+    actions = 0
+    hand: list[Card] = []
+    for _ in range(rounds):
+        deck.return_cards(hand)
+        deck.reshuffle()
+        hand = deck.draw(8)
+        for _ in range(7):
+            out, hand = hand[:5], hand[5:]
+            deck.return_cards(out)
+            hand += deck.draw(len(out))
+            actions += 1
+    deck.return_cards(hand)
+    return actions
+
+
+def main() -> None:
+    for size in (52, 1_000, 10_000):
+        deck = make_deck(BaseDeck, size)
+        play_rounds(deck, 20)
+        zones = deck.cards + deck.discard_pile + deck.destroyed
+        assert len(zones) == size and len({id(c) for c in zones}) == size
+        with deck.changing(deck.cards[:10]):
+            for card in deck.cards[:10]:
+                card.enhancement = Enhancement.GLASS
+        counts = deck.rank_counts, deck.suit_counts, deck.enhancement_counts
+        deck.cards = deck.cards
+        assert counts == (deck.rank_counts, deck.suit_counts, deck.enhancement_counts)
+
+        for cls in (LegacyDeck, BaseDeck):
+            deck = make_deck(cls, size)
+            rounds = 200 if size <= 1_000 else 20
+            start = time.perf_counter()
+            actions = play_rounds(deck, rounds)
+            per = (time.perf_counter() - start) / actions
+            print(f"{cls.__name__:10} {size:>6} cards: {per * 1e6:9.2f} us/action")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Headless engine check and step throughput.
+
+Drives many seeded games through :meth:`Game.step` with a random policy
+that exercises every action type (play, discard, buy, sell, pack picks,
+consumables and target choices) while ``print``, ``input`` and the
+standard streams are replaced by objects that fail on use, proving that
+a headless run does no terminal I/O.  Reports actions per second.
+
+Run from the repository root::
+
+    python benchmarks/bench_engine.py
+"""
+
+from __future__ import annotations
+
+import builtins
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.core.actions import (  # noqa: E402
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    SellItem,
+    UseConsumable,
+)
+from balatro.core.best_play import best_plays_for  # noqa: E402
+from balatro.core.game import Game, Phase  # noqa: E402
+
+
+class NoIO:
+    def __getattr__(self, name):
+        raise AssertionError(f"terminal I/O during a headless run ({name})")
+
+
+def _forbidden(*_args, **_kwargs):
+    raise AssertionError("terminal I/O during a headless run")
+
+
+def choose(game: Game, rng: random.Random):
+    """Pick a random, mostly sensible action for the current phase."""
+
+    player = game.player
+    if game.phase is Phase.PLAYING:
+        roll = rng.random()
+        if roll < 0.05 and player.tarot_cards:
+            return UseConsumable("tarot", 0, (0,) if rng.random() < 0.5 else None)
+        if roll < 0.1 and player.spectral_cards:
+            return UseConsumable("spectral", 0)
+        if roll < 0.15 and player.planet_cards:
+            return UseConsumable("planet", 0)
+        cards = rng.sample(range(len(player.hand)), min(5, len(player.hand)))
+        if roll < 0.3 and player.discards:
+            return DiscardCards(tuple(cards[: rng.randint(1, len(cards))]))
+        if roll < 0.4:
+            return PlayCards(tuple(cards[: rng.randint(1, len(cards))]))
+        return PlayCards(best_plays_for(game, 1)[0].indices)
+    if game.phase is Phase.SHOP:
+        roll = rng.random()
+        if roll < 0.1 and player.jokers:
+            return SellItem("joker", rng.randrange(len(player.jokers)))
+        if roll < 0.6 and game.shop.items:
+            return BuyItem(rng.randrange(len(game.shop.items)), rng.random() < 0.5)
+        return LeaveShop()
+    if game.phase is Phase.PACK:
+        index = rng.randrange(len(game.pack.options)) if rng.random() < 0.9 else None
+        return OpenPackChoice(index, rng.random() < 0.5)
+    candidates = game.pending.candidates
+    picks = rng.sample(range(len(candidates)), min(len(candidates), game.pending.card.targets))
+    return ChooseTargets(tuple(picks) if rng.random() < 0.8 else ())
+
+
+def run(seeds: range) -> tuple[int, Counter]:
+    steps = 0
+    seen: Counter = Counter()
+    for seed in seeds:
+        game = Game(seed=seed)
+        # Plenty of money so the policy reaches every shop branch.
+        game.money = 100
+        game.draw_hand()
+        rng = random.Random(seed)
+        while not game.game_over and steps < 1_000_000:
+            action = choose(game, rng)
+            seen[type(action).__name__] += 1
+            for event in game.step(action):
+                seen[type(event).__name__] += 1
+            steps += 1
+    return steps, seen
+
+
+def main() -> None:
+    streams = sys.stdin, sys.stdout, sys.stderr
+    patched = builtins.print, builtins.input
+    sys.stdin = sys.stdout = sys.stderr = NoIO()
+    builtins.print = builtins.input = _forbidden
+    try:
+        start = time.perf_counter()
+        steps, seen = run(range(300))
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = streams
+        builtins.print, builtins.input = patched
+
+    for name in ("PlayCards", "DiscardCards", "UseConsumable", "BuyItem", "SellItem",
+                 "OpenPackChoice", "ChooseTargets", "LeaveShop", "TargetsRequested"):
+        assert seen[name], f"policy never produced {name}"
+    print(f"headless run: {steps} actions, no terminal I/O")
+    print(f"{steps / elapsed:,.0f} actions/s")
+    for name, count in sorted(seen.items()):
+        print(f"  {name:16} {count}")
+
+
+if __name__ == "__main__":
+    main()
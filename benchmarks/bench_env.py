@@ -0,0 +1,80 @@
+"""Throughput of :class:`balatro.env.VectorEnv` for K = 1, 64 and 1024.
+
+Steps every game with a uniformly random valid action (sampled from
+:meth:`VectorEnv.action_masks`) and reports game steps per second, with
+and without the cost of computing the masks.  Also checks that two
+environments with the same seed and actions stay identical and that
+auto-reset keeps every slot playable.
+
+Run from the repository root (requires NumPy)::
+
+    python benchmarks/bench_env.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from balatro.env import N_ACTIONS, VectorEnv  # noqa: E402
+
+
+def sample(masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """One random valid action per row of ``masks``."""
+
+    return np.argmax(rng.random(masks.shape) * masks, axis=1)
+
+
+def check_determinism(steps: int = 300) -> None:
+    a, b = VectorEnv(8, seed=3), VectorEnv(8, seed=3)
+    a.reset(), b.reset()
+    rng = np.random.default_rng(0)
+    finished = 0
+    for _ in range(steps):
+        masks = a.action_masks()
+        assert masks.any(axis=1).all(), "a game has no valid action"
+        assert (masks == b.action_masks()).all()
+        actions = sample(masks, rng)
+        obs_a, rew_a, done_a, _ = a.step(actions)
+        obs_b, rew_b, done_b, _ = b.step(actions)
+        assert all((obs_a[key] == obs_b[key]).all() for key in obs_a)
+        assert (rew_a == rew_b).all() and (done_a == done_b).all()
+        finished += int(done_a.sum())
+    assert finished, "no game finished, auto-reset untested"
+
+
+def bench(k: int, seconds: float = 3.0) -> tuple[float, float]:
+    env = VectorEnv(k, seed=k)
+    env.reset()
+    rng = np.random.default_rng(k)
+    steps = with_masks = 0
+    stepping = 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        actions = sample(env.action_masks(), rng)
+        t = time.perf_counter()
+        env.step(actions)
+        stepping += time.perf_counter() - t
+        steps += k
+    with_masks = steps / (time.perf_counter() - start)
+    return steps / stepping, with_masks
+
+
+def main() -> None:
+    check_determinism()
+    print(f"determinism and auto-reset checks passed ({N_ACTIONS} actions)")
+    for k in (1, 64, 1024):
+        step_rate, total_rate = bench(k)
+        print(
+            f"K={k:5}: {step_rate:10,.0f} steps/s (step only), "
+            f"{total_rate:10,.0f} steps/s (with masks and sampling)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Import time of one-off CLI runs, checked against a budget.
+
+Tools spawn ``main.py`` for short commands, so what a run imports before
+doing anything is paid on every call.  Each scenario runs in a fresh
+interpreter under ``python -X importtime``:
+
+* help: ``main.py --help``;
+* first prompt: ``main.py --seed 1`` up to the first action prompt;
+* load a save: loading a JSON save with :func:`load_game` and printing it.
+
+For each one the median total import time over :data:`RUNS` processes
+must stay under its budget, and modules that scenario has no use for
+(:data:`NOT_IMPORTED`) must not be imported at all.  The slowest modules
+of the last run are listed to show where the time goes.
+
+Run from the repository root::
+
+    python benchmarks/bench_importtime.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RUNS = 9
+TOP = 8
+
+# Modules only some commands need: the shop and consumables (until a
+# shop opens), tool modules (advisor, autosave, recording, simulation,
+# run history) and what only they import.
+TOOLS = (
+    "balatro.core.advisor",
+    "balatro.core.action_log",
+    "balatro.core.journal",
+    "balatro.simulate",
+    "balatro.history",
+    "sqlite3",
+    "multiprocessing",
+)
+CARDS = (
+    "balatro.shop.shop",
+    "balatro.shop.vouchers",
+    "balatro.cards.jokers",
+    "balatro.cards.tarot_cards",
+    "balatro.cards.spectral_cards",
+    "balatro.cards.planet_cards",
+    "pickle",
+)
+NOT_IMPORTED = {
+    "help": TOOLS + CARDS + ("balatro.core.binary_save", "balatro.core.game", "balatro.cli"),
+    "first prompt": TOOLS + CARDS + ("balatro.core.binary_save",),
+    "load a save": TOOLS + ("balatro.shop.shop",),
+}
+
+# Milliseconds of total import time, including the interpreter's own
+# startup imports: about 1.5x the medians measured when the shop, cards
+# and tools became lazy (before that, help and the first prompt both
+# imported about 120ms).
+BUDGET_MS = {"help": 45, "first prompt": 110, "load a save": 120}
+
+LOAD = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+from balatro.core.game import load_game
+game = load_game(sys.argv[1])
+print(game.seed, game.player.money, [j.name for j in game.player.jokers])
+"""
+
+
+def importtime(args: list[str], stdin: str = "") -> dict[str, int]:
+    """Self import time in microseconds of each module ``args`` imports."""
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(own)
+    return times
+
+
+def make_save(directory: str) -> str:
+    """A JSON save of a game that has been through a shop."""
+
+    sys.path.insert(0, str(ROOT))
+    from balatro.core.actions import LeaveShop, PlayCards
+    from balatro.core.best_play import best_plays_for
+    from balatro.core.game import Game, Phase, save_game
+
+    game = Game(seed=1)
+    game.draw_hand()
+    while game.phase is Phase.PLAYING:
+        game.step(PlayCards(best_plays_for(game)[0].indices))
+    if game.phase is Phase.SHOP:
+        game.step(LeaveShop())
+    path = str(Path(directory) / "save.json")
+    save_game(game, path)
+    return path
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios = {
+            "help": (["main.py", "--help"], ""),
+            "first prompt": (["main.py", "--seed", "1"], "q\n"),
+            "load a save": (["-c", LOAD, make_save(directory)], ""),
+        }
+        failures = []
+        for label, (args, stdin) in scenarios.items():
+            totals = []
+            for _ in range(RUNS):
+                times = importtime(args, stdin)
+                totals.append(sum(times.values()) / 1000)
+            total = statistics.median(totals)
+            budget = BUDGET_MS[label]
+            print(f"{label}: {total:.1f}ms of imports (budget {budget}ms, {len(times)} modules)")
+            for name, own in sorted(times.items(), key=lambda item: -item[1])[:TOP]:
+                print(f"  {own / 1000:6.1f}ms {name}")
+            if total > budget:
+                failures.append(f"{label}: {total:.1f}ms over the {budget}ms budget")
+            loaded = sorted(set(NOT_IMPORTED[label]) & set(times))
+            if loaded:
+                failures.append(f"{label}: imports {', '.join(loaded)}")
+    assert not failures, "; ".join(failures)
+    print("all scenarios within budget")
+
+
+if __name__ == "__main__":
+    main()
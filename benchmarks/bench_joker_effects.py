@@ -0,0 +1,55 @@
+"""Speed of the compiled Joker effects.
+
+Reports how long compiling the whole catalog as one lineup takes and hands
+per second scored with random five-Joker lineups.  The coverage and effect
+checks live in ``tests/test_joker_effects.py``.
+
+Run from the repository root::
+
+    python benchmarks/bench_joker_effects.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Card, Rank, Suit  # noqa: E402
+from balatro.cards.jokers import load_jokers  # noqa: E402
+from balatro.core.joker_pipeline import JokerPipeline  # noqa: E402
+from balatro.core.poker import evaluate_hand  # noqa: E402
+from balatro.core.scoring import score_hand  # noqa: E402
+
+HANDS = 20_000
+LINEUPS = 200
+
+
+def main() -> None:
+    catalog = load_jokers()
+    start = time.perf_counter()
+    pipeline = JokerPipeline(catalog)
+    elapsed = time.perf_counter() - start
+    print(f"full catalog lineup: {len(pipeline.hooks)} hooks compiled in {elapsed * 1e3:.1f} ms")
+
+    rng = random.Random(0)
+    deck = [Card(suit, rank) for suit in Suit for rank in Rank]
+    hands = []
+    for _ in range(1000):
+        drawn = rng.sample(deck, 8)
+        hand_type, used = evaluate_hand(drawn[:5])
+        hands.append((hand_type, used, drawn[5:]))
+    pipelines = [JokerPipeline(rng.sample(catalog, 5)) for _ in range(LINEUPS)]
+    start = time.perf_counter()
+    for i in range(HANDS):
+        hand_type, used, held = hands[i % len(hands)]
+        score_hand(hand_type, used, pipelines[i % LINEUPS], {}, held=held)
+    per_hand = (time.perf_counter() - start) / HANDS
+    print(f"random 5-Joker lineups: {per_hand * 1e6:.1f} us/hand, {1 / per_hand:,.0f} hands/s")
+
+
+if __name__ == "__main__":
+    main()
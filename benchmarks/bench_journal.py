@@ -0,0 +1,136 @@
+"""Crash recovery and per-action cost of the autosave journal.
+
+For each seed, a child process plays a game with the greedy bot under a
+:class:`~balatro.core.journal.Journal` (compacting often, so recovery
+crosses snapshots) and is killed with ``os._exit`` after a number of
+actions, without closing the journal.  The parent recovers the game and
+checks that it matches the same game played to the same point in
+process.  Then reports how long ``Game.step`` takes with and without a
+journal and what ``Journal.record`` alone costs per action.
+
+Run from the repository root::
+
+    python benchmarks/bench_journal.py
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.core.game import Game  # noqa: E402
+from balatro.core.journal import Journal  # noqa: E402
+from balatro.core.rng import RngStream  # noqa: E402
+from balatro.policies import greedy_policy  # noqa: E402
+
+COMPACT_EVERY = 40
+
+
+def new_game(seed: int) -> Game:
+    game = Game(seed=seed)
+    game.show_breakdown = False
+    game.draw_hand()
+    return game
+
+
+def play(game: Game, seed: int, actions: int) -> Game:
+    rng = RngStream(seed)
+    for _ in range(actions):
+        if game.game_over:
+            break
+        game.step(greedy_policy(game, rng))
+    return game
+
+
+def state(game: Game) -> tuple:
+    return game.to_dict(), game.phase, [item.name for item in game.shop.items]
+
+
+def child(base: str, seed: int, actions: int) -> None:
+    """Play under a journal and die without closing it."""
+
+    game = new_game(seed)
+    Journal.start(base, game, fsync_interval=0.01, compact_every=COMPACT_EVERY)
+    play(game, seed, actions)
+    os._exit(0)
+
+
+def check_recovery(seeds: range) -> int:
+    recovered = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in seeds:
+            actions = 30 + seed * 37 % 250
+            base = str(Path(tmp) / f"autosave{seed}")
+            subprocess.run(
+                [sys.executable, __file__, "--child", base, str(seed), str(actions)],
+                check=True,
+            )
+            journal = Journal.recover(base, fsync_interval=None)
+            assert journal is not None, f"seed {seed}: nothing to recover"
+            journal.close()
+            expected = play(new_game(seed), seed, actions)
+            assert state(journal.game) == state(expected), f"seed {seed} recovered differently"
+            recovered += journal.recovered
+    return recovered
+
+
+def timings(seeds: range, journaled: bool, tmp: str) -> tuple[list[float], list[float]]:
+    steps = []
+    records = []
+    for seed in seeds:
+        game = new_game(seed)
+        journal = None
+        if journaled:
+            journal = Journal.start(str(Path(tmp) / "autosave"), game, compact_every=COMPACT_EVERY)
+            record = journal.record
+
+            def timed(action, record=record):
+                start = time.perf_counter()
+                record(action)
+                records.append(time.perf_counter() - start)
+
+            journal.record = timed
+        rng = RngStream(seed)
+        while not game.game_over and game.ante <= 8:
+            action = greedy_policy(game, rng)
+            start = time.perf_counter()
+            game.step(action)
+            steps.append(time.perf_counter() - start)
+        if journal is not None:
+            journal.close()
+    return steps, records
+
+
+def summary(label: str, samples: list[float]) -> str:
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    p99 = samples[int(len(samples) * 0.99)]
+    return (
+        f"{label:24} mean {mean * 1e6:7.1f} us  p99 {p99 * 1e6:7.1f} us"
+        f"  max {samples[-1] * 1e6:8.1f} us"
+    )
+
+
+def main() -> None:
+    replayed = check_recovery(range(12))
+    print(f"recovery checks passed (12 killed games, {replayed} actions replayed)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain, _ = timings(range(30), False, tmp)
+        journaled, records = timings(range(30), True, tmp)
+    print(summary("step, no journal", plain))
+    print(summary("step, journal", journaled))
+    print(summary("Journal.record", records))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        main()
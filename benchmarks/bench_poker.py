@@ -0,0 +1,104 @@
+"""Micro-benchmark for :func:`balatro.core.poker.evaluate_hand`.
+
+Compares the table-driven evaluator against the previous Counter-based
+implementation, kept here as a reference; ``tests/test_poker.py`` checks
+that both agree.
+
+Run from the repository root::
+
+    python benchmarks/bench_poker.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Card, Rank, Suit  # noqa: E402
+from balatro.core.poker import HandCache, PokerHand, evaluate_hand  # noqa: E402
+
+
+def legacy_evaluate_hand(cards):
+    """The Counter-based evaluator this benchmark is measured against."""
+
+    if not cards:
+        return None, []
+
+    def get_rank_value(rank):
+        rank_order = {r: i for i, r in enumerate(Rank, 2)}
+        return rank_order[rank]
+
+    ranks = [c.rank for c in cards]
+    suits = [c.suit for c in cards]
+    rank_counts = Counter(ranks)
+    suit_counts = Counter(suits)
+    is_flush = len(suit_counts) == 1
+    unique_rank_values = sorted([get_rank_value(r) for r in set(ranks)])
+    is_straight = (
+        len(unique_rank_values) == 5
+        and (unique_rank_values[-1] - unique_rank_values[0] == 4)
+    )
+    if not is_straight and set(unique_rank_values) == {14, 2, 3, 4, 5}:
+        is_straight = True
+    counts = sorted(rank_counts.values(), reverse=True)
+    if is_straight and is_flush:
+        return PokerHand.STRAIGHT_FLUSH, cards
+    if counts[0] == 5:
+        return PokerHand.FIVE_OF_A_KIND, cards
+    if counts[0] == 4:
+        rank = rank_counts.most_common(1)[0][0]
+        return PokerHand.FOUR_OF_A_KIND, [c for c in cards if c.rank == rank]
+    if counts == [3, 2]:
+        return PokerHand.FULL_HOUSE, cards
+    if is_flush:
+        return PokerHand.FLUSH, cards
+    if is_straight:
+        return PokerHand.STRAIGHT, cards
+    if counts[0] == 3:
+        rank = rank_counts.most_common(1)[0][0]
+        return PokerHand.THREE_OF_A_KIND, [c for c in cards if c.rank == rank]
+    if list(rank_counts.values()).count(2) == 2:
+        return PokerHand.TWO_PAIR, [c for c in cards if rank_counts[c.rank] == 2]
+    if counts[0] == 2:
+        rank = rank_counts.most_common(1)[0][0]
+        return PokerHand.PAIR, [c for c in cards if c.rank == rank]
+    highest = max(cards, key=lambda c: get_rank_value(c.rank))
+    return PokerHand.HIGH_CARD, [highest]
+
+
+def random_hands(count: int, size: int, seed: int = 0) -> list[list[Card]]:
+    rng = random.Random(seed)
+    deck = [Card(suit, rank) for suit in Suit for rank in Rank]
+    return [rng.sample(deck, size) for _ in range(count)]
+
+
+def rate(func, hands) -> float:
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    return len(hands) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    for size in (1, 3, 5):
+        sample = random_hands(100_000, size, seed=size)
+        old = rate(legacy_evaluate_hand, sample)
+        new = rate(evaluate_hand, sample)
+        print(
+            f"{size}-card hands: legacy {old:,.0f}/s, table {new:,.0f}/s "
+            f"({new / old:.1f}x)"
+        )
+
+    cache = HandCache()
+    sample = random_hands(20_000, 5, seed=7) * 5
+    cached = rate(cache.evaluate, sample)
+    print(f"cached 5-card hands: {cached:,.0f}/s ({cache})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark for :mod:`balatro.core.poker_batch`.
+
+Reports hands per second over a million five-card hands;
+``tests/test_poker_batch.py`` cross-checks the results with
+:func:`balatro.core.poker.evaluate_hand`.
+
+Run from the repository root (requires NumPy)::
+
+    python benchmarks/bench_poker_batch.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from balatro.core.poker_batch import evaluate_hands  # noqa: E402
+
+
+def benchmark(count: int = 1_000_000, seed: int = 1) -> None:
+    gen = np.random.default_rng(seed)
+    codes = np.stack([gen.permutation(52)[:5] for _ in range(10_000)])
+    codes = np.tile(codes, (count // len(codes), 1))
+    ranks, suits = codes % 13, codes // 13
+    start = time.perf_counter()
+    evaluate_hands(ranks, suits)
+    elapsed = time.perf_counter() - start
+    print(f"batch: {count / elapsed:,.0f} hands/s over {count:,} five-card hands")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,112 @@
+"""Reproducibility checks and speed numbers for per-game random streams.
+
+Plays the same scripted run with the same seed in several worker
+processes and checks that every worker ends in an identical state, that
+a saved game continues exactly like the original, and that drawing extra
+numbers from the shop stream leaves the deck order untouched.  In each
+shop the scripted player buys the first item, takes the first option of
+any pack, skips target choices and leaves.
+
+Run from the repository root::
+
+    python benchmarks/bench_rng.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.core.actions import (  # noqa: E402
+    BuyItem,
+    ChooseTargets,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+)
+from balatro.core.best_play import best_plays_for  # noqa: E402
+from balatro.core.game import Game, Phase  # noqa: E402
+from balatro.core.rng import RngStream  # noqa: E402
+
+
+def play(game: Game, turns: int) -> None:
+    """Make the best available play ``turns`` times."""
+
+    played = 0
+    shopped = False
+    while played < turns and not game.game_over:
+        if game.phase is Phase.PLAYING:
+            game.step(PlayCards(best_plays_for(game, 1)[0].indices))
+            played += 1
+            shopped = False
+        elif game.phase is Phase.SHOP:
+            game.step(LeaveShop() if shopped else BuyItem(0))
+            shopped = True
+        elif game.phase is Phase.PACK:
+            game.step(OpenPackChoice(0))
+        else:
+            game.step(ChooseTargets(()))
+
+
+def run(seed: int) -> dict:
+    game = Game(seed=seed)
+    game.draw_hand()
+    play(game, 40)
+    return game.to_dict()
+
+
+def check_processes(seed: int, workers: int = 4) -> None:
+    with ProcessPoolExecutor(workers) as pool:
+        results = list(pool.map(run, [seed] * workers))
+    assert all(r == results[0] for r in results), "workers diverged"
+    assert results[0] == run(seed), "workers differ from the parent process"
+
+
+def check_round_trip(seed: int) -> None:
+    game = Game(seed=seed)
+    game.draw_hand()
+    play(game, 3)
+    restored = Game.from_dict(game.to_dict())
+    play(game, 6)
+    play(restored, 6)
+    assert game.to_dict() == restored.to_dict(), "restored game diverged"
+
+
+def check_independence(seed: int) -> None:
+    a, b = Game(seed=seed), Game(seed=seed)
+    for _ in range(100):
+        b.rng.shop.random()
+    a.deck.shuffle()
+    b.deck.shuffle()
+    assert [c.to_dict() for c in a.deck.cards] == [c.to_dict() for c in b.deck.cards]
+
+
+def main() -> None:
+    for seed in (1, 2, 12345):
+        check_processes(seed)
+        check_round_trip(seed)
+        check_independence(seed)
+    print("determinism checks passed")
+
+    cards = list(range(52))
+    for name, rng in (("random.Random", random.Random(1)), ("RngStream", RngStream(1))):
+        start = time.perf_counter()
+        for _ in range(20_000):
+            rng.shuffle(cards)
+        per = (time.perf_counter() - start) / 20_000
+        print(f"{name:14} shuffle(52): {per * 1e6:6.2f} us")
+
+    start = time.perf_counter()
+    for _ in range(200):
+        Game.from_dict(run(7))
+    print(f"{'':14} Game(seed) + 40 turns + save/load: "
+          f"{(time.perf_counter() - start) / 200 * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Speed of the alias-table Joker sampler.
+
+Reports picks per second of :func:`balatro.shop.shop.joker_pools`
+against the previous ``random.choices``/``list.index``/``pop``
+implementation.  That its draws follow :data:`RARITY_WEIGHTS` is checked
+by ``tests/test_sampling.py``.
+
+Run from the repository root::
+
+    python benchmarks/bench_sampling.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.jokers import offered_jokers  # noqa: E402
+from balatro.core.rng import RngStream  # noqa: E402
+from balatro.shop.shop import RARITY_WEIGHTS, joker_pools  # noqa: E402
+
+
+def old_weighted_sample(items, k, rng):
+    """The previous implementation, for the speed comparison."""
+
+    temp_items = list(items)
+    weights = [RARITY_WEIGHTS.get(getattr(it, "rarity", "").lower(), 1) for it in temp_items]
+    selected = []
+    for _ in range(min(k, len(temp_items))):
+        choice = rng.choices(temp_items, weights=weights, k=1)[0]
+        idx = temp_items.index(choice)
+        selected.append(choice)
+        temp_items.pop(idx)
+        weights.pop(idx)
+    return selected
+
+
+def rate(fn, seconds: float = 1.0) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(100):
+            fn()
+        count += 100
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = RngStream(1)
+    jokers = offered_jokers()
+    pools = joker_pools()
+    owned = {j.name for j in jokers[:5]}
+    for k in (1, 3):
+        old = rate(lambda: old_weighted_sample(jokers, k, rng))
+        new = rate(lambda: pools.sample(rng, k, owned))
+        print(f"k={k}: {old:10,.0f} samples/s before {new:10,.0f} samples/s with alias tables")
+
+
+if __name__ == "__main__":
+    main()
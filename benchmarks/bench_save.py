@@ -0,0 +1,106 @@
+"""Size and throughput of the JSON and binary save formats.
+
+Drives many games into varied states (Jokers with stickers, enhanced
+cards from Tarot effects, planet levels, vouchers, consumables) and
+reports the mean size of a save and saves/loads per second for both
+formats.  That the states survive both formats is checked by
+``tests/test_save.py``.
+
+Run from the repository root::
+
+    python benchmarks/bench_save.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.tarot_cards import load_tarot_cards  # noqa: E402
+from balatro.core import binary_save  # noqa: E402
+from balatro.core.actions import (  # noqa: E402
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    UseConsumable,
+)
+from balatro.core.best_play import best_plays_for  # noqa: E402
+from balatro.core.game import Game, Phase  # noqa: E402
+
+
+def act(game: Game, rng: random.Random):
+    player = game.player
+    if game.phase is Phase.PLAYING:
+        if player.tarot_cards and rng.random() < 0.3:
+            return UseConsumable("tarot", 0, tuple(range(min(2, len(player.hand)))))
+        if player.discards and rng.random() < 0.3:
+            return DiscardCards(tuple(rng.sample(range(len(player.hand)), 2)))
+        return PlayCards(best_plays_for(game, 1)[0].indices)
+    if game.phase is Phase.SHOP:
+        if game.shop.items and rng.random() < 0.7:
+            return BuyItem(rng.randrange(len(game.shop.items)), rng.random() < 0.3)
+        return LeaveShop()
+    if game.phase is Phase.PACK:
+        return OpenPackChoice(rng.randrange(len(game.pack.options)))
+    return ChooseTargets((0,))
+
+
+def states(count: int = 200) -> list[Game]:
+    games = []
+    for seed in range(count):
+        game = Game(deck_type=("Base", "Red", "Green", "Yellow")[seed % 4], seed=seed)
+        game.money = 200
+        game.ante = seed % 8 + 1
+        game.player.consumable_slots = 6
+        game.player.tarot_cards.extend(load_tarot_cards()[:3])
+        game.draw_hand()
+        rng = random.Random(seed)
+        for _ in range(seed % 40):
+            if game.game_over:
+                break
+            game.step(act(game, rng))
+        games.append(game)
+    return games
+
+
+def rate(fn, items: list, seconds: float = 1.0) -> float:
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for item in items:
+            fn(item)
+        count += len(items)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    games = states()
+
+    as_json = [json.dumps(g.to_dict(), indent=4) for g in games]
+    as_binary = [binary_save.dumps(g) for g in games]
+    for label, saved, save, load in (
+        (
+            "json",
+            as_json,
+            lambda g: json.dumps(g.to_dict(), indent=4),
+            lambda s: Game.from_dict(json.loads(s)),
+        ),
+        ("binary", as_binary, binary_save.dumps, binary_save.loads),
+    ):
+        size = sum(len(s) for s in saved) / len(saved)
+        print(
+            f"{label:7} {size:8,.0f} bytes/save {rate(save, games):10,.0f} saves/s"
+            f" {rate(load, saved):10,.0f} loads/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Cost of scoring with and without a ``ScoreTrace`` attached.
+
+Scores a five-card hand with enhancements, editions and five Jokers,
+first untraced (the headless path) and then with a trace that is
+rendered afterwards.  The untraced path must not allocate anything per
+card, so its net allocation over many calls is checked with
+``tracemalloc``.
+
+Run from the repository root::
+
+    python benchmarks/bench_score_trace.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from balatro.cards.cards import Card, Edition, Enhancement, Rank, Suit  # noqa: E402
+from balatro.cards.jokers import load_jokers  # noqa: E402
+from balatro.core.joker_pipeline import JokerPipeline  # noqa: E402
+from balatro.core.poker import PokerHand  # noqa: E402
+from balatro.core.score_trace import ScoreTrace  # noqa: E402
+from balatro.core.scoring import score_hand  # noqa: E402
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    cards = [Card(Suit.HEARTS, rank) for rank in list(Rank)[:5]]
+    for card in cards:
+        card.enhancement = Enhancement.MULT
+        card.edition = Edition.FOIL
+    pipeline = JokerPipeline(load_jokers()[:5])
+    bonuses: dict[str, dict[str, int]] = {}
+
+    def untraced():
+        score_hand(PokerHand.FLUSH, cards, pipeline, bonuses)
+
+    def traced():
+        trace = ScoreTrace()
+        score_hand(PokerHand.FLUSH, cards, pipeline, bonuses, trace)
+        trace.render()
+
+    untraced()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(10_000):
+        untraced()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"untraced net allocation over 10,000 hands: {after - before} bytes")
+
+    repeat = 50_000
+    print(f"untraced:          {timed(untraced, repeat) * 1e6:6.2f} us/hand")
+    print(f"traced + rendered: {timed(traced, repeat) * 1e6:6.2f} us/hand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Startup time with and without the catalog snapshot.
+
+Each measurement runs in a fresh interpreter, with the snapshot in
+:data:`balatro.cards.catalog.SNAPSHOT_FILE` and with it bypassed (every
+catalog parsed from JSON, as before the snapshot existed):
+
+* import to first prompt: from running ``main.py`` to the CLI asking for
+  the first action;
+* import to first shop: importing the engine, dealing a game and
+  stocking its first shop, which is where the catalogs are first read;
+* catalogs: loading all five catalogs in a process that has already
+  imported the engine, as a simulation worker does.
+
+Medians over :data:`RUNS` processes.  Run from the repository root::
+
+    python benchmarks/bench_startup.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RUNS = 15
+
+PRELUDE = f"""
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {str(ROOT)!r})
+if {{bypass}}:
+    from balatro.cards import catalog
+    catalog._read = lambda catalogs: None
+    catalog._write = lambda snapshot: None
+"""
+
+PROMPT = PRELUDE + f"""
+import builtins, runpy
+
+def first_prompt(prompt=""):
+    print(time.perf_counter() - start)
+    raise SystemExit
+
+builtins.input = first_prompt
+sys.argv = ["main.py", "--seed", "1"]
+runpy.run_path({str(ROOT / "main.py")!r}, run_name="__main__")
+"""
+
+SHOP = PRELUDE + """
+from balatro.core.game import Game
+game = Game(seed=1)
+game.draw_hand()
+game.shop.generate_items(game)
+print(time.perf_counter() - start)
+"""
+
+CATALOGS = PRELUDE + """
+import balatro.core.game
+from balatro.cards.catalog import _catalogs
+start = time.perf_counter()
+for catalog in _catalogs().values():
+    len(catalog)
+print(time.perf_counter() - start)
+"""
+
+
+def measure(script: str, bypass: bool) -> float:
+    times = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", script.replace("{bypass}", str(bypass))],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        times.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def main() -> None:
+    sys.path.insert(0, str(ROOT))
+    from balatro.cards.catalog import build_snapshot
+
+    build_snapshot()
+    print(f"{'':24} {'JSON':>9} {'snapshot':>9}")
+    for label, script in (
+        ("import to first prompt", PROMPT),
+        ("import to first shop", SHOP),
+        ("catalogs", CATALOGS),
+    ):
+        parsed = measure(script, True)
+        cached = measure(script, False)
+        print(f"{label:24} {parsed * 1000:7.1f}ms {cached * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,79 @@
-from balatro.cli import BalatroCLI
+import argparse
+from importlib import import_module
+
+# Subcommands: module providing ``add_arguments`` and ``run``, and help.
+# Only the chosen command's module is imported, so playing or asking for
+# help does not load the simulator, the run history or SQLite.
+COMMANDS = {
+    "simulate": ("balatro.simulate", "Simulate runs with a bot policy."),
+    "replay": ("balatro.replay", "Fast-forward a recorded game."),
+    "history": ("balatro.history", "Query the history of simulated runs."),
+    "catalog": ("balatro.cards.catalog", "Prebuild the card catalog snapshot."),
+}
 
 
 def main() -> None:
     """Entry point for running the Balatro CLI."""
-    BalatroCLI().run()
+    parser = argparse.ArgumentParser(description="Play Balatro in the terminal.")
+    parser.add_argument("--seed", help="Seed for a reproducible run.")
+    parser.add_argument("--record", help="Record the seed and every action to this file.")
+    parser.add_argument(
+        "--format",
+        default="json",
+        help="Format of the 'v' save file, json or binary (binary is compact and fast to load).",
+    )
+    parser.add_argument(
+        "--autosave",
+        metavar="PATH",
+        help="Journal every action under this path and resume from it after a crash.",
+    )
+    parser.add_argument(
+        "--fsync-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between autosave fsyncs (0 syncs every action).",
+    )
+    parser.add_argument(
+        "--compact-every",
+        type=int,
+        default=1000,
+        help="Actions between autosave snapshots.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    for name, (_, summary) in COMMANDS.items():
+        commands.add_parser(name, help=summary, add_help=False)
+    args, rest = parser.parse_known_args()
+    if args.command is None:
+        if rest:
+            parser.error(f"unrecognized arguments: {' '.join(rest)}")
+        play(parser, args)
+        return
+    module_name, summary = COMMANDS[args.command]
+    module = import_module(module_name)
+    command = argparse.ArgumentParser(prog=f"{parser.prog} {args.command}", description=summary)
+    if hasattr(module, "add_arguments"):
+        module.add_arguments(command)
+    # The command's own options (and defaults) win over the game's.
+    vars(args).update(vars(command.parse_args(rest)))
+    module.run(args)
+
+
+def play(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from balatro.cli import BalatroCLI
+    from balatro.core.game import SAVE_FORMATS
+
+    if args.format not in SAVE_FORMATS:
+        choices = ", ".join(SAVE_FORMATS)
+        parser.error(f"argument --format: invalid choice: {args.format!r} (choose from {choices})")
+    seed = int(args.seed) if args.seed and args.seed.lstrip("-").isdigit() else args.seed
+    BalatroCLI(
+        seed=seed,
+        record=args.record,
+        save_format=args.format,
+        autosave=args.autosave,
+        fsync_interval=args.fsync_interval,
+        compact_every=args.compact_every,
+    ).run()
 
 
 if __name__ == "__main__":
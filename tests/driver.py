@@ -0,0 +1,89 @@
+"""Random games for the state round-trip tests.
+
+A :class:`Driver` deals a game with money, consumable slots and Tarot
+cards to spend, then plays it with random actions from a seeded
+:class:`random.Random`: consumables and discards on a roll, otherwise the
+best play; random purchases in the shop; random pack choices; the first
+target of a pending choice.  Tests differ in the decks, antes, odds and
+number of steps they drive games with.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from balatro.cards.tarot_cards import load_tarot_cards
+from balatro.core.actions import (
+    BuyItem,
+    ChooseTargets,
+    DiscardCards,
+    LeaveShop,
+    OpenPackChoice,
+    PlayCards,
+    UseConsumable,
+)
+from balatro.core.best_play import best_plays_for
+from balatro.core.game import Game, Phase
+
+
+@dataclass(frozen=True)
+class Driver:
+    """How a test deals and plays its games."""
+
+    # Seed ``s`` plays ``decks[s % len(decks)]`` from ante ``s % antes + 1``
+    # for ``s % steps`` actions.
+    decks: tuple[str, ...] = ("Base",)
+    antes: int = 1
+    steps: int = 25
+    tarots: int = 4
+    # Chance of each action while playing a hand; the rest plays the best hand.
+    tarot: float = 0.2
+    spectral: float = 0.1
+    discard: float = 0.2
+    # Chance of using a bought consumable at once.
+    use: float = 0.5
+    # Whether pack choices keep the card instead of using it.
+    keep: bool = True
+
+    def start(self, seed: int) -> Game:
+        game = Game(deck_type=self.decks[seed % len(self.decks)], seed=seed)
+        game.money = 200
+        game.ante = seed % self.antes + 1
+        game.player.consumable_slots = 6
+        game.player.tarot_cards.extend(load_tarot_cards()[: self.tarots])
+        game.draw_hand()
+        return game
+
+    def act(self, game: Game, rng: random.Random):
+        player = game.player
+        if game.phase is Phase.PLAYING:
+            # A roll whose action is unavailable falls through to the next.
+            roll = rng.random()
+            if roll < self.tarot and player.tarot_cards:
+                return UseConsumable("tarot", 0, tuple(range(min(2, len(player.hand)))))
+            roll -= self.tarot
+            if self.spectral and roll < self.spectral and player.spectral_cards:
+                return UseConsumable("spectral", 0)
+            roll -= self.spectral
+            if roll < self.discard and player.discards:
+                return DiscardCards(tuple(rng.sample(range(len(player.hand)), 2)))
+            return PlayCards(best_plays_for(game, 1)[0].indices)
+        if game.phase is Phase.SHOP:
+            if game.shop.items and rng.random() < 0.7:
+                return BuyItem(rng.randrange(len(game.shop.items)), rng.random() < self.use)
+            return LeaveShop()
+        if game.phase is Phase.PACK:
+            return OpenPackChoice(rng.randrange(len(game.pack.options)), self.keep)
+        return ChooseTargets((0,))
+
+    def advance(self, game: Game, rng: random.Random, steps: int) -> None:
+        for _ in range(steps):
+            if game.game_over:
+                return
+            game.step(self.act(game, rng))
+
+    def played(self, seed: int) -> Game:
+        game = self.start(seed)
+        self.advance(game, random.Random(seed), seed % self.steps)
+        return game
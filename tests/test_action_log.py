@@ -0,0 +1,56 @@
+"""Action logs on disk: round trips, and logs the engine must refuse.
+
+A recorded game replays from its saved log to the same state.  A log
+written by an older format version, or against different catalogs, would
+replay to a different game and is refused by :meth:`ActionLog.load`.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from balatro.core.action_log import FORMAT_VERSION, ActionLog
+
+from .driver import Driver
+
+DRIVER = Driver()
+
+
+def recorded(seed: int, path) -> ActionLog:
+    log = ActionLog(seed, DRIVER.decks[0])
+    game = log.new_game()
+    log.attach(game)
+    DRIVER.advance(game, random.Random(seed), 30)
+    log.save(str(path))
+    assert log.replay().to_dict() == game.to_dict(), "replay diverged in memory"
+    return log
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_round_trip(seed, tmp_path):
+    path = tmp_path / "game.log"
+    log = recorded(seed, path)
+    loaded = ActionLog.load(str(path))
+    assert loaded.actions == log.actions
+    assert loaded.replay().to_dict() == log.replay().to_dict()
+
+
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        ({"version": FORMAT_VERSION - 1}, "older game rules"),
+        ({"version": FORMAT_VERSION + 1}, "newer action log version"),
+        ({"catalogs": 0}, "different card catalog"),
+        ({"format": "something else"}, "not an action log"),
+    ],
+)
+def test_mismatched_header_is_refused(change, message, tmp_path):
+    path = tmp_path / "game.log"
+    recorded(0, path)
+    header, *actions = path.read_text().splitlines()
+    path.write_text("\n".join([json.dumps({**json.loads(header), **change}), *actions]))
+    with pytest.raises(ValueError, match=message):
+        ActionLog.load(str(path))
@@ -0,0 +1,31 @@
+"""Round trip of the catalog snapshot.
+
+Definitions read back from the marshal snapshot must have the same class
+and attributes as the ones parsed from JSON, and a snapshot that no longer
+matches its sources must be rejected.
+"""
+
+from __future__ import annotations
+
+from balatro.cards import catalog
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "SNAPSHOT_FILE", tmp_path / "catalog.marshal")
+    built = catalog.build_snapshot()
+    read = catalog._read(catalog._catalogs())
+    assert read is not None, "fresh snapshot rejected"
+    assert set(read) == set(built)
+    for name, items in built.items():
+        assert [type(item) for item in read[name]] == [type(item) for item in items]
+        assert [vars(item) for item in read[name]] == [vars(item) for item in items], name
+
+
+def test_stale_snapshot_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "SNAPSHOT_FILE", tmp_path / "catalog.marshal")
+    monkeypatch.setattr(catalog, "SNAPSHOT_VERSION", catalog.SNAPSHOT_VERSION - 1)
+    catalog.build_snapshot()
+    monkeypatch.setattr(catalog, "SNAPSHOT_VERSION", catalog.SNAPSHOT_VERSION + 1)
+    assert catalog._read(catalog._catalogs()) is None
+    (tmp_path / "catalog.marshal").write_bytes(b"truncated")
+    assert catalog._read(catalog._catalogs()) is None
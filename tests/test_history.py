@@ -0,0 +1,47 @@
+"""The run history database: recording, and querying without writing.
+
+Querying opens the database read-only, so a mistyped path is an error
+rather than a new empty database.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from balatro.history import QUERIES, RunHistory, main
+from balatro.simulate import play_game
+
+
+@pytest.fixture(scope="module")
+def results():
+    return [play_game(i, max_ante=2) for i in range(4)]
+
+
+def test_recorded_runs_can_be_queried(results, tmp_path):
+    path = str(tmp_path / "runs.db")
+    with RunHistory(path, batch_size=3) as history:
+        history.extend(results, "Base", "greedy")
+    with RunHistory(path, read_only=True) as history:
+        assert len(history) == len(results)
+        for name in QUERIES:
+            columns, rows = history.query(name)
+            assert columns and rows, name
+        _, rows = history.runs_for_seed(results[0].seed)
+        assert len(rows) == 1
+
+
+def test_read_only_history_refuses_writes(tmp_path):
+    path = str(tmp_path / "runs.db")
+    RunHistory(path).close()
+    with RunHistory(path, read_only=True) as history:
+        with pytest.raises(sqlite3.OperationalError):
+            history.connection.execute("DELETE FROM runs")
+
+
+def test_query_of_missing_database_creates_nothing(tmp_path):
+    path = tmp_path / "typo.db"
+    with pytest.raises(SystemExit, match="Cannot read run history"):
+        main([str(path)])
+    assert not path.exists()
@@ -0,0 +1,209 @@
+"""Coverage and behaviour of the compiled Joker effects.
+
+Every Joker in ``data/jokers.json`` must be accounted for by
+:mod:`balatro.core.joker_effects` (compiled into hooks, acting through its
+growth rules or rule changes, applied by the engine, or listed as not
+modelled), and each hooked Joker must compile to at least one hook.  Then a
+handful of effects end to end: suit and hand conditions, retriggers, copies,
+lineup order on one card, end-of-round payouts, rule changes, and Jokers
+that keep state in ``counter`` and ``target`` across hands and saves.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from balatro.cards.cards import Card, Rank, Suit
+from balatro.cards.jokers import JOKERS, load_jokers, offered_jokers
+from balatro.core import binary_save
+from balatro.core.game import Game
+from balatro.core.joker_effects import (
+    BLIND_SELECTED,
+    CONDITIONS,
+    ENGINE_RULES,
+    GROWTH,
+    NOT_MODELLED,
+    RULES,
+    ScoreContext,
+    advance,
+    compile_joker,
+)
+from balatro.core.joker_pipeline import JokerPipeline
+from balatro.core.poker import PokerHand, evaluate_hand
+from balatro.core.scoring import score_hand
+
+PAIR = [Card(Suit.DIAMONDS, Rank.SEVEN), Card(Suit.SPADES, Rank.SEVEN)]
+
+
+def joker(name):
+    return JOKERS.new(name)
+
+
+def score(jokers, hand_type, cards, held=()) -> tuple[float, float]:
+    chips, mult, _ = score_hand(hand_type, cards, jokers, {}, held=held)
+    return chips, mult
+
+
+BASE = score([], PokerHand.PAIR, PAIR)
+
+
+def test_every_joker_is_accounted_for():
+    names = {j.name for j in load_jokers()}
+    assert len(names) == 150, f"expected 150 Jokers, found {len(names)}"
+    rules = set(RULES)
+    for label, listed in (
+        ("CONDITIONS", set(CONDITIONS)),
+        ("ENGINE_RULES", ENGINE_RULES),
+        ("GROWTH", set(GROWTH)),
+        ("NOT_MODELLED", NOT_MODELLED),
+        ("RULES", rules),
+    ):
+        assert listed <= names, f"{label} names unknown Jokers: {sorted(listed - names)}"
+    assert not ENGINE_RULES & NOT_MODELLED
+    assert not rules & (ENGINE_RULES | NOT_MODELLED)
+    assert not set(GROWTH) & NOT_MODELLED
+    assert not set(CONDITIONS) & (ENGINE_RULES | NOT_MODELLED | rules)
+
+
+def test_hooked_jokers_compile_to_hooks():
+    catalog = load_jokers()
+    uncommon = next(j for j in catalog if j.rarity.lower() == "uncommon")
+    events_only = set(GROWTH) - set(CONDITIONS) - set(RULES) - ENGINE_RULES
+    skipped = ENGINE_RULES | NOT_MODELLED | set(RULES) | events_only
+
+    def fires(j) -> bool:
+        # Growing Jokers may only fire once they have grown: something Loyalty
+        # Card (every 6 hands) and Yorick (every 23 discards) both pay for.
+        for counter in (0, 6 * 23):
+            j.counter = counter
+            if compile_joker(j, [j, uncommon]):
+                return True
+        return False
+
+    silent = [j.name for j in catalog if j.name not in skipped and not fires(j)]
+    assert not silent, f"Jokers compiling to no hooks: {silent}"
+
+
+def test_shops_never_offer_unmodelled_jokers():
+    assert not {j.name for j in offered_jokers()} & NOT_MODELLED
+
+
+def test_suit_condition():
+    greedy = score([joker("Greedy Joker")], PokerHand.PAIR, PAIR)
+    assert greedy == (BASE[0], BASE[1] + 3), "Greedy Joker on one Diamond"
+    spades = [Card(Suit.SPADES, Rank.SEVEN), Card(Suit.CLUBS, Rank.SEVEN)]
+    assert score([joker("Greedy Joker")], PokerHand.PAIR, spades) == BASE
+
+
+def test_contained_hand_condition():
+    full_house = [Card(suit, Rank.SEVEN) for suit in list(Suit)[:3]] + [
+        Card(suit, Rank.TWO) for suit in list(Suit)[:2]
+    ]
+    hand_type, _ = evaluate_hand(full_house)
+    plain = score([], hand_type, full_house)
+    jolly = score([joker("Jolly Joker")], hand_type, full_house)
+    assert jolly == (plain[0], plain[1] + 8), "Jolly Joker on a Full House"
+
+
+def test_held_cards_and_retriggers():
+    kings = [Card(Suit.HEARTS, Rank.KING), Card(Suit.CLUBS, Rank.KING)]
+    baron = score([joker("Baron")], PokerHand.PAIR, PAIR, kings)
+    assert baron == (BASE[0], BASE[1] * 1.5**2), "Baron with two Kings held"
+    mime = score([joker("Baron"), joker("Mime")], PokerHand.PAIR, PAIR, kings)
+    assert mime == (BASE[0], BASE[1] * 1.5**4), "Baron and Mime"
+
+    twos = [Card(Suit.DIAMONDS, Rank.TWO), Card(Suit.SPADES, Rank.TWO)]
+    low = score([], PokerHand.PAIR, twos)
+    assert score([joker("Hack")], PokerHand.PAIR, twos) == (low[0] + 4, low[1])
+
+
+def test_blueprint_copies_its_neighbour():
+    copied = score([joker("Blueprint"), joker("Greedy Joker")], PokerHand.PAIR, PAIR)
+    assert copied == (BASE[0], BASE[1] + 6)
+    pipeline = JokerPipeline([joker("Greedy Joker"), joker("Blueprint")])
+    assert len(pipeline.hooks) == 1, "Blueprint with nothing to its right copied a Joker"
+
+
+@pytest.mark.parametrize(
+    "lineup, expected",
+    [
+        (("Photograph", "Greedy Joker"), lambda mult: mult * 2 + 3),
+        (("Greedy Joker", "Photograph"), lambda mult: (mult + 3) * 2),
+    ],
+)
+def test_scored_card_lineup_order(lineup, expected):
+    king = [Card(Suit.DIAMONDS, Rank.KING)]
+    high = score([], PokerHand.HIGH_CARD, king)
+    mult = score([joker(name) for name in lineup], PokerHand.HIGH_CARD, king)[1]
+    assert mult == expected(high[1])
+
+
+@pytest.mark.parametrize(
+    "lineup, expected",
+    [
+        (("Raised Fist", "Baron"), lambda mult, fist: (mult + fist) * 1.5),
+        (("Baron", "Raised Fist"), lambda mult, fist: mult * 1.5 + fist),
+    ],
+)
+def test_held_card_lineup_order(lineup, expected):
+    held = [Card(Suit.CLUBS, Rank.KING)]
+    mult = score([joker(name) for name in lineup], PokerHand.PAIR, PAIR, held)[1]
+    assert mult == expected(BASE[1], 2 * held[0].chip_value)
+
+
+def test_end_of_round_payout():
+    game = Game(seed=1)
+    game.player.jokers.append(joker("Golden Joker"))
+    assert game.player.joker_pipeline.end_of_round(ScoreContext(game)) == [("Golden Joker", 4)]
+    money = game.player.money
+    game.player.hands = 0
+    game.end_of_round_winnings()
+    assert game.player.money >= money + 14, "Golden Joker did not pay at the end of the round"
+
+
+def test_rule_changes():
+    game = Game(seed=1)
+    size = game.player.hand_size
+    game.player.jokers.extend([joker("Juggler"), joker("Merry Andy")])
+    assert game.player.hand_size == size, "Juggler and Merry Andy should cancel out"
+    rules = game.player.joker_pipeline.rules
+    assert (rules.discards, rules.debt) == (3, 0)
+    game.player.jokers.append(joker("Credit Card"))
+    assert game.player.joker_pipeline.rules.debt == 20
+
+
+def test_growth_counters():
+    game = Game(seed=1)
+    game.player.jokers.extend([joker("Green Joker"), joker("Card Sharp")])
+    game.player.hand = [Card(Suit.CLUBS, Rank.TWO), Card(Suit.HEARTS, Rank.NINE)] * 3
+    green, _ = game.player.jokers
+    for expected in (1, 2):
+        before = game.player.score
+        game.play_hand(game.player.hand[:1])
+        assert green.counter == expected, f"Green Joker after {expected} hands"
+    # High card: 5 chips and 1 + 2 mult (Green) for one Two, X3 from Card Sharp.
+    assert game.player.score - before == (5 + 2) * 3 * 3, "Card Sharp on a repeated hand"
+    game.discard_cards([0])
+    assert green.counter == 1, "Green Joker did not lose mult on a discard"
+
+
+def test_state_survives_saves():
+    game = Game(seed=1)
+    game.player.jokers.extend(
+        [joker("Green Joker"), joker("Card Sharp"), joker("Ancient Joker"), joker("The Idol")]
+    )
+    game.player.hand = [Card(Suit.CLUBS, Rank.TWO), Card(Suit.HEARTS, Rank.NINE)] * 3
+    game.play_hand(game.player.hand[:1])
+    for _ in range(4):
+        advance(game, BLIND_SELECTED, boss=False)
+        if any(j.target for j in game.player.jokers):
+            break
+    state = [(j.counter, j.target) for j in game.player.jokers]
+    assert any(target for _, target in state), "no Joker picked a target"
+    for loaded in (
+        Game.from_dict(json.loads(json.dumps(game.to_dict()))),
+        binary_save.loads(binary_save.dumps(game)),
+    ):
+        assert [(j.counter, j.target) for j in loaded.player.jokers] == state
@@ -0,0 +1,93 @@
+"""Hand evaluation in :mod:`balatro.core.poker`.
+
+The table-driven evaluator must agree with the Counter-based evaluator it
+replaced (kept in ``benchmarks/bench_poker.py`` as the speed reference) on
+random five-card hands, uncached and through :class:`HandCache`.  Four
+Fingers and Shortcut change which cards make Flushes and Straights.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from balatro.cards.cards import Card, Rank, Suit
+from balatro.core.poker import HandCache, HandRules, PokerHand, evaluate_hand
+from benchmarks.bench_poker import legacy_evaluate_hand, random_hands
+
+FOUR_FINGERS = HandRules(four_fingers=True)
+SHORTCUT = HandRules(shortcut=True)
+
+
+def cards(*specs: tuple[Suit, Rank]) -> list[Card]:
+    return [Card(suit, rank) for suit, rank in specs]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_legacy_evaluator(seed):
+    cache = HandCache()
+    for hand in random_hands(5_000, 5, seed=seed):
+        old_type, old_used = legacy_evaluate_hand(hand)
+        for evaluate in (evaluate_hand, cache.evaluate):
+            new_type, new_used = evaluate(hand)
+            assert new_type == old_type, (hand, new_type, old_type)
+            assert set(map(id, new_used)) == set(map(id, old_used)), hand
+
+
+def test_duplicated_cards():
+    rng = random.Random(3)
+    for rank in Rank:
+        hand = [Card(rng.choice(list(Suit)), rank) for _ in range(5)]
+        assert evaluate_hand(hand) == (PokerHand.FIVE_OF_A_KIND, hand)
+
+
+def test_four_fingers():
+    flush = cards(
+        (Suit.HEARTS, Rank.TWO),
+        (Suit.HEARTS, Rank.SEVEN),
+        (Suit.HEARTS, Rank.NINE),
+        (Suit.HEARTS, Rank.KING),
+        (Suit.SPADES, Rank.FOUR),
+    )
+    assert evaluate_hand(flush)[0] is PokerHand.HIGH_CARD
+    hand_type, used = evaluate_hand(flush, FOUR_FINGERS)
+    assert (hand_type, used) == (PokerHand.FLUSH, flush[:4])
+
+    straight = cards(
+        (Suit.HEARTS, Rank.FIVE),
+        (Suit.CLUBS, Rank.SIX),
+        (Suit.SPADES, Rank.SEVEN),
+        (Suit.DIAMONDS, Rank.EIGHT),
+        (Suit.CLUBS, Rank.KING),
+    )
+    assert evaluate_hand(straight)[0] is PokerHand.HIGH_CARD
+    assert evaluate_hand(straight, FOUR_FINGERS) == (PokerHand.STRAIGHT, straight[:4])
+    assert evaluate_hand(straight[:4], FOUR_FINGERS) == (PokerHand.STRAIGHT, straight[:4])
+
+
+def test_shortcut():
+    gapped = cards(
+        (Suit.HEARTS, Rank.TWO),
+        (Suit.CLUBS, Rank.FOUR),
+        (Suit.SPADES, Rank.SIX),
+        (Suit.DIAMONDS, Rank.SEVEN),
+        (Suit.CLUBS, Rank.NINE),
+    )
+    assert evaluate_hand(gapped)[0] is PokerHand.HIGH_CARD
+    assert evaluate_hand(gapped, SHORTCUT) == (PokerHand.STRAIGHT, gapped)
+
+
+def test_cache_follows_rules():
+    cache = HandCache()
+    hand = cards(
+        (Suit.HEARTS, Rank.TWO),
+        (Suit.HEARTS, Rank.SEVEN),
+        (Suit.HEARTS, Rank.NINE),
+        (Suit.HEARTS, Rank.KING),
+    )
+    assert cache.evaluate(hand)[0] is PokerHand.HIGH_CARD
+    cache.rules = FOUR_FINGERS
+    assert cache.evaluate(hand)[0] is PokerHand.FLUSH
+    cache.rules = HandRules()
+    assert cache.evaluate(hand)[0] is PokerHand.HIGH_CARD
@@ -0,0 +1,44 @@
+"""Cross-check of :mod:`balatro.core.poker_batch` against ``evaluate_hand``.
+
+Randomized hands of 0-5 cards are drawn with replacement, half of them
+from a deck of four ranks, so duplicated cards (Five of a Kind,
+same-suit pairs) are covered too.  Skipped when NumPy is not installed.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from balatro.cards.cards import Card, Rank, Suit  # noqa: E402
+from balatro.core.poker import evaluate_hand  # noqa: E402
+from balatro.core.poker_batch import (  # noqa: E402
+    HAND_ORDINALS,
+    NO_HAND,
+    encode_hands,
+    evaluate_hands,
+)
+
+HANDS = 50_000
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_batch_matches_evaluate_hand(seed):
+    rng = random.Random(seed)
+    deck = [Card(suit, rank) for suit in Suit for rank in Rank]
+    small = [Card(suit, rank) for suit in Suit for rank in list(Rank)[:4]]
+    hands = [
+        rng.choices(small if rng.random() < 0.5 else deck, k=rng.randint(0, 5))
+        for _ in range(HANDS)
+    ]
+
+    ranks, suits, mask = encode_hands(hands)
+    ordinals, used = evaluate_hands(ranks, suits, mask)
+    for i, cards in enumerate(hands):
+        hand_type, used_cards = evaluate_hand(cards)
+        expected = NO_HAND if hand_type is None else HAND_ORDINALS[hand_type]
+        assert ordinals[i] == expected, (cards, ordinals[i], hand_type)
+        assert [c for j, c in enumerate(cards) if used[i, j]] == used_cards, cards
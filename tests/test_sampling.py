@@ -0,0 +1,115 @@
+"""Statistical checks of the alias-table Joker sampler.
+
+Draws many times, from fixed seeds, from :func:`balatro.shop.shop.joker_pools`
+and compares the observed frequencies with :data:`RARITY_WEIGHTS` using
+Pearson's chi-square test at a 0.1% significance level:
+
+* an :class:`AliasTable` over arbitrary weights;
+* the rarity of single draws (each Joker weighs its rarity's weight, so a
+  rarity's share is its weight times its pool size);
+* every individual Joker;
+* the first and second Joker of draws without replacement that exclude
+  owned Jokers, against the exact sequential probabilities.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+
+from balatro.cards.jokers import offered_jokers
+from balatro.core.rng import RngStream
+from balatro.shop.sampling import AliasTable
+from balatro.shop.shop import RARITY_WEIGHTS, joker_pools
+
+DRAWS = 300_000
+# Standard normal quantile for p = 0.001, one-sided.
+Z = 3.0902
+
+
+def critical(df: int) -> float:
+    """Chi-square critical value (Wilson-Hilferty approximation)."""
+
+    a = 2 / (9 * df)
+    return df * (1 - a + Z * math.sqrt(a)) ** 3
+
+
+def assert_fits(counts: Counter, expected: dict) -> None:
+    total = sum(counts.values())
+    assert set(counts) <= set(expected), "unexpected outcomes"
+    stat = sum((counts[key] - total * p) ** 2 / (total * p) for key, p in expected.items())
+    df = len(expected) - 1
+    assert stat < critical(df), f"chi-square {stat:.1f} >= {critical(df):.1f} ({df} df)"
+
+
+def weight(joker) -> float:
+    return RARITY_WEIGHTS.get((joker.rarity or "").lower(), 1)
+
+
+def exact_picks(excluded: set[str]) -> tuple[dict, dict]:
+    """Exact chance of each rarity as first and as second pick."""
+
+    jokers = [j for j in offered_jokers() if j.name not in excluded]
+    total = sum(weight(j) for j in jokers)
+    first: Counter = Counter()
+    second: Counter = Counter()
+    for a in jokers:
+        pa = weight(a) / total
+        first[a.rarity.lower()] += pa
+        rest = total - weight(a)
+        for b in jokers:
+            if b is not a:
+                second[b.rarity.lower()] += pa * weight(b) / rest
+    return dict(first), dict(second)
+
+
+def test_alias_table():
+    rng = RngStream(7)
+    weights = [1, 5, 0.5, 12, 3, 0, 7, 2.5]
+    table = AliasTable(weights)
+    counts = Counter(table.draw(rng) for _ in range(DRAWS))
+    total = sum(weights)
+    assert_fits(counts, {i: w / total for i, w in enumerate(weights) if w})
+
+
+def test_single_draws():
+    rng = RngStream(8)
+    pools = joker_pools()
+    draws = [pools.draw(rng) for _ in range(DRAWS)]
+    assert_fits(Counter(j.rarity.lower() for j in draws), pools.probabilities())
+    total = sum(weight(j) for j in offered_jokers())
+    assert_fits(
+        Counter(j.name for j in draws),
+        {j.name: weight(j) / total for j in offered_jokers()},
+    )
+
+
+def test_draws_without_replacement():
+    rng = RngStream(9)
+    pools = joker_pools()
+    commons = [j.name for j in offered_jokers() if j.rarity.lower() == "common"]
+    rares = [j.name for j in offered_jokers() if j.rarity.lower() == "rare"]
+    owned = set(commons[:4] + rares[:1])
+    first: Counter = Counter()
+    second: Counter = Counter()
+    for _ in range(DRAWS // 3):
+        picks = pools.sample(rng, 3, owned)
+        names = [j.name for j in picks]
+        assert len(set(names)) == 3, "sampled a Joker twice"
+        assert not owned & set(names), "sampled an owned Joker"
+        first[picks[0].rarity.lower()] += 1
+        second[picks[1].rarity.lower()] += 1
+    expected_first, expected_second = exact_picks(owned)
+    assert_fits(first, expected_first)
+    assert_fits(second, expected_second)
+
+
+def test_exclusion_fallback():
+    rng = RngStream(10)
+    pools = joker_pools()
+    left = {j.name for j in offered_jokers()[:4]}
+    everything_else = {j.name for j in offered_jokers()} - left
+    for _ in range(200):
+        names = {j.name for j in pools.sample(rng, 3, everything_else)}
+        assert len(names) == 3 and names <= left, "fallback sampled an excluded Joker"
+    assert pools.sample(rng, 3, everything_else | left) == []